@@ -1,5 +1,6 @@
 """Login endpoint to verify user credentials.
-    This endpoint checks the provided email and password against the database.
+    This endpoint checks the provided email and password against the hash stored in the
+    database. Rows still holding a plaintext password are rehashed on a successful login.
 
     Raises:
         HTTPException: If the credentials are invalid or if there is a database error.
@@ -14,7 +15,8 @@ import mysql.connector
 
 from app.schemas.common import APIResponse
 from app.schemas.login import LoginRequest, LoginResponseData
-from app.utils.auth import create_access_token
+from app.utils.auth import create_access_token, create_refresh_token
+from app.utils.passwords import verify_password
 from app.dependencies import get_db
 
 router = APIRouter()
@@ -25,30 +27,41 @@ router = APIRouter()
     tags=["Autenticación"],
     response_model=APIResponse[LoginResponseData]
 )
-def post_login_endpoint(request: LoginRequest, db=Depends(get_db)):
+async def post_login_endpoint(request: LoginRequest, db=Depends(get_db)):
     """
     Login endpoint to verify user credentials.
     """
 
     try:
-        cursor = db.cursor()
-        query = "SELECT * FROM login WHERE correo = %s AND contraseña = %s"
-        cursor.execute(query, (request.correo, request.contraseña))
+        cursor = await db.cursor(dictionary=True)
+        query = "SELECT correo, contraseña, es_administrador FROM login WHERE correo = %s"
+        await cursor.execute(query, (request.correo,))
 
-        user = cursor.fetchone()
-        if not user:
+        user = await cursor.fetchone()
+        valid, new_hash = await verify_password(
+            user["contraseña"] if user else None,
+            request.contraseña
+        )
+        if not valid:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid credentials"
             )
 
-        access_token = create_access_token(
-            data={"id": user[0], "email": user[1], "is_admin": user[2]},
-            expires_delta=None
-        )
+        if new_hash:
+            query = "UPDATE login SET contraseña = %s WHERE correo = %s AND contraseña = %s"
+            await cursor.execute(query, (new_hash, user["correo"], user["contraseña"]))
+            await db.commit()
+
+        claims = {
+            "id": user["correo"],
+            "email": user["correo"],
+            "is_admin": user["es_administrador"]
+        }
         access_token_data = {
-            "access_token": access_token,
-            "is_admin": user[2]
+            "access_token": create_access_token(data=claims, expires_delta=None),
+            "refresh_token": create_refresh_token(data=claims),
+            "is_admin": user["es_administrador"]
         }
 
         return APIResponse(
@@ -61,5 +74,5 @@ def post_login_endpoint(request: LoginRequest, db=Depends(get_db)):
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
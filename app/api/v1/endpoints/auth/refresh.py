@@ -0,0 +1,81 @@
+"""Refresh endpoints to renew and revoke sessions.
+    A refresh token issued by the login endpoint is exchanged for a new access token and
+    a new refresh token without querying the database. Refresh tokens rotate: each one
+    is accepted once and then recorded in the denylist until it expires. The claims
+    (including is_admin) are carried over from the token, so role changes apply on the
+    next login.
+
+    Raises:
+        HTTPException: If the refresh token is invalid, expired, already used or revoked.
+
+    Returns:
+        APIResponse[LoginResponseData]: A response containing the new token pair and isAdmin bool.
+"""
+
+from fastapi import APIRouter, HTTPException, status
+
+from app.schemas.common import APIResponse, MessageResponse
+from app.schemas.login import LoginResponseData, RefreshRequest
+from app.utils.auth import create_access_token, create_refresh_token, decode_refresh_token
+from app.utils.token_denylist import revoke_token
+
+router = APIRouter()
+
+SESSION_CLAIMS = ("id", "email", "is_admin")
+
+async def _consume_refresh_token(token: str) -> dict:
+    try:
+        payload = decode_refresh_token(token)
+    except ValueError as err:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        ) from err
+
+    if not await revoke_token(payload):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Refresh token has already been used or revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return payload
+
+@router.post(
+    "/",
+    summary="Refresh Session",
+    tags=["Autenticación"],
+    response_model=APIResponse[LoginResponseData]
+)
+async def post_refresh_endpoint(request: RefreshRequest):
+    """
+    Endpoint to exchange a refresh token for a new access and refresh token pair.
+    """
+    payload = await _consume_refresh_token(request.refresh_token)
+    claims = {claim: payload[claim] for claim in SESSION_CLAIMS if claim in payload}
+
+    return APIResponse(
+        success=True,
+        data=LoginResponseData(
+            access_token=create_access_token(data=claims, expires_delta=None),
+            refresh_token=create_refresh_token(data=claims),
+            is_admin=claims.get("is_admin", False)
+        )
+    )
+
+@router.post(
+    "/revoke",
+    summary="Revoke Session",
+    tags=["Autenticación"],
+    response_model=APIResponse[MessageResponse]
+)
+async def post_revoke_endpoint(request: RefreshRequest):
+    """
+    Endpoint to revoke a refresh token, ending the session once its access token expires.
+    """
+    await _consume_refresh_token(request.refresh_token)
+
+    return APIResponse(
+        success=True,
+        data=MessageResponse(message="Session revoked successfully")
+    )
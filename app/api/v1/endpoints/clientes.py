@@ -12,15 +12,29 @@
         APIResponse: A response containing the requested cliente data or a success message.
 """
 
-import math
+from typing import Optional
+
 import mysql.connector
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.schemas.common import APIResponse, MessageResponse, APIResponsePaginated
 from app.schemas.cliente import ClienteBase, ClienteCreate
+from app.utils.cache_backend import shared_cache
+from app.utils.conditional import conditional_get
+from app.utils.pagination import (
+    build_page_query,
+    count_rows,
+    invalidate_count,
+    next_cursor,
+    page_count,
+    PageRequest,
+    page_request
+)
+from app.utils.serialization import envelope_response, render_item, render_page
 from app.dependencies import get_db
 
 router = APIRouter()
+cache = shared_cache("clientes")
 
 @router.get(
     "/",
@@ -28,54 +42,62 @@ router = APIRouter()
     tags=["Clientes"],
     response_model=APIResponsePaginated[ClienteBase]
 )
-def get_clientes_endpoint(
-    page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(10, ge=1, le=100, description="Items per page"),
+async def get_clientes_endpoint(
+    paging: PageRequest = Depends(page_request("clientes")),
     db=Depends(get_db)
 ):
     """
     Endpoint to retrieve all clientes.
     """
+    cache_key = ("list", paging.page, paging.page_size, paging.after, paging.count)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return envelope_response(cached, paging.etag)
+
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
 
-        count_query = "SELECT COUNT(*) as total FROM clientes"
-        cursor.execute(count_query)
-        total_items = cursor.fetchone()['total']
+        total_items = await count_rows(cursor, "clientes", paging.count)
 
-        offset = (page - 1) * page_size
-        query = "SELECT * FROM clientes LIMIT %s OFFSET %s"
-        cursor.execute(query, (page_size, offset))
+        query, params = build_page_query(
+            "SELECT * FROM clientes", "id", paging.page, paging.page_size, paging.after
+        )
+        await cursor.execute(query, params)
 
-        clientes = cursor.fetchall()
-        total_pages = math.ceil(total_items / page_size) if total_items > 0 else 1
+        clientes = await cursor.fetchall()
+        total_pages = page_count(total_items, paging.page_size)
 
         if not clientes:
-            return APIResponsePaginated(
-                success=True,
-                data=[],
+            rendered = render_page(
+                ClienteBase,
+                [],
                 total_items=total_items,
-                page=page,
-                page_size=page_size,
+                page=paging.page,
+                page_size=paging.page_size,
                 total_pages=total_pages
             )
+            await cache.set(cache_key, rendered)
+            return envelope_response(rendered, paging.etag)
 
-        return APIResponsePaginated(
-            success=True,
-            data=[ClienteBase(**cliente) for cliente in clientes],
+        rendered = render_page(
+            ClienteBase,
+            clientes,
             total_items=total_items,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages
+            page=paging.page,
+            page_size=paging.page_size,
+            total_pages=total_pages,
+            next_cursor=next_cursor(clientes, "id", paging.page_size)
         )
+        await cache.set(cache_key, rendered)
+        return envelope_response(rendered, paging.etag)
     except mysql.connector.Error as err:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.get(
     "/{cliente_id}",
@@ -83,15 +105,24 @@ def get_clientes_endpoint(
     tags=["Clientes"],
     response_model=APIResponse[ClienteBase]
 )
-def get_cliente_by_id_endpoint(cliente_id: int, db=Depends(get_db)):
+async def get_cliente_by_id_endpoint(
+    cliente_id: int,
+    etag: Optional[str] = Depends(conditional_get("clientes")),
+    db=Depends(get_db)
+):
     """
     Endpoint to retrieve a cliente by its ID.
     """
+    cache_key = ("id", cliente_id)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return envelope_response(cached, etag)
+
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
         query = "SELECT * FROM clientes WHERE id = %s"
-        cursor.execute(query, (cliente_id,))
-        cliente = cursor.fetchone()
+        await cursor.execute(query, (cliente_id,))
+        cliente = await cursor.fetchone()
 
         if not cliente:
             raise HTTPException(
@@ -99,18 +130,17 @@ def get_cliente_by_id_endpoint(cliente_id: int, db=Depends(get_db)):
                 detail="Cliente not found"
             )
 
-        return APIResponse(
-            success=True,
-            data=ClienteBase(**cliente)
-        )
+        rendered = render_item(ClienteBase, cliente)
+        await cache.set(cache_key, rendered)
+        return envelope_response(rendered, etag)
     except mysql.connector.Error as err:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.post(
     "/",
@@ -118,17 +148,17 @@ def get_cliente_by_id_endpoint(cliente_id: int, db=Depends(get_db)):
     tags=["Clientes"],
     response_model=APIResponse[ClienteBase]
 )
-def create_cliente_endpoint(cliente: ClienteCreate, db=Depends(get_db)):
+async def create_cliente_endpoint(cliente: ClienteCreate, db=Depends(get_db)):
     """
     Endpoint to create a new cliente.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
         insert_query = """
             INSERT INTO clientes (nombre, correo, telefono, direccion)
             VALUES (%s, %s, %s, %s)
         """
-        cursor.execute(
+        await cursor.execute(
             insert_query,
             (
                 cliente.nombre,
@@ -137,7 +167,9 @@ def create_cliente_endpoint(cliente: ClienteCreate, db=Depends(get_db)):
                 cliente.direccion
             )
         )
-        db.commit()
+        await db.commit()
+        invalidate_count("clientes")
+        await cache.invalidate()
 
         cliente_id = cursor.lastrowid
         cliente_data = {**cliente.dict(), "id": cliente_id}
@@ -152,8 +184,8 @@ def create_cliente_endpoint(cliente: ClienteCreate, db=Depends(get_db)):
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.put(
     "/{cliente_id}",
@@ -161,18 +193,18 @@ def create_cliente_endpoint(cliente: ClienteCreate, db=Depends(get_db)):
     tags=["Clientes"],
     response_model=APIResponse[ClienteBase]
 )
-def update_cliente_endpoint(cliente_id: int, cliente: ClienteCreate, db=Depends(get_db)):
+async def update_cliente_endpoint(cliente_id: int, cliente: ClienteCreate, db=Depends(get_db)):
     """
     Endpoint to update an existing cliente.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
         update_query = """
             UPDATE clientes
             SET nombre = %s, correo = %s, telefono = %s, direccion = %s
             WHERE id = %s
         """
-        cursor.execute(
+        await cursor.execute(
             update_query,
             (
                 cliente.nombre,
@@ -182,7 +214,8 @@ def update_cliente_endpoint(cliente_id: int, cliente: ClienteCreate, db=Depends(
                 cliente_id
             )
         )
-        db.commit()
+        await db.commit()
+        await cache.invalidate()
 
         if cursor.rowcount == 0:
             raise HTTPException(
@@ -200,8 +233,8 @@ def update_cliente_endpoint(cliente_id: int, cliente: ClienteCreate, db=Depends(
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.delete(
     "/{cliente_id}",
@@ -209,15 +242,17 @@ def update_cliente_endpoint(cliente_id: int, cliente: ClienteCreate, db=Depends(
     tags=["Clientes"],
     response_model=MessageResponse
 )
-def delete_cliente_endpoint(cliente_id: int, db=Depends(get_db)):
+async def delete_cliente_endpoint(cliente_id: int, db=Depends(get_db)):
     """
     Endpoint to delete a cliente by its ID.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
         delete_query = "DELETE FROM clientes WHERE id = %s"
-        cursor.execute(delete_query, (cliente_id,))
-        db.commit()
+        await cursor.execute(delete_query, (cliente_id,))
+        await db.commit()
+        invalidate_count("clientes")
+        await cache.invalidate()
 
         if cursor.rowcount == 0:
             raise HTTPException(
@@ -235,5 +270,5 @@ def delete_cliente_endpoint(cliente_id: int, db=Depends(get_db)):
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
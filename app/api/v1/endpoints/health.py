@@ -10,10 +10,13 @@
 """
 
 import mysql.connector
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.schemas.common import APIResponse, MessageResponse
-from app.dependencies import get_db
+from app.schemas.health import CacheStats, QueryStats
+from app.dependencies import get_db, get_current_admin_user
+from app.utils.cache import cache_stats
+from app.utils.query_stats import QueryOrder, query_stats
 
 router = APIRouter()
 
@@ -23,14 +26,14 @@ router = APIRouter()
     tags=["Health"],
     response_model=APIResponse[MessageResponse]
 )
-def get_health_endpoint(db=Depends(get_db)):
+async def get_health_endpoint(db=Depends(get_db)):
     """
     Health check endpoint to verify the API and database connection.
     """
     try:
-        cursor = db.cursor()
-        cursor.execute("SELECT 1")
-        cursor.fetchone()
+        cursor = await db.cursor()
+        await cursor.execute("SELECT 1")
+        await cursor.fetchone()
 
         return APIResponse(success=True, data=MessageResponse(message="API is healthy!"))
     except mysql.connector.Error as err:
@@ -39,4 +42,54 @@ def get_health_endpoint(db=Depends(get_db)):
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
+        await cursor.close()
+
+@router.get(
+    "/caches",
+    summary="Cache Statistics",
+    tags=["Health"],
+    response_model=APIResponse[CacheStats],
+    dependencies=[Depends(get_current_admin_user)]
+)
+async def get_cache_stats_endpoint():
+    """
+    Endpoint to inspect the hit ratio of the in-process caches, including verified tokens.
+    """
+    caches = cache_stats()
+    return APIResponse(
+        success=True,
+        data=[CacheStats(namespace=namespace, **stats) for namespace, stats in caches.items()]
+    )
+
+@router.get(
+    "/queries",
+    summary="Slowest SQL Statements",
+    tags=["Health"],
+    response_model=APIResponse[QueryStats],
+    dependencies=[Depends(get_current_admin_user)]
+)
+async def get_query_stats_endpoint(
+    limit: int = Query(10, ge=1, le=100, description="Number of statements"),
+    order_by: QueryOrder = Query(QueryOrder.MAX, description="max, mean or total")
+):
+    """
+    Endpoint to list the slowest SQL statements run by this process, by fingerprint.
+    """
+    return APIResponse(
+        success=True,
+        data=[QueryStats(**stats) for stats in query_stats.top(limit, order_by)]
+    )
+
+@router.delete(
+    "/queries",
+    summary="Reset SQL Statement Statistics",
+    tags=["Health"],
+    response_model=APIResponse[MessageResponse],
+    dependencies=[Depends(get_current_admin_user)]
+)
+async def reset_query_stats_endpoint():
+    """
+    Endpoint to clear the SQL statement statistics, e.g. before a load test.
+    """
+    query_stats.reset()
+    return APIResponse(success=True, data=MessageResponse(message="Query statistics reset"))
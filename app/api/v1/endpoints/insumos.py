@@ -8,15 +8,29 @@
         APIResponsePaginated: A paginated response containing the insumos.
 """
 
-import math
+from typing import Optional
+
 import mysql.connector
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.schemas.common import APIResponse, MessageResponse, APIResponsePaginated
 from app.schemas.insumo import InsumoBase, InsumoCreate, InsumoUpdate
+from app.utils.cache_backend import invalidate_namespaces, shared_cache
+from app.utils.conditional import conditional_get
+from app.utils.pagination import (
+    build_page_query,
+    count_rows,
+    invalidate_count,
+    next_cursor,
+    page_count,
+    PageRequest,
+    page_request
+)
+from app.utils.serialization import envelope_response, render_item, render_page
 from app.dependencies import get_db
 
 router = APIRouter()
+cache = shared_cache("insumos")
 
 @router.get(
     "/",
@@ -24,54 +38,62 @@ router = APIRouter()
     tags=["Insumos"],
     response_model=APIResponsePaginated[InsumoBase]
 )
-def get_insumos_endpoint(
-    page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(10, ge=1, le=100, description="Items per page"),
+async def get_insumos_endpoint(
+    paging: PageRequest = Depends(page_request("insumos")),
     db=Depends(get_db)
 ):
     """
     Endpoint to retrieve all insumos.
     """
+    cache_key = ("list", paging.page, paging.page_size, paging.after, paging.count)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return envelope_response(cached, paging.etag)
+
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
 
-        count_query = "SELECT COUNT(*) as total FROM insumos"
-        cursor.execute(count_query)
-        total_items = cursor.fetchone()['total']
+        total_items = await count_rows(cursor, "insumos", paging.count)
 
-        offset = (page - 1) * page_size
-        query = "SELECT * FROM insumos LIMIT %s OFFSET %s"
-        cursor.execute(query, (page_size, offset))
+        query, params = build_page_query(
+            "SELECT * FROM insumos", "id", paging.page, paging.page_size, paging.after
+        )
+        await cursor.execute(query, params)
 
-        insumos = cursor.fetchall()
-        total_pages = math.ceil(total_items / page_size) if total_items > 0 else 1
+        insumos = await cursor.fetchall()
+        total_pages = page_count(total_items, paging.page_size)
 
         if not insumos:
-            return APIResponsePaginated(
-                success=True,
-                data=[],
+            rendered = render_page(
+                InsumoBase,
+                [],
                 total_items=total_items,
-                page=page,
-                page_size=page_size,
+                page=paging.page,
+                page_size=paging.page_size,
                 total_pages=total_pages
             )
+            await cache.set(cache_key, rendered)
+            return envelope_response(rendered, paging.etag)
 
-        return APIResponsePaginated(
-            success=True,
-            data=[InsumoBase(**insumo) for insumo in insumos],
+        rendered = render_page(
+            InsumoBase,
+            insumos,
             total_items=total_items,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages
+            page=paging.page,
+            page_size=paging.page_size,
+            total_pages=total_pages,
+            next_cursor=next_cursor(insumos, "id", paging.page_size)
         )
+        await cache.set(cache_key, rendered)
+        return envelope_response(rendered, paging.etag)
     except mysql.connector.Error as err:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.get(
     "/{insumo_id}",
@@ -79,34 +101,42 @@ def get_insumos_endpoint(
     tags=["Insumos"],
     response_model=APIResponse[InsumoBase]
 )
-def get_insumo_by_id_endpoint(insumo_id: int, db=Depends(get_db)):
+async def get_insumo_by_id_endpoint(
+    insumo_id: int,
+    etag: Optional[str] = Depends(conditional_get("insumos")),
+    db=Depends(get_db)
+):
     """
     Endpoint to retrieve an insumo by its ID.
     """
+    cache_key = ("id", insumo_id)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return envelope_response(cached, etag)
+
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
         query = "SELECT * FROM insumos WHERE id = %s"
-        cursor.execute(query, (insumo_id,))
+        await cursor.execute(query, (insumo_id,))
 
-        insumo = cursor.fetchone()
+        insumo = await cursor.fetchone()
         if not insumo:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Insumo not found"
             )
 
-        return APIResponse(
-            success=True,
-            data=InsumoBase(**insumo)
-        )
+        rendered = render_item(InsumoBase, insumo)
+        await cache.set(cache_key, rendered)
+        return envelope_response(rendered, etag)
     except mysql.connector.Error as err:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.post(
     "/",
@@ -114,17 +144,17 @@ def get_insumo_by_id_endpoint(insumo_id: int, db=Depends(get_db)):
     tags=["Insumos"],
     response_model=APIResponse[InsumoBase]
 )
-def create_insumo_endpoint(insumo: InsumoCreate, db=Depends(get_db)):
+async def create_insumo_endpoint(insumo: InsumoCreate, db=Depends(get_db)):
     """
     Endpoint to create a new insumo.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
 
         query = "SELECT id FROM proveedores WHERE id = %s"
-        cursor.execute(query, (insumo.id_proveedor,))
+        await cursor.execute(query, (insumo.id_proveedor,))
 
-        if not cursor.fetchone():
+        if not await cursor.fetchone():
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Proveedor not found"
@@ -134,7 +164,7 @@ def create_insumo_endpoint(insumo: InsumoCreate, db=Depends(get_db)):
             INSERT INTO insumos (descripcion, tipo, precio_unitario, id_proveedor)
             VALUES (%s, %s, %s, %s)
         """
-        cursor.execute(
+        await cursor.execute(
             query,
             (
                 insumo.descripcion,
@@ -143,7 +173,9 @@ def create_insumo_endpoint(insumo: InsumoCreate, db=Depends(get_db)):
                 insumo.id_proveedor
             )
         )
-        db.commit()
+        await db.commit()
+        invalidate_count("insumos")
+        await cache.invalidate()
 
         if cursor.rowcount == 0:
             raise HTTPException(
@@ -151,7 +183,7 @@ def create_insumo_endpoint(insumo: InsumoCreate, db=Depends(get_db)):
                 detail="Failed to create insumo"
             )
 
-        cursor.execute(
+        await cursor.execute(
             """
                 SELECT * FROM insumos 
                 WHERE descripcion = %s 
@@ -166,7 +198,7 @@ def create_insumo_endpoint(insumo: InsumoCreate, db=Depends(get_db)):
                 insumo.id_proveedor,
             )
         )
-        created_insumo = cursor.fetchone()
+        created_insumo = await cursor.fetchone()
 
         return APIResponse(
             success=True,
@@ -178,8 +210,8 @@ def create_insumo_endpoint(insumo: InsumoCreate, db=Depends(get_db)):
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.put(
     "/{insumo_id}",
@@ -187,18 +219,18 @@ def create_insumo_endpoint(insumo: InsumoCreate, db=Depends(get_db)):
     tags=["Insumos"],
     response_model=APIResponse[InsumoBase]
 )
-def update_insumo_endpoint(insumo_id: int, insumo: InsumoUpdate, db=Depends(get_db)):
+async def update_insumo_endpoint(insumo_id: int, insumo: InsumoUpdate, db=Depends(get_db)):
     """
     Endpoint to update an existing insumo.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
         query = """
             UPDATE insumos
             SET descripcion = %s, tipo = %s, precio_unitario = %s, id_proveedor = %s
             WHERE id = %s
         """
-        cursor.execute(
+        await cursor.execute(
             query,
             (
                 insumo.descripcion,
@@ -208,7 +240,8 @@ def update_insumo_endpoint(insumo_id: int, insumo: InsumoUpdate, db=Depends(get_
                 insumo_id
             )
         )
-        db.commit()
+        await db.commit()
+        await cache.invalidate()
 
         if cursor.rowcount == 0:
             raise HTTPException(
@@ -216,8 +249,8 @@ def update_insumo_endpoint(insumo_id: int, insumo: InsumoUpdate, db=Depends(get_
                 detail="Insumo not found"
             )
 
-        cursor.execute("SELECT * FROM insumos WHERE id = %s", (insumo_id,))
-        updated_insumo = cursor.fetchone()
+        await cursor.execute("SELECT * FROM insumos WHERE id = %s", (insumo_id,))
+        updated_insumo = await cursor.fetchone()
 
         if not updated_insumo:
             raise HTTPException(
@@ -235,8 +268,8 @@ def update_insumo_endpoint(insumo_id: int, insumo: InsumoUpdate, db=Depends(get_
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.delete(
     "/{insumo_id}",
@@ -244,20 +277,25 @@ def update_insumo_endpoint(insumo_id: int, insumo: InsumoUpdate, db=Depends(get_
     tags=["Insumos"],
     response_model=APIResponse[MessageResponse]
 )
-def delete_insumo_endpoint(insumo_id: int, db=Depends(get_db)):
+async def delete_insumo_endpoint(insumo_id: int, db=Depends(get_db)):
     """
     Endpoint to delete an insumo by its ID.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
 
         query = "DELETE FROM registro_consumo WHERE id_insumo = %s"
-        cursor.execute(query, (insumo_id,))
-        db.commit()
+        await cursor.execute(query, (insumo_id,))
+        query = "DELETE FROM consumo_mensual WHERE id_insumo = %s"
+        await cursor.execute(query, (insumo_id,))
+        await db.commit()
 
         query = "DELETE FROM insumos WHERE id = %s"
-        cursor.execute(query, (insumo_id,))
-        db.commit()
+        await cursor.execute(query, (insumo_id,))
+        await db.commit()
+        invalidate_count("registro_consumo", "insumos")
+        await cache.invalidate()
+        await invalidate_namespaces("registro_consumo")
 
         if cursor.rowcount == 0:
             raise HTTPException(
@@ -275,5 +313,5 @@ def delete_insumo_endpoint(insumo_id: int, db=Depends(get_db)):
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
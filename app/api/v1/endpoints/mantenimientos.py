@@ -8,15 +8,32 @@
 
     Returns:
         APIResponsePaginated: A paginated response containing the mantenimientos.
+        StreamingResponse: Every mantenimiento, streamed as CSV or NDJSON.
 """
 
-import math
+from datetime import datetime
+from typing import Optional
+
 import mysql.connector
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
 from app.schemas.common import APIResponse, MessageResponse, APIResponsePaginated
 from app.schemas.mantenimiento import MantenimientoBase, MantenimientoCreate
-from app.dependencies import get_db
+from app.utils.cache_backend import invalidate_namespaces
+from app.utils.conditional import conditional_get
+from app.utils.pagination import (
+    build_page_query,
+    count_rows,
+    invalidate_count,
+    next_cursor,
+    page_count,
+    PageRequest,
+    page_request
+)
+from app.utils.export import ExportFormat, date_range_filter, stream_query
+from app.utils.serialization import paginated_response
+from app.dependencies import get_db, get_current_admin_user
 
 router = APIRouter()
 
@@ -26,45 +43,46 @@ router = APIRouter()
     tags=["Mantenimientos"],
     response_model=APIResponsePaginated[MantenimientoBase]
 )
-def get_mantenimientos_endpoint(
-    page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(10, ge=1, le=100, description="Items per page"),
+async def get_mantenimientos_endpoint(
+    paging: PageRequest = Depends(page_request("mantenimientos")),
     db=Depends(get_db)
 ):
     """
     Endpoint to retrieve all mantenimientos.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
 
-        count_query = "SELECT COUNT(*) as total FROM mantenimientos"
-        cursor.execute(count_query)
-        total_items = cursor.fetchone()['total']
+        total_items = await count_rows(cursor, "mantenimientos", paging.count)
 
-        offset = (page - 1) * page_size
-        query = "SELECT * FROM mantenimientos LIMIT %s OFFSET %s"
-        cursor.execute(query, (page_size, offset))
+        query, params = build_page_query(
+            "SELECT * FROM mantenimientos", "id", paging.page, paging.page_size, paging.after
+        )
+        await cursor.execute(query, params)
 
-        mantenimientos = cursor.fetchall()
-        total_pages = math.ceil(total_items / page_size) if total_items > 0 else 1
+        mantenimientos = await cursor.fetchall()
+        total_pages = page_count(total_items, paging.page_size)
 
         if not mantenimientos:
-            return APIResponsePaginated(
-                success=True,
-                data=[],
+            return paginated_response(
+                MantenimientoBase,
+                [],
+                etag=paging.etag,
                 total_items=total_items,
-                page=page,
-                page_size=page_size,
+                page=paging.page,
+                page_size=paging.page_size,
                 total_pages=total_pages
             )
 
-        return APIResponsePaginated(
-            success=True,
-            data=[MantenimientoBase(**mantenimiento) for mantenimiento in mantenimientos],
+        return paginated_response(
+            MantenimientoBase,
+            mantenimientos,
+            etag=paging.etag,
             total_items=total_items,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages
+            page=paging.page,
+            page_size=paging.page_size,
+            total_pages=total_pages,
+            next_cursor=next_cursor(mantenimientos, "id", paging.page_size)
         )
     except mysql.connector.Error as err:
         raise HTTPException(
@@ -72,24 +90,61 @@ def get_mantenimientos_endpoint(
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
+
+@router.get(
+    "/export",
+    summary="Export Mantenimientos",
+    tags=["Mantenimientos"],
+    response_class=StreamingResponse,
+    dependencies=[Depends(get_current_admin_user)]
+)
+async def export_mantenimientos_endpoint(
+    export_format: ExportFormat = Query(
+        ExportFormat.NDJSON,
+        alias="format",
+        description="Output format: ndjson or csv"
+    ),
+    desde: Optional[datetime] = Query(None, description="Only rows with fecha >= desde"),
+    hasta: Optional[datetime] = Query(None, description="Only rows with fecha < hasta")
+):
+    """
+    Endpoint to export mantenimientos as CSV or NDJSON.
+    Rows are streamed from an unbuffered cursor, so memory usage is constant
+    regardless of the table size.
+    """
+    where, params = date_range_filter("fecha", desde, hasta)
+    order = "fecha, id" if where else "id"
+    try:
+        return await stream_query(
+            f"SELECT * FROM mantenimientos {where} ORDER BY {order}",
+            params,
+            export_format,
+            "mantenimientos"
+        )
+    except mysql.connector.Error as err:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Database connection error: {err}"
+        ) from err
 
 @router.get(
     "/{id_maquina}",
     summary="Get Mantenimiento by ID",
     tags=["Mantenimientos"],
-    response_model=APIResponse[MantenimientoBase]
+    response_model=APIResponse[MantenimientoBase],
+    dependencies=[Depends(conditional_get("mantenimientos"))]
 )
-def get_mantenimiento_by_id_endpoint(id_maquina: int, db=Depends(get_db)):
+async def get_mantenimiento_by_id_endpoint(id_maquina: int, db=Depends(get_db)):
     """
     Endpoint to retrieve a mantenimiento by its ID.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
         query = "SELECT * FROM mantenimientos WHERE id_maquina = %s"
-        cursor.execute(query, (id_maquina,))
-        mantenimiento = cursor.fetchone()
+        await cursor.execute(query, (id_maquina,))
+        mantenimiento = await cursor.fetchone()
 
         if not mantenimiento:
             raise HTTPException(
@@ -107,8 +162,8 @@ def get_mantenimiento_by_id_endpoint(id_maquina: int, db=Depends(get_db)):
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.post(
     "/",
@@ -116,17 +171,17 @@ def get_mantenimiento_by_id_endpoint(id_maquina: int, db=Depends(get_db)):
     tags=["Mantenimientos"],
     response_model=APIResponse[MantenimientoBase]
 )
-def create_mantenimiento_endpoint(mantenimiento: MantenimientoCreate, db=Depends(get_db)):
+async def create_mantenimiento_endpoint(mantenimiento: MantenimientoCreate, db=Depends(get_db)):
     """
     Endpoint to create a new mantenimiento.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
 
         query = "SELECT * FROM maquinas WHERE id = %s"
-        cursor.execute(query, (mantenimiento.id_maquina,))
+        await cursor.execute(query, (mantenimiento.id_maquina,))
 
-        maquina = cursor.fetchone()
+        maquina = await cursor.fetchone()
         if not maquina:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -134,9 +189,9 @@ def create_mantenimiento_endpoint(mantenimiento: MantenimientoCreate, db=Depends
             )
 
         query = "SELECT * FROM tecnicos WHERE ci = %s"
-        cursor.execute(query, (mantenimiento.ci_tecnico,))
+        await cursor.execute(query, (mantenimiento.ci_tecnico,))
 
-        tecnico = cursor.fetchone()
+        tecnico = await cursor.fetchone()
         if not tecnico:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -147,7 +202,7 @@ def create_mantenimiento_endpoint(mantenimiento: MantenimientoCreate, db=Depends
             INSERT INTO mantenimientos (id_maquina, ci_tecnico, tipo, fecha, observaciones)
             VALUES (%s, %s, %s, %s, %s)
         """
-        cursor.execute(
+        await cursor.execute(
             insert_query,
             (
                 mantenimiento.id_maquina,
@@ -157,11 +212,13 @@ def create_mantenimiento_endpoint(mantenimiento: MantenimientoCreate, db=Depends
                 mantenimiento.observaciones
             )
         )
-        db.commit()
+        await db.commit()
+        invalidate_count("mantenimientos")
+        await invalidate_namespaces("mantenimientos")
 
         mantenimiento_id = cursor.lastrowid
-        cursor.execute("SELECT * FROM mantenimientos WHERE id = %s", (mantenimiento_id,))
-        new_mantenimiento = cursor.fetchone()
+        await cursor.execute("SELECT * FROM mantenimientos WHERE id = %s", (mantenimiento_id,))
+        new_mantenimiento = await cursor.fetchone()
 
         return APIResponse(
             success=True,
@@ -173,8 +230,8 @@ def create_mantenimiento_endpoint(mantenimiento: MantenimientoCreate, db=Depends
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.put(
     "/{id}",
@@ -182,7 +239,7 @@ def create_mantenimiento_endpoint(mantenimiento: MantenimientoCreate, db=Depends
     tags=["Mantenimientos"],
     response_model=APIResponse[MantenimientoBase]
 )
-def update_mantenimiento_endpoint(
+async def update_mantenimiento_endpoint(
     mantenimiento_id: int,
     mantenimiento: MantenimientoCreate,
     db=Depends(get_db)
@@ -191,13 +248,13 @@ def update_mantenimiento_endpoint(
     Endpoint to update an existing mantenimiento.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
         update_query = """
             UPDATE mantenimientos
             SET id_maquina = %s, ci_tecnico = %s, tipo = %s, fecha = %s, observaciones = %s
             WHERE id = %s
         """
-        cursor.execute(
+        await cursor.execute(
             update_query,
             (
                 mantenimiento.id_maquina,
@@ -208,7 +265,8 @@ def update_mantenimiento_endpoint(
                 mantenimiento_id
             )
         )
-        db.commit()
+        await db.commit()
+        await invalidate_namespaces("mantenimientos")
 
         if cursor.rowcount == 0:
             raise HTTPException(
@@ -216,8 +274,8 @@ def update_mantenimiento_endpoint(
                 detail="Mantenimiento not found"
             )
 
-        cursor.execute("SELECT * FROM mantenimientos WHERE id = %s", (mantenimiento_id,))
-        updated_mantenimiento = cursor.fetchone()
+        await cursor.execute("SELECT * FROM mantenimientos WHERE id = %s", (mantenimiento_id,))
+        updated_mantenimiento = await cursor.fetchone()
 
         return APIResponse(
             success=True,
@@ -229,8 +287,8 @@ def update_mantenimiento_endpoint(
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.delete(
     "/{id}",
@@ -238,15 +296,17 @@ def update_mantenimiento_endpoint(
     tags=["Mantenimientos"],
     response_model=MessageResponse
 )
-def delete_mantenimiento_endpoint(mantenimiento_id: int, db=Depends(get_db)):
+async def delete_mantenimiento_endpoint(mantenimiento_id: int, db=Depends(get_db)):
     """
     Endpoint to delete a mantenimiento by its ID.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
         delete_query = "DELETE FROM mantenimientos WHERE id = %s"
-        cursor.execute(delete_query, (mantenimiento_id,))
-        db.commit()
+        await cursor.execute(delete_query, (mantenimiento_id,))
+        await db.commit()
+        invalidate_count("mantenimientos")
+        await invalidate_namespaces("mantenimientos")
 
         if cursor.rowcount == 0:
             raise HTTPException(
@@ -264,5 +324,5 @@ def delete_mantenimiento_endpoint(mantenimiento_id: int, db=Depends(get_db)):
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
@@ -15,15 +15,29 @@
         MessageResponse: A response indicating the success of a delete operation.
 """
 
-import math
+from typing import Optional
+
 import mysql.connector
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.schemas.common import APIResponse, MessageResponse, APIResponsePaginated
 from app.schemas.maquina import MaquinaBase, MaquinaCreate
+from app.utils.cache_backend import shared_cache
+from app.utils.conditional import conditional_get
+from app.utils.pagination import (
+    build_page_query,
+    count_rows,
+    invalidate_count,
+    next_cursor,
+    page_count,
+    PageRequest,
+    page_request
+)
+from app.utils.serialization import envelope_response, render_item, render_page
 from app.dependencies import get_db, get_current_admin_user
 
 router = APIRouter()
+cache = shared_cache("maquinas")
 
 @router.get(
     "/",
@@ -32,54 +46,62 @@ router = APIRouter()
     response_model=APIResponsePaginated[MaquinaBase],
     dependencies=[Depends(get_current_admin_user)]
 )
-def get_maquinas_endpoint(
-    page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(10, ge=1, le=100, description="Items per page"),
+async def get_maquinas_endpoint(
+    paging: PageRequest = Depends(page_request("maquinas")),
     db=Depends(get_db)
 ):
     """
     Endpoint to retrieve all maquinas.
     """
+    cache_key = ("list", paging.page, paging.page_size, paging.after, paging.count)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return envelope_response(cached, paging.etag)
+
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
 
-        count_query = "SELECT COUNT(*) as total FROM maquinas"
-        cursor.execute(count_query)
-        total_items = cursor.fetchone()['total']
+        total_items = await count_rows(cursor, "maquinas", paging.count)
 
-        offset = (page - 1) * page_size
-        query = "SELECT * FROM maquinas LIMIT %s OFFSET %s"
-        cursor.execute(query, (page_size, offset))
+        query, params = build_page_query(
+            "SELECT * FROM maquinas", "id", paging.page, paging.page_size, paging.after
+        )
+        await cursor.execute(query, params)
 
-        maquinas = cursor.fetchall()
-        total_pages = math.ceil(total_items / page_size) if total_items > 0 else 1
+        maquinas = await cursor.fetchall()
+        total_pages = page_count(total_items, paging.page_size)
 
         if not maquinas:
-            return APIResponsePaginated(
-                success=True,
-                data=[],
+            rendered = render_page(
+                MaquinaBase,
+                [],
                 total_items=total_items,
-                page=page,
-                page_size=page_size,
+                page=paging.page,
+                page_size=paging.page_size,
                 total_pages=total_pages
             )
+            await cache.set(cache_key, rendered)
+            return envelope_response(rendered, paging.etag)
 
-        return APIResponsePaginated(
-            success=True,
-            data=[MaquinaBase(**maquina) for maquina in maquinas],
+        rendered = render_page(
+            MaquinaBase,
+            maquinas,
             total_items=total_items,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages
+            page=paging.page,
+            page_size=paging.page_size,
+            total_pages=total_pages,
+            next_cursor=next_cursor(maquinas, "id", paging.page_size)
         )
+        await cache.set(cache_key, rendered)
+        return envelope_response(rendered, paging.etag)
     except mysql.connector.Error as err:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.get(
     "/{maquina_id}",
@@ -88,15 +110,24 @@ def get_maquinas_endpoint(
     response_model=APIResponse[MaquinaBase],
     dependencies=[Depends(get_current_admin_user)]
 )
-def get_maquina_by_id_endpoint(maquina_id: int, db=Depends(get_db)):
+async def get_maquina_by_id_endpoint(
+    maquina_id: int,
+    etag: Optional[str] = Depends(conditional_get("maquinas")),
+    db=Depends(get_db)
+):
     """
     Endpoint to retrieve a maquina by its ID.
     """
+    cache_key = ("id", maquina_id)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return envelope_response(cached, etag)
+
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
         query = "SELECT * FROM maquinas WHERE id = %s"
-        cursor.execute(query, (maquina_id,))
-        maquina = cursor.fetchone()
+        await cursor.execute(query, (maquina_id,))
+        maquina = await cursor.fetchone()
 
         if not maquina:
             raise HTTPException(
@@ -104,18 +135,17 @@ def get_maquina_by_id_endpoint(maquina_id: int, db=Depends(get_db)):
                 detail="Maquina not found"
             )
 
-        return APIResponse(
-            success=True,
-            data=MaquinaBase(**maquina)
-        )
+        rendered = render_item(MaquinaBase, maquina)
+        await cache.set(cache_key, rendered)
+        return envelope_response(rendered, etag)
     except mysql.connector.Error as err:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.post(
     "/",
@@ -124,17 +154,17 @@ def get_maquina_by_id_endpoint(maquina_id: int, db=Depends(get_db)):
     response_model=APIResponse[MaquinaBase],
     dependencies=[Depends(get_current_admin_user)]
 )
-def create_maquina_endpoint(maquina: MaquinaCreate, db=Depends(get_db)):
+async def create_maquina_endpoint(maquina: MaquinaCreate, db=Depends(get_db)):
     """
     Endpoint to create a new maquina.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
         insert_query = """
             INSERT INTO maquinas (modelo, id_cliente, ubicacion_cliente, costo_alquiler_mensual)
             VALUES (%s, %s, %s,%s)
         """
-        cursor.execute(
+        await cursor.execute(
             insert_query,
             (
                 maquina.modelo,
@@ -143,7 +173,9 @@ def create_maquina_endpoint(maquina: MaquinaCreate, db=Depends(get_db)):
                 maquina.costo_alquiler_mensual
             )
         )
-        db.commit()
+        await db.commit()
+        invalidate_count("maquinas")
+        await cache.invalidate()
 
         if cursor.rowcount == 0:
             raise HTTPException(
@@ -152,8 +184,8 @@ def create_maquina_endpoint(maquina: MaquinaCreate, db=Depends(get_db)):
             )
 
         query = "SELECT * FROM maquinas WHERE id = LAST_INSERT_ID()"
-        cursor.execute(query)
-        created_maquina = cursor.fetchone()
+        await cursor.execute(query)
+        created_maquina = await cursor.fetchone()
 
         return APIResponse(
             success=True,
@@ -165,8 +197,8 @@ def create_maquina_endpoint(maquina: MaquinaCreate, db=Depends(get_db)):
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.put(
     "/{maquina_id}",
@@ -175,18 +207,18 @@ def create_maquina_endpoint(maquina: MaquinaCreate, db=Depends(get_db)):
     response_model=APIResponse[MaquinaBase],
     dependencies=[Depends(get_current_admin_user)]
 )
-def update_maquina_endpoint(maquina_id: int, maquina: MaquinaCreate, db=Depends(get_db)):
+async def update_maquina_endpoint(maquina_id: int, maquina: MaquinaCreate, db=Depends(get_db)):
     """
     Endpoint to update an existing maquina.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
         update_query = """
             UPDATE maquinas
             SET modelo = %s, id_cliente = %s, ubicacion_cliente = %s, costo_alquiler_mensual = %s
             WHERE id = %s
         """
-        cursor.execute(
+        await cursor.execute(
             update_query,
             (
                 maquina.modelo,
@@ -196,7 +228,8 @@ def update_maquina_endpoint(maquina_id: int, maquina: MaquinaCreate, db=Depends(
                 maquina_id
             )
         )
-        db.commit()
+        await db.commit()
+        await cache.invalidate()
 
         if cursor.rowcount == 0:
             raise HTTPException(
@@ -204,8 +237,8 @@ def update_maquina_endpoint(maquina_id: int, maquina: MaquinaCreate, db=Depends(
                 detail="Maquina not found"
             )
 
-        cursor.execute("SELECT * FROM maquinas WHERE id = %s", (maquina_id,))
-        updated_maquina = cursor.fetchone()
+        await cursor.execute("SELECT * FROM maquinas WHERE id = %s", (maquina_id,))
+        updated_maquina = await cursor.fetchone()
 
         return APIResponse(
             success=True,
@@ -217,8 +250,8 @@ def update_maquina_endpoint(maquina_id: int, maquina: MaquinaCreate, db=Depends(
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.delete(
     "/{maquina_id}",
@@ -227,15 +260,17 @@ def update_maquina_endpoint(maquina_id: int, maquina: MaquinaCreate, db=Depends(
     response_model=APIResponse[MessageResponse],
     dependencies=[Depends(get_current_admin_user)]
 )
-def delete_maquina_endpoint(maquina_id: int, db=Depends(get_db)):
+async def delete_maquina_endpoint(maquina_id: int, db=Depends(get_db)):
     """
     Endpoint to delete a maquina by its ID.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
         delete_query = "DELETE FROM maquinas WHERE id = %s"
-        cursor.execute(delete_query, (maquina_id,))
-        db.commit()
+        await cursor.execute(delete_query, (maquina_id,))
+        await db.commit()
+        invalidate_count("maquinas")
+        await cache.invalidate()
 
         if cursor.rowcount == 0:
             raise HTTPException(
@@ -253,5 +288,5 @@ def delete_maquina_endpoint(maquina_id: int, db=Depends(get_db)):
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
@@ -0,0 +1,74 @@
+""" Metrics endpoint in the Prometheus text exposition format.
+    Besides the request and query metrics recorded by the metrics middleware, it
+    reports the connection counts of the database pools and the counters of the
+    in-process caches, read when the endpoint is scraped.
+
+    Returns:
+        Response: The metrics as text/plain (exposition format 0.0.4).
+"""
+
+from typing import Dict
+
+from fastapi import APIRouter, Response
+
+from app.database import pool
+from app.database_async import async_pool
+from app.utils.cache import cache_stats
+from app.utils.metrics import CallbackMetric, registry
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter()
+
+def _pool_connections() -> Dict[tuple, float]:
+    connections = {}
+    for name, stats in (("sync", pool.stats()), ("async", async_pool.stats())):
+        connections[(name, "idle")] = stats["idle"]
+        connections[(name, "in_use")] = stats["in_use"]
+    return connections
+
+def _pool_max_size() -> Dict[tuple, float]:
+    return {("sync",): pool.max_size, ("async",): async_pool.max_size}
+
+def _cache_counter(field: str):
+    def collect() -> Dict[tuple, float]:
+        return {(namespace,): stats[field] for namespace, stats in cache_stats().items()}
+    return collect
+
+registry.register(CallbackMetric(
+    "marloy_db_pool_connections",
+    "Database connections open in each pool, by state.",
+    ("pool", "state"),
+    _pool_connections
+))
+registry.register(CallbackMetric(
+    "marloy_db_pool_max_connections",
+    "Maximum number of connections each pool may open.",
+    ("pool",),
+    _pool_max_size
+))
+registry.register(CallbackMetric(
+    "marloy_cache_entries",
+    "Entries held by each in-process cache.",
+    ("namespace",),
+    _cache_counter("entries")
+))
+for _field, _documentation in (
+    ("hits", "Lookups answered by each in-process cache."),
+    ("misses", "Lookups that found no live entry in each in-process cache."),
+    ("evictions", "Entries evicted from each in-process cache to stay under its size."),
+):
+    registry.register(CallbackMetric(
+        f"marloy_cache_{_field}_total",
+        _documentation,
+        ("namespace",),
+        _cache_counter(_field),
+        kind="counter"
+    ))
+
+@router.get("", summary="Prometheus Metrics", include_in_schema=False)
+async def get_metrics_endpoint():
+    """
+    Endpoint scraped by Prometheus.
+    """
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
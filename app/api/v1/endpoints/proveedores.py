@@ -16,15 +16,29 @@
         MessageResponse: A response indicating the success of a delete operation.
 """
 
-import math
+from typing import Optional
+
 import mysql.connector
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.schemas.common import APIResponse, MessageResponse, APIResponsePaginated
 from app.schemas.proveedor import ProveedorBase, ProveedorCreate, ProveedorUpdate
+from app.utils.cache_backend import shared_cache
+from app.utils.conditional import conditional_get
+from app.utils.pagination import (
+    build_page_query,
+    count_rows,
+    invalidate_count,
+    next_cursor,
+    page_count,
+    PageRequest,
+    page_request
+)
+from app.utils.serialization import envelope_response, render_item, render_page
 from app.dependencies import get_db, get_current_admin_user
 
 router = APIRouter()
+cache = shared_cache("proveedores")
 
 @router.get(
     "/",
@@ -33,54 +47,62 @@ router = APIRouter()
     response_model=APIResponsePaginated[ProveedorBase],
     dependencies=[Depends(get_current_admin_user)]
 )
-def get_proveedores_endpoint(
-    page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(10, ge=1, le=100, description="Items per page"),
+async def get_proveedores_endpoint(
+    paging: PageRequest = Depends(page_request("proveedores")),
     db=Depends(get_db)
 ):
     """
     Endpoint to retrieve all proveedores.
     """
+    cache_key = ("list", paging.page, paging.page_size, paging.after, paging.count)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return envelope_response(cached, paging.etag)
+
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
 
-        count_query = "SELECT COUNT(*) as total FROM proveedores"
-        cursor.execute(count_query)
-        total_items = cursor.fetchone()['total']
+        total_items = await count_rows(cursor, "proveedores", paging.count)
 
-        offset = (page - 1) * page_size
-        query = "SELECT * FROM proveedores LIMIT %s OFFSET %s"
-        cursor.execute(query, (page_size, offset))
+        query, params = build_page_query(
+            "SELECT * FROM proveedores", "id", paging.page, paging.page_size, paging.after
+        )
+        await cursor.execute(query, params)
 
-        proveedores = cursor.fetchall()
-        total_pages = math.ceil(total_items / page_size) if total_items > 0 else 1
+        proveedores = await cursor.fetchall()
+        total_pages = page_count(total_items, paging.page_size)
 
         if not proveedores:
-            return APIResponsePaginated(
-                success=True,
-                data=[],
+            rendered = render_page(
+                ProveedorBase,
+                [],
                 total_items=total_items,
-                page=page,
-                page_size=page_size,
+                page=paging.page,
+                page_size=paging.page_size,
                 total_pages=total_pages
             )
+            await cache.set(cache_key, rendered)
+            return envelope_response(rendered, paging.etag)
 
-        return APIResponsePaginated(
-            success=True,
-            data=[ProveedorBase(**proveedor) for proveedor in proveedores],
+        rendered = render_page(
+            ProveedorBase,
+            proveedores,
             total_items=total_items,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages
+            page=paging.page,
+            page_size=paging.page_size,
+            total_pages=total_pages,
+            next_cursor=next_cursor(proveedores, "id", paging.page_size)
         )
+        await cache.set(cache_key, rendered)
+        return envelope_response(rendered, paging.etag)
     except mysql.connector.Error as err:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.get(
     "/{proveedor_id}",
@@ -89,34 +111,42 @@ def get_proveedores_endpoint(
     response_model=APIResponse[ProveedorBase],
     dependencies=[Depends(get_current_admin_user)]
 )
-def get_proveedor_by_id_endpoint(proveedor_id: int, db=Depends(get_db)):
+async def get_proveedor_by_id_endpoint(
+    proveedor_id: int,
+    etag: Optional[str] = Depends(conditional_get("proveedores")),
+    db=Depends(get_db)
+):
     """
     Endpoint to retrieve a proveedor by its ID.
     """
+    cache_key = ("id", proveedor_id)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return envelope_response(cached, etag)
+
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
         query = "SELECT * FROM proveedores WHERE id = %s"
-        cursor.execute(query, (proveedor_id,))
+        await cursor.execute(query, (proveedor_id,))
 
-        proveedor = cursor.fetchone()
+        proveedor = await cursor.fetchone()
         if not proveedor:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Proveedor not found"
             )
 
-        return APIResponse(
-            success=True,
-            data=ProveedorBase(**proveedor)
-        )
+        rendered = render_item(ProveedorBase, proveedor)
+        await cache.set(cache_key, rendered)
+        return envelope_response(rendered, etag)
     except mysql.connector.Error as err:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.post(
     "/",
@@ -125,20 +155,21 @@ def get_proveedor_by_id_endpoint(proveedor_id: int, db=Depends(get_db)):
     response_model=APIResponse[ProveedorBase],
     dependencies=[Depends(get_current_admin_user)]
 )
-def create_proveedor_endpoint(proveedor: ProveedorCreate, db=Depends(get_db)):
+async def create_proveedor_endpoint(proveedor: ProveedorCreate, db=Depends(get_db)):
     """
     Endpoint to create a new proveedor.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
         query = "INSERT INTO proveedores (nombre, contacto) VALUES (%s, %s)"
-        cursor.execute(query, (proveedor.nombre, proveedor.contacto))
-        db.commit()
+        await cursor.execute(query, (proveedor.nombre, proveedor.contacto))
+        await db.commit()
+        invalidate_count("proveedores")
+        await cache.invalidate()
 
-        # proveedor.id = cursor.lastrowid
         return APIResponse(
             success=True,
-            data=ProveedorCreate(**proveedor.dict())
+            data=ProveedorCreate(**proveedor.dict(exclude={"id"}), id=cursor.lastrowid)
         )
     except mysql.connector.Error as err:
         raise HTTPException(
@@ -146,8 +177,8 @@ def create_proveedor_endpoint(proveedor: ProveedorCreate, db=Depends(get_db)):
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.put(
     "/{proveedor_id}",
@@ -156,15 +187,20 @@ def create_proveedor_endpoint(proveedor: ProveedorCreate, db=Depends(get_db)):
     response_model=APIResponse[ProveedorBase],
     dependencies=[Depends(get_current_admin_user)]
 )
-def update_proveedor_endpoint(proveedor_id: int, proveedor: ProveedorUpdate, db=Depends(get_db)):
+async def update_proveedor_endpoint(
+    proveedor_id: int,
+    proveedor: ProveedorUpdate,
+    db=Depends(get_db)
+):
     """
     Endpoint to update an existing proveedor.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
         query = "UPDATE proveedores SET nombre = %s, contacto = %s WHERE id = %s"
-        cursor.execute(query, (proveedor.nombre, proveedor.contacto, proveedor_id))
-        db.commit()
+        await cursor.execute(query, (proveedor.nombre, proveedor.contacto, proveedor_id))
+        await db.commit()
+        await cache.invalidate()
 
         if cursor.rowcount == 0:
             raise HTTPException(
@@ -182,8 +218,8 @@ def update_proveedor_endpoint(proveedor_id: int, proveedor: ProveedorUpdate, db=
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.delete(
     "/{proveedor_id}",
@@ -192,15 +228,17 @@ def update_proveedor_endpoint(proveedor_id: int, proveedor: ProveedorUpdate, db=
     response_model=APIResponse[MessageResponse],
     dependencies=[Depends(get_current_admin_user)]
 )
-def delete_proveedor_endpoint(proveedor_id: int, db=Depends(get_db)):
+async def delete_proveedor_endpoint(proveedor_id: int, db=Depends(get_db)):
     """
     Endpoint to delete a proveedor by its ID.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
         query = "DELETE FROM proveedores WHERE id = %s"
-        cursor.execute(query, (proveedor_id,))
-        db.commit()
+        await cursor.execute(query, (proveedor_id,))
+        await db.commit()
+        invalidate_count("proveedores")
+        await cache.invalidate()
 
         if cursor.rowcount == 0:
             raise HTTPException(
@@ -218,5 +256,5 @@ def delete_proveedor_endpoint(proveedor_id: int, db=Depends(get_db)):
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
@@ -12,16 +12,43 @@
     Returns:
         APIResponse: A response containing the created, updated, or retrieved registro de consumo.
         APIResponsePaginated: A paginated response containing a list of registros de consumo.
+        APIResponse[RegistroConsumoBulkResult]: The outcome of a bulk ingest, with per-row errors.
+        StreamingResponse: Every registro de consumo, streamed as CSV or NDJSON.
         MessageResponse: A response indicating the success of a delete operation.
 """
 
-import math
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Set, Tuple
+
 import mysql.connector
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 
+from app.config import settings
 from app.schemas.common import APIResponse, MessageResponse, APIResponsePaginated
-from app.schemas.registro_consumo import RegistroConsumoBase, RegistroConsumoCreate
-from app.dependencies import get_db
+from app.schemas.registro_consumo import (
+    RegistroConsumoBase,
+    RegistroConsumoCreate,
+    RegistroConsumoBulkError,
+    RegistroConsumoBulkResult
+)
+from app.utils.consumo_mensual import apply_consumo_deltas, consumo_delta
+from app.utils.cache_backend import invalidate_namespaces
+from app.utils.conditional import conditional_get
+from app.utils.pagination import (
+    build_page_query,
+    count_rows,
+    invalidate_count,
+    next_cursor,
+    page_count,
+    PageRequest,
+    page_request
+)
+from app.utils.export import ExportFormat, date_range_filter, stream_query
+from app.utils.serialization import paginated_response
+from app.dependencies import get_db, get_current_admin_user
 
 router = APIRouter()
 
@@ -31,45 +58,46 @@ router = APIRouter()
     tags=["Registros de Consumo"],
     response_model=APIResponsePaginated[RegistroConsumoBase]
 )
-def get_registros_consumo_endpoint(
-    page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(10, ge=1, le=100, description="Items per page"),
+async def get_registros_consumo_endpoint(
+    paging: PageRequest = Depends(page_request("registro_consumo")),
     db=Depends(get_db)
 ):
     """
     Endpoint to retrieve all registros de consumo.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
 
-        count_query = "SELECT COUNT(*) as total FROM registro_consumo"
-        cursor.execute(count_query)
-        total_items = cursor.fetchone()['total']
+        total_items = await count_rows(cursor, "registro_consumo", paging.count)
 
-        offset = (page - 1) * page_size
-        query = "SELECT * FROM registro_consumo LIMIT %s OFFSET %s"
-        cursor.execute(query, (page_size, offset))
+        query, params = build_page_query(
+            "SELECT * FROM registro_consumo", "id", paging.page, paging.page_size, paging.after
+        )
+        await cursor.execute(query, params)
 
-        registros_consumo = cursor.fetchall()
-        total_pages = math.ceil(total_items / page_size) if total_items > 0 else 1
+        registros_consumo = await cursor.fetchall()
+        total_pages = page_count(total_items, paging.page_size)
 
         if not registros_consumo:
-            return APIResponsePaginated(
-                success=True,
-                data=[],
+            return paginated_response(
+                RegistroConsumoBase,
+                [],
+                etag=paging.etag,
                 total_items=total_items,
-                page=page,
-                page_size=page_size,
+                page=paging.page,
+                page_size=paging.page_size,
                 total_pages=total_pages
             )
 
-        return APIResponsePaginated(
-            success=True,
-            data=[RegistroConsumoBase(**registro) for registro in registros_consumo],
+        return paginated_response(
+            RegistroConsumoBase,
+            registros_consumo,
+            etag=paging.etag,
             total_items=total_items,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages
+            page=paging.page,
+            page_size=paging.page_size,
+            total_pages=total_pages,
+            next_cursor=next_cursor(registros_consumo, "id", paging.page_size)
         )
     except mysql.connector.Error as err:
         raise HTTPException(
@@ -77,24 +105,61 @@ def get_registros_consumo_endpoint(
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
+
+@router.get(
+    "/export",
+    summary="Export Registros de Consumo",
+    tags=["Registros de Consumo"],
+    response_class=StreamingResponse,
+    dependencies=[Depends(get_current_admin_user)]
+)
+async def export_registros_consumo_endpoint(
+    export_format: ExportFormat = Query(
+        ExportFormat.NDJSON,
+        alias="format",
+        description="Output format: ndjson or csv"
+    ),
+    desde: Optional[datetime] = Query(None, description="Only rows with fecha >= desde"),
+    hasta: Optional[datetime] = Query(None, description="Only rows with fecha < hasta")
+):
+    """
+    Endpoint to export registro_consumo as CSV or NDJSON.
+    Rows are streamed from an unbuffered cursor, so memory usage is constant
+    regardless of the table size.
+    """
+    where, params = date_range_filter("fecha", desde, hasta)
+    order = "fecha, id" if where else "id"
+    try:
+        return await stream_query(
+            f"SELECT * FROM registro_consumo {where} ORDER BY {order}",
+            params,
+            export_format,
+            "registros-consumo"
+        )
+    except mysql.connector.Error as err:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Database connection error: {err}"
+        ) from err
 
 @router.get(
     "/{id_consumo}",
     summary="Get Registro de Consumo by ID",
     tags=["Registros de Consumo"],
-    response_model=APIResponse[RegistroConsumoBase]
+    response_model=APIResponse[RegistroConsumoBase],
+    dependencies=[Depends(conditional_get("registro_consumo"))]
 )
-def get_registro_consumo_by_id_endpoint(id_consumo: int, db=Depends(get_db)):
+async def get_registro_consumo_by_id_endpoint(id_consumo: int, db=Depends(get_db)):
     """
     Endpoint to retrieve a registro de consumo by its ID.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
         query = "SELECT * FROM registro_consumo WHERE id = %s"
-        cursor.execute(query, (id_consumo,))
-        registro_consumo = cursor.fetchone()
+        await cursor.execute(query, (id_consumo,))
+        registro_consumo = await cursor.fetchone()
 
         if not registro_consumo:
             raise HTTPException(
@@ -112,8 +177,8 @@ def get_registro_consumo_by_id_endpoint(id_consumo: int, db=Depends(get_db)):
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.post(
     "/",
@@ -121,25 +186,35 @@ def get_registro_consumo_by_id_endpoint(id_consumo: int, db=Depends(get_db)):
     tags=["Registros de Consumo"],
     response_model=APIResponse[RegistroConsumoBase]
 )
-def create_registro_consumo_endpoint(registro_consumo: RegistroConsumoCreate, db=Depends(get_db)):
+async def create_registro_consumo_endpoint(
+    registro_consumo: RegistroConsumoCreate,
+    db=Depends(get_db)
+):
     """
     Endpoint to create a new registro de consumo.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
         insert_query = """
             INSERT INTO registro_consumo (id_maquina, id_insumo, fecha, cantidad_usada)
             VALUES (%s, %s, %s, %s)
-            RETURNING id
         """
-        cursor.execute(insert_query, (
+        await cursor.execute(insert_query, (
             registro_consumo.id_maquina,
             registro_consumo.id_insumo,
             registro_consumo.fecha,
             registro_consumo.cantidad_usada
         ))
-        db.commit()
-        new_id = cursor.fetchone()['id']
+        new_id = cursor.lastrowid
+        await apply_consumo_deltas(cursor, [consumo_delta(
+            registro_consumo.id_maquina,
+            registro_consumo.id_insumo,
+            registro_consumo.fecha,
+            registro_consumo.cantidad_usada
+        )])
+        await db.commit()
+        invalidate_count("registro_consumo")
+        await invalidate_namespaces("registro_consumo")
 
         return APIResponse(
             success=True,
@@ -151,8 +226,190 @@ def create_registro_consumo_endpoint(registro_consumo: RegistroConsumoCreate, db
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
+
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+async def _read_bulk_items(request: Request) -> Tuple[List[Tuple[int, Any]], list]:
+    """
+    Read the records of a bulk request, sent either as a JSON array or as NDJSON.
+    Returns the decoded records with their position and the errors of undecodable lines.
+    """
+    items, errors = [], []
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+
+    if content_type in NDJSON_CONTENT_TYPES:
+        index, buffer = 0, b""
+        async for chunk in request.stream():
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                if line.strip():
+                    _decode_ndjson_line(line, index, items, errors)
+                    index += 1
+            if index > settings.BULK_INSERT_MAX_ROWS:
+                break
+        if buffer.strip():
+            _decode_ndjson_line(buffer, index, items, errors)
+        return items, errors
+
+    try:
+        payload = json.loads(await request.body())
+    except ValueError as err:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid JSON body: {err}"
+        ) from err
+
+    if not isinstance(payload, list):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Expected a JSON array of registros de consumo"
+        )
+    return list(enumerate(payload)), errors
+
+def _decode_ndjson_line(line: bytes, index: int, items: list, errors: list) -> None:
+    """Decode one NDJSON line into `items`, or record why it could not be decoded."""
+    try:
+        items.append((index, json.loads(line)))
+    except ValueError as err:
+        errors.append(RegistroConsumoBulkError(index=index, detail=f"Invalid JSON: {err}"))
+
+async def _existing_ids(cursor, table: str, ids: Set[int]) -> Set[int]:
+    """
+    Return which of `ids` exist in `table`, querying in batches to bound the statement size.
+    """
+    found = set()
+    ids = sorted(ids)
+    batch_size = settings.BULK_INSERT_BATCH_SIZE
+    for start in range(0, len(ids), batch_size):
+        batch = ids[start:start + batch_size]
+        placeholders = ", ".join(["%s"] * len(batch))
+        await cursor.execute(f"SELECT id FROM {table} WHERE id IN ({placeholders})", tuple(batch))
+        found.update(row['id'] for row in await cursor.fetchall())
+    return found
+
+def _validate_bulk_items(items: List[Tuple[int, Any]], errors: list) -> list:
+    """
+    Validate the decoded records, returning the valid ones with their position.
+    """
+    registros = []
+    for index, item in items:
+        try:
+            registros.append((index, RegistroConsumoCreate.model_validate(item)))
+        except ValidationError as err:
+            detail = "; ".join(
+                f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+                for error in err.errors()
+            )
+            errors.append(RegistroConsumoBulkError(index=index, detail=detail))
+    return registros
+
+async def _insertable_values(cursor, registros: list, errors: list) -> List[tuple]:
+    """
+    Return the INSERT parameters of the registros whose maquina and insumo exist.
+    """
+    maquinas = await _existing_ids(cursor, "maquinas", {r.id_maquina for _, r in registros})
+    insumos = await _existing_ids(cursor, "insumos", {r.id_insumo for _, r in registros})
+
+    values = []
+    for index, registro in registros:
+        if registro.id_maquina not in maquinas:
+            errors.append(RegistroConsumoBulkError(index=index, detail="Maquina not found"))
+        elif registro.id_insumo not in insumos:
+            errors.append(RegistroConsumoBulkError(index=index, detail="Insumo not found"))
+        else:
+            values.append((
+                registro.id_maquina,
+                registro.id_insumo,
+                registro.fecha,
+                registro.cantidad_usada
+            ))
+    return values
+
+@router.post(
+    "/bulk",
+    summary="Bulk Create Registros de Consumo",
+    tags=["Registros de Consumo"],
+    response_model=APIResponse[RegistroConsumoBulkResult],
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/RegistroConsumoCreate"}
+                    }
+                },
+                "application/x-ndjson": {
+                    "schema": {"type": "string", "description": "Un registro JSON por línea"}
+                }
+            }
+        }
+    }
+)
+async def bulk_create_registros_consumo_endpoint(
+    request: Request,
+    atomic: bool = Query(False, description="Reject the whole batch if any row is invalid"),
+    db=Depends(get_db)
+):
+    """
+    Endpoint to create many registros de consumo in a single transaction.
+    Rows are validated in one pass and inserted with multi-row INSERT statements;
+    invalid rows are reported by position and skipped unless `atomic` is set.
+    """
+    items, errors = await _read_bulk_items(request)
+    received = len(items) + len(errors)
+    if received > settings.BULK_INSERT_MAX_ROWS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"A bulk request accepts at most {settings.BULK_INSERT_MAX_ROWS} rows"
+        )
+
+    registros = _validate_bulk_items(items, errors)
+
+    cursor = None
+    try:
+        cursor = await db.cursor(dictionary=True)
+        values = await _insertable_values(cursor, registros, errors)
+
+        errors.sort(key=lambda error: error.index)
+        if atomic and errors:
+            values = []
+
+        insert_query = """
+            INSERT INTO registro_consumo (id_maquina, id_insumo, fecha, cantidad_usada)
+            VALUES (%s, %s, %s, %s)
+        """
+        batch_size = settings.BULK_INSERT_BATCH_SIZE
+        for start in range(0, len(values), batch_size):
+            await cursor.executemany(insert_query, values[start:start + batch_size])
+        await apply_consumo_deltas(cursor, (consumo_delta(*value) for value in values))
+        await db.commit()
+
+        if values:
+            invalidate_count("registro_consumo")
+            await invalidate_namespaces("registro_consumo")
+
+        return APIResponse(
+            success=not errors,
+            data=RegistroConsumoBulkResult(
+                received=received,
+                inserted=len(values),
+                errors=errors
+            )
+        )
+    except mysql.connector.Error as err:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Database connection error: {err}"
+        ) from err
+    finally:
+        if cursor is not None:
+            await cursor.close()
+        await db.close()
 
 @router.put(
     "/{id_consumo}",
@@ -160,7 +417,7 @@ def create_registro_consumo_endpoint(registro_consumo: RegistroConsumoCreate, db
     tags=["Registros de Consumo"],
     response_model=APIResponse[RegistroConsumoBase]
 )
-def update_registro_consumo_endpoint(
+async def update_registro_consumo_endpoint(
     id_consumo: int,
     registro_consumo: RegistroConsumoCreate,
     db=Depends(get_db)
@@ -169,32 +426,52 @@ def update_registro_consumo_endpoint(
     Endpoint to update an existing registro de consumo.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
+        await cursor.execute(
+            "SELECT * FROM registro_consumo WHERE id = %s FOR UPDATE",
+            (id_consumo,)
+        )
+        previous = await cursor.fetchone()
+
+        if not previous:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Registro de consumo not found"
+            )
+
         update_query = """
             UPDATE registro_consumo
             SET id_maquina = %s, id_insumo = %s, fecha = %s, cantidad_usada = %s
             WHERE id = %s
-            RETURNING id
         """
-        cursor.execute(update_query, (
+        await cursor.execute(update_query, (
             registro_consumo.id_maquina,
             registro_consumo.id_insumo,
             registro_consumo.fecha,
             registro_consumo.cantidad_usada,
             id_consumo
         ))
-        db.commit()
-        updated_id = cursor.fetchone()['id']
-
-        if not updated_id:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Registro de consumo not found"
+        await apply_consumo_deltas(cursor, [
+            consumo_delta(
+                previous['id_maquina'],
+                previous['id_insumo'],
+                previous['fecha'],
+                previous['cantidad_usada'],
+                sign=-1
+            ),
+            consumo_delta(
+                registro_consumo.id_maquina,
+                registro_consumo.id_insumo,
+                registro_consumo.fecha,
+                registro_consumo.cantidad_usada
             )
+        ])
+        await db.commit()
+        await invalidate_namespaces("registro_consumo")
 
         return APIResponse(
             success=True,
-            data=RegistroConsumoBase(id=updated_id, **registro_consumo.dict())
+            data=RegistroConsumoBase(id=id_consumo, **registro_consumo.dict())
         )
     except mysql.connector.Error as err:
         raise HTTPException(
@@ -202,8 +479,8 @@ def update_registro_consumo_endpoint(
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.delete(
     "/{id_consumo}",
@@ -211,22 +488,37 @@ def update_registro_consumo_endpoint(
     tags=["Registros de Consumo"],
     response_model=MessageResponse
 )
-def delete_registro_consumo_endpoint(id_consumo: int, db=Depends(get_db)):
+async def delete_registro_consumo_endpoint(id_consumo: int, db=Depends(get_db)):
     """
     Endpoint to delete a registro de consumo by its ID.
     """
     try:
-        cursor = db.cursor(dictionary=True)
-        delete_query = "DELETE FROM registro_consumo WHERE id = %s"
-        cursor.execute(delete_query, (id_consumo,))
-        db.commit()
+        cursor = await db.cursor(dictionary=True)
+        await cursor.execute(
+            "SELECT * FROM registro_consumo WHERE id = %s FOR UPDATE",
+            (id_consumo,)
+        )
+        previous = await cursor.fetchone()
 
-        if cursor.rowcount == 0:
+        if not previous:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Registro de consumo not found"
             )
 
+        delete_query = "DELETE FROM registro_consumo WHERE id = %s"
+        await cursor.execute(delete_query, (id_consumo,))
+        await apply_consumo_deltas(cursor, [consumo_delta(
+            previous['id_maquina'],
+            previous['id_insumo'],
+            previous['fecha'],
+            previous['cantidad_usada'],
+            sign=-1
+        )])
+        await db.commit()
+        invalidate_count("registro_consumo")
+        await invalidate_namespaces("registro_consumo")
+
         return MessageResponse(success=True, message="Registro de consumo deleted successfully")
     except mysql.connector.Error as err:
         raise HTTPException(
@@ -234,5 +526,5 @@ def delete_registro_consumo_endpoint(id_consumo: int, db=Depends(get_db)):
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
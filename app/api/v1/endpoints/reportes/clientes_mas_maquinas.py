@@ -14,6 +14,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.schemas.common import APIResponse
 from app.schemas.reporte import ClientesMasMaquinasResponse
+from app.utils.conditional import conditional_get
 from app.dependencies import get_db, get_current_admin_user
 
 router = APIRouter()
@@ -23,9 +24,12 @@ router = APIRouter()
     summary="Get Clients with Most Machines",
     tags=["Reportes"],
     response_model=APIResponse[List[ClientesMasMaquinasResponse]],
-    dependencies=[Depends(get_current_admin_user)]
+    dependencies=[
+        Depends(get_current_admin_user),
+        Depends(conditional_get("clientes", "maquinas"))
+    ]
 )
-def get_clients_with_most_machines(
+async def get_clients_with_most_machines(
     limit: int = Query(10, ge=1, description="Max return of clients"),
     db=Depends(get_db)
 ):
@@ -33,7 +37,7 @@ def get_clients_with_most_machines(
     Endpoint to retrieve the clients with the most machines.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
 
         query = """
             SELECT
@@ -45,8 +49,8 @@ def get_clients_with_most_machines(
             ORDER BY total_maquinas DESC
             LIMIT %s;
         """
-        cursor.execute(query, (limit,))
-        result = cursor.fetchall()
+        await cursor.execute(query, (limit,))
+        result = await cursor.fetchall()
 
         if not result:
             raise HTTPException(
@@ -63,5 +67,5 @@ def get_clients_with_most_machines(
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
@@ -1,4 +1,4 @@
-""" Endpoint to retrieve the monthly billing report for a specific client.
+""" Endpoints to retrieve the monthly billing report, for a specific client or for all of them.
 
     Raises:
         HTTPException: If there is a database connection error or 
@@ -6,24 +6,88 @@
 
     Returns:
         APIResponse: A response containing the monthly billing report for the client.
+        StreamingResponse: The billing report of every client, as NDJSON or CSV.
 """
 
 import mysql.connector
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
 from app.schemas.common import APIResponse
 from app.schemas.reporte import FacturacionMensualResponse
-from app.dependencies import get_db
+from app.utils.conditional import conditional_get
+from app.utils.export import ExportFormat, stream_query
+from app.dependencies import get_db, get_current_admin_user
 
 router = APIRouter()
 
+@router.get(
+    "/",
+    summary="Get Monthly Billing Report for All Clients",
+    tags=["Reportes"],
+    response_class=StreamingResponse,
+    dependencies=[Depends(get_current_admin_user)]
+)
+async def get_monthly_billing_report_all_clients(
+    month: int = Query(..., ge=1, le=12, description="Mes para el reporte (1-12)"),
+    year: int = Query(..., ge=2000, description="Año para el reporte (ej. 2025)"),
+    export_format: ExportFormat = Query(
+        ExportFormat.NDJSON,
+        alias="format",
+        description="Formato de salida: ndjson o csv"
+    )
+):
+    """
+    Endpoint to compute the monthly billing of every client with a single grouped query.
+    Clients with machines but no consumption in the month are billed their rent only.
+    Rows are streamed as they are read, ordered by cliente_id.
+    """
+    query = """
+        SELECT
+            c.id AS cliente_id,
+            c.nombre AS nombre_cliente,
+            alquiler.total_alquiler,
+            COALESCE(consumo.total_insumos, 0) AS total_insumos,
+            alquiler.total_alquiler + COALESCE(consumo.total_insumos, 0) AS total_a_cobrar
+        FROM clientes c
+        JOIN (
+            SELECT id_cliente, SUM(costo_alquiler_mensual) AS total_alquiler
+            FROM maquinas
+            GROUP BY id_cliente
+        ) alquiler ON alquiler.id_cliente = c.id
+        LEFT JOIN (
+            SELECT m.id_cliente, SUM(cm.cantidad_total * i.precio_unitario) AS total_insumos
+            FROM consumo_mensual cm
+            JOIN maquinas m ON m.id = cm.id_maquina
+            JOIN insumos i ON i.id = cm.id_insumo
+            WHERE cm.anio = %s AND cm.mes = %s
+            GROUP BY m.id_cliente
+        ) consumo ON consumo.id_cliente = c.id
+        ORDER BY c.id
+    """
+    try:
+        return await stream_query(
+            query,
+            (year, month),
+            export_format,
+            f"facturacion-{year}-{month:02d}"
+        )
+    except mysql.connector.Error as err:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Database connection error: {err}"
+        ) from err
+
 @router.get(
     "/{cliente_id}",
     summary="Get Monthly Billing Report",
     tags=["Reportes"],
-    response_model=APIResponse[FacturacionMensualResponse]
+    response_model=APIResponse[FacturacionMensualResponse],
+    dependencies=[
+        Depends(conditional_get("clientes", "maquinas", "insumos", "registro_consumo"))
+    ]
 )
-def get_monthly_billing_report(
+async def get_monthly_billing_report(
     cliente_id: int,
     month: int = Query(..., ge=1, le=12, description="Mes para el reporte (1-12)"),
     year: int = Query(..., ge=2000, description="Año para el reporte (ej. 2025)"),
@@ -31,26 +95,39 @@ def get_monthly_billing_report(
 ):
     """
     Endpoint to retrieve the monthly billing report for a specific client.
+    Consumption totals are read from the consumo_mensual rollup, and the rent of
+    each maquina of the client is counted once. A client with machines but no
+    consumption in the month is billed its rent only, as in the report of all clients.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
 
         query = """
-            SELECT 
+            SELECT
                 c.id AS cliente_id,
                 c.nombre AS nombre_cliente,
-                SUM(m.costo_alquiler_mensual) AS total_alquiler,
-                SUM(i.precio_unitario * rc.cantidad_usada) AS total_insumos,
-                SUM(m.costo_alquiler_mensual + (i.precio_unitario * rc.cantidad_usada)) AS total_a_cobrar
+                alquiler.total_alquiler,
+                COALESCE(consumo.total_insumos, 0) AS total_insumos,
+                alquiler.total_alquiler + COALESCE(consumo.total_insumos, 0) AS total_a_cobrar
             FROM clientes c
-            LEFT JOIN maquinas m ON c.id = m.id_cliente
-            LEFT JOIN registro_consumo rc ON m.id = rc.id_maquina
-            LEFT JOIN insumos i ON rc.id_insumo = i.id
-            WHERE c.id = %s AND MONTH(rc.fecha) = %s AND YEAR(rc.fecha) = %s
-            GROUP BY c.id;
+            JOIN (
+                SELECT id_cliente, SUM(costo_alquiler_mensual) AS total_alquiler
+                FROM maquinas
+                WHERE id_cliente = %s
+                GROUP BY id_cliente
+            ) alquiler ON alquiler.id_cliente = c.id
+            LEFT JOIN (
+                SELECT m.id_cliente, SUM(cm.cantidad_total * i.precio_unitario) AS total_insumos
+                FROM consumo_mensual cm
+                JOIN maquinas m ON m.id = cm.id_maquina
+                JOIN insumos i ON i.id = cm.id_insumo
+                WHERE cm.anio = %s AND cm.mes = %s AND m.id_cliente = %s
+                GROUP BY m.id_cliente
+            ) consumo ON consumo.id_cliente = c.id
+            WHERE c.id = %s;
         """
-        cursor.execute(query, (cliente_id, month, year))
-        result = cursor.fetchone()
+        await cursor.execute(query, (cliente_id, year, month, cliente_id, cliente_id))
+        result = await cursor.fetchone()
 
         if not result:
             raise HTTPException(
@@ -67,5 +144,5 @@ def get_monthly_billing_report(
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
@@ -8,12 +8,14 @@
         of the most consumed supplies with their total quantities and costs.
 """
 
-from typing import List
+from typing import List, Optional
 import mysql.connector
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.schemas.common import APIResponse
 from app.schemas.reporte import InsumosMasConsumidosResponse
+from app.utils.periodos import month_range, year_range
+from app.utils.conditional import conditional_get
 from app.dependencies import get_db, get_current_admin_user
 
 router = APIRouter()
@@ -23,31 +25,50 @@ router = APIRouter()
     summary="Get Most Consumed Supplies",
     tags=["Reportes"],
     response_model=APIResponse[List[InsumosMasConsumidosResponse]],
-    dependencies=[Depends(get_current_admin_user)]
+    dependencies=[
+        Depends(get_current_admin_user),
+        Depends(conditional_get("registro_consumo", "insumos"))
+    ]
 )
-def get_most_consumed_supplies(
+async def get_most_consumed_supplies(
     limit: int = Query(10, ge=1, description="Max return of insumos"),
+    month: Optional[int] = Query(None, ge=1, le=12, description="Mes para el reporte (1-12)"),
+    year: Optional[int] = Query(None, ge=2000, description="Año para el reporte (ej. 2025)"),
     db=Depends(get_db)
 ):
     """
-    Endpoint to retrieve the most consumed supplies for a specific month and year.
+    Endpoint to retrieve the most consumed supplies, optionally for a specific month and year.
+    The period is applied as a half-open range on fecha so the fecha indexes can be used.
     """
+    if month is not None and year is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The month filter requires a year."
+        )
+
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
+
+        if year is None:
+            where, params = "", ()
+        else:
+            start, end = year_range(year) if month is None else month_range(year, month)
+            where, params = "WHERE rc.fecha >= %s AND rc.fecha < %s", (start, end)
 
-        query = """
+        query = f"""
             SELECT
                 i.descripcion AS insumo_descripcion,
                 SUM(rc.cantidad_usada) AS total_cantidad,
                 SUM(rc.cantidad_usada * i.precio_unitario) AS total_costo
             FROM registro_consumo rc
             JOIN insumos i ON rc.id_insumo = i.id
+            {where}
             GROUP BY i.id, i.descripcion
             ORDER BY total_cantidad DESC, total_costo DESC
             LIMIT %s;
         """
-        cursor.execute(query, (limit,))
-        result = cursor.fetchall()
+        await cursor.execute(query, params + (limit,))
+        result = await cursor.fetchall()
 
         if not result:
             raise HTTPException(
@@ -65,5 +86,5 @@ def get_most_consumed_supplies(
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
@@ -15,6 +15,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.schemas.common import APIResponse
 from app.schemas.reporte import TecnicosMasMantenimientosResponse
+from app.utils.conditional import conditional_get
 from app.dependencies import get_db, get_current_admin_user
 
 router = APIRouter()
@@ -24,9 +25,12 @@ router = APIRouter()
     summary="Get Technicians with Most Maintenances",
     tags=["Reportes"],
     response_model=APIResponse[List[TecnicosMasMantenimientosResponse]],
-    dependencies=[Depends(get_current_admin_user)]
+    dependencies=[
+        Depends(get_current_admin_user),
+        Depends(conditional_get("tecnicos", "mantenimientos"))
+    ]
 )
-def get_technicians_with_most_maintenances(
+async def get_technicians_with_most_maintenances(
     limit: int = Query(10, ge=1, description="Max return of technicians"),
     db=Depends(get_db)
 ):
@@ -34,7 +38,7 @@ def get_technicians_with_most_maintenances(
     Endpoint to retrieve the technicians with the most maintenance records.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
 
         query = """
             SELECT
@@ -46,8 +50,8 @@ def get_technicians_with_most_maintenances(
             ORDER BY mantenimientos_realizados DESC
             LIMIT %s;
         """
-        cursor.execute(query, (limit,))
-        result = cursor.fetchall()
+        await cursor.execute(query, (limit,))
+        result = await cursor.fetchall()
 
         if not result:
             raise HTTPException(
@@ -64,5 +68,5 @@ def get_technicians_with_most_maintenances(
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
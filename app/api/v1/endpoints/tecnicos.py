@@ -13,15 +13,29 @@
         APIResponsePaginated: A paginated response containing a list of tecnicos.
 """
 
-import math
+from typing import Optional
+
 import mysql.connector
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.schemas.common import APIResponse, MessageResponse, APIResponsePaginated
 from app.schemas.tecnico import TecnicoBase, TecnicoCreate
+from app.utils.cache_backend import shared_cache
+from app.utils.conditional import conditional_get
+from app.utils.pagination import (
+    build_page_query,
+    count_rows,
+    invalidate_count,
+    next_cursor,
+    page_count,
+    PageRequest,
+    page_request
+)
+from app.utils.serialization import envelope_response, render_item, render_page
 from app.dependencies import get_db, get_current_admin_user
 
 router = APIRouter()
+cache = shared_cache("tecnicos")
 
 @router.get(
     "/",
@@ -30,54 +44,62 @@ router = APIRouter()
     response_model=APIResponsePaginated[TecnicoBase],
     dependencies=[Depends(get_current_admin_user)]
 )
-def get_tecnicos_endpoint(
-    page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(10, ge=1, le=100, description="Items per page"),
+async def get_tecnicos_endpoint(
+    paging: PageRequest = Depends(page_request("tecnicos")),
     db=Depends(get_db)
 ):
     """
     Endpoint to retrieve all tecnicos.
     """
+    cache_key = ("list", paging.page, paging.page_size, paging.after, paging.count)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return envelope_response(cached, paging.etag)
+
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
 
-        count_query = "SELECT COUNT(*) as total FROM tecnicos"
-        cursor.execute(count_query)
-        total_items = cursor.fetchone()['total']
+        total_items = await count_rows(cursor, "tecnicos", paging.count)
 
-        offset = (page - 1) * page_size
-        query = "SELECT * FROM tecnicos LIMIT %s OFFSET %s"
-        cursor.execute(query, (page_size, offset))
+        query, params = build_page_query(
+            "SELECT * FROM tecnicos", "ci", paging.page, paging.page_size, paging.after
+        )
+        await cursor.execute(query, params)
 
-        tecnicos = cursor.fetchall()
-        total_pages = math.ceil(total_items / page_size) if total_items > 0 else 1
+        tecnicos = await cursor.fetchall()
+        total_pages = page_count(total_items, paging.page_size)
 
         if not tecnicos:
-            return APIResponsePaginated(
-                success=True,
-                data=[],
+            rendered = render_page(
+                TecnicoBase,
+                [],
                 total_items=total_items,
-                page=page,
-                page_size=page_size,
+                page=paging.page,
+                page_size=paging.page_size,
                 total_pages=total_pages
             )
+            await cache.set(cache_key, rendered)
+            return envelope_response(rendered, paging.etag)
 
-        return APIResponsePaginated(
-            success=True,
-            data=[TecnicoBase(**tecnico) for tecnico in tecnicos],
+        rendered = render_page(
+            TecnicoBase,
+            tecnicos,
             total_items=total_items,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages
+            page=paging.page,
+            page_size=paging.page_size,
+            total_pages=total_pages,
+            next_cursor=next_cursor(tecnicos, "ci", paging.page_size)
         )
+        await cache.set(cache_key, rendered)
+        return envelope_response(rendered, paging.etag)
     except mysql.connector.Error as err:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.get(
     "/{tecnico_ci}",
@@ -86,15 +108,24 @@ def get_tecnicos_endpoint(
     response_model=APIResponse[TecnicoBase],
     dependencies=[Depends(get_current_admin_user)]
 )
-def get_tecnico_by_id_endpoint(tecnico_ci: int, db=Depends(get_db)):
+async def get_tecnico_by_id_endpoint(
+    tecnico_ci: int,
+    etag: Optional[str] = Depends(conditional_get("tecnicos")),
+    db=Depends(get_db)
+):
     """
     Endpoint to retrieve a tecnico by its CI.
     """
+    cache_key = ("id", tecnico_ci)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return envelope_response(cached, etag)
+
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
         query = "SELECT * FROM tecnicos WHERE ci = %s"
-        cursor.execute(query, (tecnico_ci,))
-        tecnico = cursor.fetchone()
+        await cursor.execute(query, (tecnico_ci,))
+        tecnico = await cursor.fetchone()
 
         if not tecnico:
             raise HTTPException(
@@ -102,18 +133,17 @@ def get_tecnico_by_id_endpoint(tecnico_ci: int, db=Depends(get_db)):
                 detail="Tecnico not found"
             )
 
-        return APIResponse(
-            success=True,
-            data=TecnicoBase(**tecnico)
-        )
+        rendered = render_item(TecnicoBase, tecnico)
+        await cache.set(cache_key, rendered)
+        return envelope_response(rendered, etag)
     except mysql.connector.Error as err:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.post(
     "/",
@@ -122,17 +152,17 @@ def get_tecnico_by_id_endpoint(tecnico_ci: int, db=Depends(get_db)):
     response_model=APIResponse[TecnicoBase],
     dependencies=[Depends(get_current_admin_user)]
 )
-def create_tecnico_endpoint(tecnico: TecnicoCreate, db=Depends(get_db)):
+async def create_tecnico_endpoint(tecnico: TecnicoCreate, db=Depends(get_db)):
     """
     Endpoint to create a new tecnico.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
         insert_query = """
             INSERT INTO tecnicos (ci, nombre, apellido, telefono)
             VALUES (%s, %s, %s, %s)
         """
-        cursor.execute(
+        await cursor.execute(
             insert_query,
             (
                 tecnico.ci,
@@ -141,10 +171,12 @@ def create_tecnico_endpoint(tecnico: TecnicoCreate, db=Depends(get_db)):
                 tecnico.telefono
             )
         )
-        db.commit()
+        await db.commit()
+        invalidate_count("tecnicos")
+        await cache.invalidate()
 
-        cursor.execute("SELECT * FROM tecnicos WHERE ci = %s", (tecnico.ci,))
-        created_tecnico = cursor.fetchone()
+        await cursor.execute("SELECT * FROM tecnicos WHERE ci = %s", (tecnico.ci,))
+        created_tecnico = await cursor.fetchone()
 
         if not created_tecnico:
             raise HTTPException(
@@ -162,8 +194,8 @@ def create_tecnico_endpoint(tecnico: TecnicoCreate, db=Depends(get_db)):
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.put(
     "/{tecnico_id}",
@@ -172,18 +204,18 @@ def create_tecnico_endpoint(tecnico: TecnicoCreate, db=Depends(get_db)):
     response_model=APIResponse[TecnicoBase],
     dependencies=[Depends(get_current_admin_user)]
 )
-def update_tecnico_endpoint(tecnico_id: int, tecnico: TecnicoCreate, db=Depends(get_db)):
+async def update_tecnico_endpoint(tecnico_id: int, tecnico: TecnicoCreate, db=Depends(get_db)):
     """
     Endpoint to update an existing tecnico.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
         update_query = """
             UPDATE tecnicos
             SET nombre = %s, apellido = %s, telefono = %s
             WHERE ci = %s
         """
-        cursor.execute(
+        await cursor.execute(
             update_query,
             (
                 tecnico.nombre,
@@ -192,7 +224,8 @@ def update_tecnico_endpoint(tecnico_id: int, tecnico: TecnicoCreate, db=Depends(
                 tecnico_id
             )
         )
-        db.commit()
+        await db.commit()
+        await cache.invalidate()
 
         if cursor.rowcount == 0:
             raise HTTPException(
@@ -200,8 +233,8 @@ def update_tecnico_endpoint(tecnico_id: int, tecnico: TecnicoCreate, db=Depends(
                 detail="Tecnico not found"
             )
 
-        cursor.execute("SELECT * FROM tecnicos WHERE ci = %s", (tecnico_id,))
-        updated_tecnico = cursor.fetchone()
+        await cursor.execute("SELECT * FROM tecnicos WHERE ci = %s", (tecnico_id,))
+        updated_tecnico = await cursor.fetchone()
 
         return APIResponse(
             success=True,
@@ -213,8 +246,8 @@ def update_tecnico_endpoint(tecnico_id: int, tecnico: TecnicoCreate, db=Depends(
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.delete(
     "/{tecnico_id}",
@@ -223,15 +256,17 @@ def update_tecnico_endpoint(tecnico_id: int, tecnico: TecnicoCreate, db=Depends(
     response_model=MessageResponse,
     dependencies=[Depends(get_current_admin_user)]
 )
-def delete_tecnico_endpoint(tecnico_id: int, db=Depends(get_db)):
+async def delete_tecnico_endpoint(tecnico_id: int, db=Depends(get_db)):
     """
     Endpoint to delete a tecnico by its CI.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
         delete_query = "DELETE FROM tecnicos WHERE ci = %s"
-        cursor.execute(delete_query, (tecnico_id,))
-        db.commit()
+        await cursor.execute(delete_query, (tecnico_id,))
+        await db.commit()
+        invalidate_count("tecnicos")
+        await cache.invalidate()
 
         if cursor.rowcount == 0:
             raise HTTPException(
@@ -249,5 +284,5 @@ def delete_tecnico_endpoint(tecnico_id: int, db=Depends(get_db)):
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
@@ -14,12 +14,23 @@
         containing a list of users.
 """
 
-import math
+from typing import Optional
+
 import mysql.connector
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.schemas.common import APIResponse, MessageResponse, APIResponsePaginated
 from app.schemas.user import UserBase, UserCreate, UserUpdate
+from app.utils.passwords import hash_password
+from app.utils.pagination import (
+    CountMode,
+    build_page_query,
+    count_rows,
+    invalidate_count,
+    next_cursor,
+    page_count
+)
+from app.utils.serialization import paginated_response
 from app.dependencies import get_db, get_current_admin_user
 
 router = APIRouter()
@@ -31,45 +42,47 @@ router = APIRouter()
     response_model=APIResponsePaginated[UserBase],
     dependencies=[Depends(get_current_admin_user)]
 )
-def get_users_endpoint(
+async def get_users_endpoint(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=100, description="Items per page"),
+    after: Optional[str] = Query(None, description="Cursor from next_cursor (keyset pagination)"),
+    count: CountMode = Query(CountMode.EXACT, description="exact, estimate or none"),
     db=Depends(get_db)
 ):
     """
     Endpoint to retrieve all users.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
 
-        count_query = "SELECT COUNT(*) as total FROM login"
-        cursor.execute(count_query)
-        total_items = cursor.fetchone()['total']
+        total_items = await count_rows(cursor, "login", count)
 
-        offset = (page - 1) * page_size
-        query = "SELECT correo, es_administrador FROM login LIMIT %s OFFSET %s"
-        cursor.execute(query, (page_size, offset))
+        query, params = build_page_query(
+            "SELECT correo, es_administrador FROM login", "correo", page, page_size, after
+        )
+        await cursor.execute(query, params)
 
-        users = cursor.fetchall()
-        total_pages = math.ceil(total_items / page_size) if total_items > 0 else 1
+        users = await cursor.fetchall()
+        total_pages = page_count(total_items, page_size)
 
         if not users:
-            return APIResponsePaginated(
-                success=True,
-                data=[],
+            return paginated_response(
+                UserBase,
+                [],
                 total_items=total_items,
                 page=page,
                 page_size=page_size,
                 total_pages=total_pages
             )
 
-        return APIResponsePaginated(
-            success=True,
-            data=[UserBase(**user) for user in users],
+        return paginated_response(
+            UserBase,
+            users,
             total_items=total_items,
             page=page,
             page_size=page_size,
-            total_pages=total_pages
+            total_pages=total_pages,
+            next_cursor=next_cursor(users, "correo", page_size)
         )
     except mysql.connector.Error as err:
         raise HTTPException(
@@ -77,8 +90,8 @@ def get_users_endpoint(
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.get(
     "/{user_correo}",
@@ -87,15 +100,15 @@ def get_users_endpoint(
     response_model=APIResponse[UserBase],
     dependencies=[Depends(get_current_admin_user)]
 )
-def get_user_by_email_endpoint(user_correo: str, db=Depends(get_db)):
+async def get_user_by_email_endpoint(user_correo: str, db=Depends(get_db)):
     """
     Endpoint to retrieve a user by their email.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
         query = "SELECT correo, es_administrador FROM login WHERE correo = %s"
-        cursor.execute(query, (user_correo,))
-        user = cursor.fetchone()
+        await cursor.execute(query, (user_correo,))
+        user = await cursor.fetchone()
 
         if not user:
             raise HTTPException(
@@ -113,8 +126,8 @@ def get_user_by_email_endpoint(user_correo: str, db=Depends(get_db)):
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.post(
     "/",
@@ -123,15 +136,17 @@ def get_user_by_email_endpoint(user_correo: str, db=Depends(get_db)):
     response_model=APIResponse[UserBase],
     dependencies=[Depends(get_current_admin_user)]
 )
-def create_user_endpoint(user: UserCreate, db=Depends(get_db)):
+async def create_user_endpoint(user: UserCreate, db=Depends(get_db)):
     """
     Endpoint to create a new user.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
+        hashed = await hash_password(user.contraseña)
         query = "INSERT INTO login (correo, contraseña, es_administrador) VALUES (%s, %s, %s)"
-        cursor.execute(query, (user.correo, user.contraseña, user.es_administrador))
-        db.commit()
+        await cursor.execute(query, (user.correo, hashed, user.es_administrador))
+        await db.commit()
+        invalidate_count("login")
 
         if cursor.rowcount == 0:
             raise HTTPException(
@@ -150,8 +165,8 @@ def create_user_endpoint(user: UserCreate, db=Depends(get_db)):
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.put(
     "/{user_correo}",
@@ -160,15 +175,15 @@ def create_user_endpoint(user: UserCreate, db=Depends(get_db)):
     response_model=APIResponse[UserBase],
     dependencies=[Depends(get_current_admin_user)]
 )
-def update_user_endpoint(user_correo: str, user: UserUpdate, db=Depends(get_db)):
+async def update_user_endpoint(user_correo: str, user: UserUpdate, db=Depends(get_db)):
     """
     Endpoint to update an existing user by their email.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
         query = "UPDATE login SET es_administrador = %s WHERE correo = %s"
-        cursor.execute(query, (user.es_administrador, user_correo))
-        db.commit()
+        await cursor.execute(query, (user.es_administrador, user_correo))
+        await db.commit()
 
         if cursor.rowcount == 0:
             raise HTTPException(
@@ -187,8 +202,8 @@ def update_user_endpoint(user_correo: str, user: UserUpdate, db=Depends(get_db))
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
 
 @router.delete(
     "/{user_correo}",
@@ -197,15 +212,16 @@ def update_user_endpoint(user_correo: str, user: UserUpdate, db=Depends(get_db))
     response_model=MessageResponse,
     dependencies=[Depends(get_current_admin_user)]
 )
-def delete_user_endpoint(user_correo: str, db=Depends(get_db)):
+async def delete_user_endpoint(user_correo: str, db=Depends(get_db)):
     """
     Endpoint to delete a user by their email.
     """
     try:
-        cursor = db.cursor(dictionary=True)
+        cursor = await db.cursor(dictionary=True)
         query = "DELETE FROM login WHERE correo = %s"
-        cursor.execute(query, (user_correo,))
-        db.commit()
+        await cursor.execute(query, (user_correo,))
+        await db.commit()
+        invalidate_count("login")
 
         if cursor.rowcount == 0:
             raise HTTPException(
@@ -223,5 +239,5 @@ def delete_user_endpoint(user_correo: str, db=Depends(get_db)):
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        cursor.close()
-        db.close()
+        await cursor.close()
+        await db.close()
@@ -3,6 +3,8 @@
     This module uses Pydantic to manage application settings and environment variables.
 """
 
+from typing import List
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -13,10 +15,47 @@ class Settings(BaseSettings):
         DATABASE_USER (str): The username used to connect to the database.
         DATABASE_PASSWORD (str): The password used to authenticate with the database.
         DATABASE_NAME (str): The name of the database to connect to.
+        DATABASE_POOL_MIN_SIZE (int): Connections opened eagerly and kept idle in the pool.
+        DATABASE_POOL_MAX_SIZE (int): Upper bound of connections the pool may open.
+        DATABASE_POOL_TIMEOUT (float): Seconds to wait for a free connection before failing.
+        DATABASE_POOL_MAX_LIFETIME (int): Seconds after which a connection is recycled.
+        DATABASE_POOL_PRE_PING (bool): Whether to ping a connection before handing it out.
+        COUNT_CACHE_TTL (float): Seconds a cached COUNT(*) of a paginated list stays valid.
+        CATALOG_CACHE_TTL (float): Seconds catalog reads (insumos, clientes...) stay cached.
+        CATALOG_CACHE_MAX_ENTRIES (int): Entries kept per catalog cache before LRU eviction.
+        CACHE_BACKEND (str): Backend shared by the routers, "memory" or "redis". Use
+        "redis" with more than one worker; conditional GETs (304 answers from table
+        versions) are only enabled with it.
+        REDIS_URL (str): Redis URL used by the redis cache backend.
+        CACHE_INVALIDATION_CHANNEL (str): Pub/sub channel carrying cache invalidations.
+        CACHE_LOCAL_TTL (float): Seconds the redis backend serves an entry from its local copy.
+        TABLE_VERSION_TTL (float): Seconds a table version lives in Redis without being bumped.
+        JSON_RESPONSE_CLASS (str): Default response class, "orjson" or "standard" (json.dumps).
+        COMPRESSION_ENCODINGS (list[str]): Response codings offered, by preference
+        ("br" and "zstd" are used only when brotli and zstandard are installed).
+        COMPRESSION_MIN_SIZE (int): Bytes below which a response is sent uncompressed.
+        COMPRESSION_CONTENT_TYPES (list[str]): Media types eligible for compression.
+        SLOW_QUERY_THRESHOLD (float): Seconds above which a SQL statement is logged,
+        0 to disable the slow-query log.
+        QUERY_STATS_MAX_FINGERPRINTS (int): Distinct statements tracked by the query statistics.
+        TRACING_EXPORTER (str): Where finished spans go, "none", "memory" or "file".
+        TRACING_SAMPLE_RATIO (float): Share of new traces recorded; traces continued
+        from a traceparent header follow the caller's decision.
+        TRACING_FILE (str): JSON lines file written by the file exporter.
+        TRACING_MEMORY_MAX_SPANS (int): Finished spans kept by the memory exporter.
+        BULK_INSERT_MAX_ROWS (int): Maximum number of rows accepted by a bulk ingest request.
+        BULK_INSERT_BATCH_SIZE (int): Rows sent to MySQL per multi-row INSERT statement.
+        PASSWORD_HASH_WORKERS (int): Worker processes used to hash and verify passwords.
         JWT_SECRET_KEY (str): Secret key used for encoding and decoding JWT tokens.
         JWT_ALGORITHM (str): Algorithm used for JWT token encoding (default: "HS256").
         JWT_ACCESS_TOKEN_EXPIRE_MINUTES (int): Expiration time
         for JWT access tokens in minutes (default: 30).
+        JWT_REFRESH_TOKEN_EXPIRE_MINUTES (int): Lifetime of the single-use refresh tokens.
+        TOKEN_DENYLIST_MAX_ENTRIES (int): Used refresh tokens remembered per process
+        by the memory cache backend.
+        JWT_BACKEND (str): JWT codec, "jose", "pyjwt" or "hs256" (standard library, HS256 only).
+        TOKEN_CACHE_TTL (float): Upper bound, in seconds, for caching a verified JWT payload.
+        TOKEN_CACHE_MAX_ENTRIES (int): Verified tokens kept before LRU eviction.
         model_config: Configuration for loading environment variables
         from a .env file and ignoring extra fields.
     """
@@ -26,9 +65,57 @@ class Settings(BaseSettings):
     DATABASE_PASSWORD: str
     DATABASE_NAME: str
 
+    DATABASE_POOL_MIN_SIZE: int = 1
+    DATABASE_POOL_MAX_SIZE: int = 10
+    DATABASE_POOL_TIMEOUT: float = 5.0
+    DATABASE_POOL_MAX_LIFETIME: int = 1800
+    DATABASE_POOL_PRE_PING: bool = True
+
+    COUNT_CACHE_TTL: float = 30.0
+
+    CATALOG_CACHE_TTL: float = 60.0
+    CATALOG_CACHE_MAX_ENTRIES: int = 1024
+
+    CACHE_BACKEND: str = "memory"
+    REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_INVALIDATION_CHANNEL: str = "marloy:cache:invalidate"
+    CACHE_LOCAL_TTL: float = 5.0
+    TABLE_VERSION_TTL: float = 600.0
+
+    JSON_RESPONSE_CLASS: str = "orjson"
+
+    COMPRESSION_ENCODINGS: List[str] = ["br", "zstd", "gzip"]
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_CONTENT_TYPES: List[str] = [
+        "application/json",
+        "application/x-ndjson",
+        "text/csv",
+        "text/plain",
+        "text/html"
+    ]
+
+    SLOW_QUERY_THRESHOLD: float = 0.5
+    QUERY_STATS_MAX_FINGERPRINTS: int = 1000
+
+    TRACING_EXPORTER: str = "none"
+    TRACING_SAMPLE_RATIO: float = 1.0
+    TRACING_FILE: str = "traces.jsonl"
+    TRACING_MEMORY_MAX_SPANS: int = 10_000
+
+    BULK_INSERT_MAX_ROWS: int = 100_000
+    BULK_INSERT_BATCH_SIZE: int = 5_000
+
+    PASSWORD_HASH_WORKERS: int = 2
+
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
+    JWT_BACKEND: str = "jose"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    JWT_REFRESH_TOKEN_EXPIRE_MINUTES: int = 720
+    TOKEN_DENYLIST_MAX_ENTRIES: int = 200_000
+
+    TOKEN_CACHE_TTL: float = 300.0
+    TOKEN_CACHE_MAX_ENTRIES: int = 4096
 
     model_config = SettingsConfigDict(env_file='.env', extra='ignore')
 
@@ -1,29 +1,305 @@
-""" 
+"""
     Get a MySQL database connection.
-    This function establishes a connection to the MySQL database using the configuration
+    This module keeps a pool of MySQL connections configured from the application settings,
+    so requests borrow an already authenticated connection instead of opening a new one.
 
     Returns:
-        mysql.connector.connection.MySQLConnection: A MySQL connection object.
-        
+        PooledConnection: A pooled MySQL connection, returned to the pool when closed.
+
     Raises:
         mysql.connector.Error: If there is an error connecting to the database.
+        PoolTimeoutError: If no connection becomes available within the checkout timeout.
 """
 
+import threading
+import time
+from collections import deque
+from typing import NamedTuple
+
 import mysql.connector
+from mysql.connector.errors import PoolError
+
 from app.config import settings
 
+class PoolTimeoutError(PoolError):
+    """Raised when no pooled connection is released before the checkout timeout."""
+
+class PooledConnection:
+    """
+    Proxy around a MySQL connection borrowed from a ConnectionPool.
+    Every attribute is delegated to the underlying connection, except close(),
+    which hands the connection back to the pool instead of closing the socket.
+    """
+
+    def __init__(self, owner, connection, created_at):
+        self._pool = owner
+        self._connection = connection
+        self._created_at = created_at
+
+    def __getattr__(self, name):
+        if self._connection is None:
+            raise mysql.connector.errors.OperationalError("Connection already returned to pool")
+        return getattr(self._connection, name)
+
+    def is_connected(self):
+        """Return whether the borrowed connection is still usable."""
+        return self._connection is not None and self._connection.is_connected()
+
+    def close(self):
+        """Return the connection to the pool. Calling it more than once is a no-op."""
+        if self._connection is None:
+            return
+        connection, self._connection = self._connection, None
+        self._pool.release(connection, self._created_at)
+
+class PoolConfig(NamedTuple):
+    """
+    Sizing and recycling settings of a connection pool.
+
+    Attributes:
+        min_size (int): Connections opened eagerly on first use and kept idle.
+        max_size (int): Maximum number of connections open at the same time.
+        timeout (float): Seconds to wait for a connection when the pool is exhausted.
+        max_lifetime (int): Seconds after which a connection is closed and replaced.
+        pre_ping (bool): Whether to ping idle connections before handing them out.
+    """
+
+    min_size: int = 1
+    max_size: int = 10
+    timeout: float = 5.0
+    max_lifetime: int = 1800
+    pre_ping: bool = True
+
+class BasePool:
+    """
+    Bookkeeping shared by the sync and the async connection pools: the settings,
+    the idle connections, how many connections are open, the expiry check and the
+    usage statistics. Subclasses add the locking and the database I/O, and call the
+    underscore methods while holding their lock.
+
+    Args:
+        min_size (int): Connections opened eagerly on first use and kept idle.
+        max_size (int): Maximum number of connections open at the same time.
+        timeout (float): Seconds to wait for a connection when the pool is exhausted.
+        max_lifetime (int): Seconds after which a connection is closed and replaced.
+        pre_ping (bool): Whether to ping idle connections before handing them out.
+        **connect_kwargs: Arguments forwarded to the connect() function of the driver.
+    """
+
+    def __init__(
+        self,
+        min_size=1,
+        max_size=10,
+        timeout=5.0,
+        max_lifetime=1800,
+        pre_ping=True,
+        **connect_kwargs
+    ):
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError("Invalid pool size configuration")
+
+        self.config = PoolConfig(min_size, max_size, timeout, max_lifetime, pre_ping)
+        self._connect_kwargs = connect_kwargs
+        self._idle = deque()
+        self._size = 0
+        self._filled = False
+
+    @property
+    def max_size(self):
+        """Maximum number of connections open at the same time."""
+        return self.config.max_size
+
+    def _is_expired(self, created_at):
+        if self.config.max_lifetime <= 0:
+            return False
+        return time.monotonic() - created_at >= self.config.max_lifetime
+
+    def _reserve_min_size(self):
+        """Mark the pool as filled and count the connections still missing as open."""
+        self._filled = True
+        missing = max(self.config.min_size - self._size, 0)
+        self._size += missing
+        return missing
+
+    def _is_exhausted(self):
+        return not self._idle and self._size >= self.config.max_size
+
+    def _take(self):
+        """Pop an idle connection, or reserve room for a new one and return (None, None)."""
+        if self._idle:
+            return self._idle.pop()
+        self._size += 1
+        return None, None
+
+    def _timeout_error(self):
+        return PoolTimeoutError(
+            msg=f"No database connection available after {self.config.timeout}s"
+        )
+
+    def _drain(self):
+        """Forget the idle connections and return them, to be closed by the caller."""
+        idle, self._idle = self._idle, deque()
+        self._size -= len(idle)
+        self._filled = False
+        return idle
+
+    def stats(self):
+        """Return a snapshot of the pool usage."""
+        return {
+            "size": self._size,
+            "idle": len(self._idle),
+            "in_use": self._size - len(self._idle),
+            "max_size": self.config.max_size,
+        }
+
+class ConnectionPool(BasePool):
+    """
+    Thread-safe pool of MySQL connections.
+
+    Args:
+        min_size (int): Connections opened eagerly on first use and kept idle.
+        max_size (int): Maximum number of connections open at the same time.
+        timeout (float): Seconds to wait for a connection when the pool is exhausted.
+        max_lifetime (int): Seconds after which a connection is closed and replaced.
+        pre_ping (bool): Whether to ping idle connections before handing them out.
+        **connect_kwargs: Arguments forwarded to mysql.connector.connect().
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._condition = threading.Condition()
+
+    def _open(self):
+        connection = mysql.connector.connect(**self._connect_kwargs)
+        return connection, time.monotonic()
+
+    def _is_healthy(self, connection):
+        if not self.config.pre_ping:
+            return True
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except mysql.connector.Error:
+            return False
+
+    @staticmethod
+    def _discard(connection):
+        try:
+            connection.close()
+        except mysql.connector.Error:
+            pass
+
+    def _fill(self):
+        """Open min_size connections the first time the pool is used."""
+        with self._condition:
+            if self._filled:
+                return
+            missing = self._reserve_min_size()
+
+        opened = 0
+        try:
+            for _ in range(missing):
+                connection, created_at = self._open()
+                opened += 1
+                with self._condition:
+                    self._idle.append((connection, created_at))
+                    self._condition.notify()
+        finally:
+            with self._condition:
+                self._size -= missing - opened
+
+    def acquire(self):
+        """
+        Borrow a connection from the pool, opening a new one if the pool is not full.
+
+        Raises:
+            PoolTimeoutError: If the pool stays exhausted for longer than the timeout.
+        """
+        if not self._filled:
+            self._fill()
+
+        deadline = time.monotonic() + self.config.timeout
+        while True:
+            with self._condition:
+                while self._is_exhausted():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise self._timeout_error()
+                    self._condition.wait(remaining)
+                connection, created_at = self._take()
+
+            if connection is None:
+                try:
+                    connection, created_at = self._open()
+                except Exception:
+                    self._forget()
+                    raise
+                return PooledConnection(self, connection, created_at)
+
+            if self._is_expired(created_at) or not self._is_healthy(connection):
+                self._discard(connection)
+                self._forget()
+                continue
+
+            return PooledConnection(self, connection, created_at)
+
+    def release(self, connection, created_at):
+        """Give a connection back to the pool, recycling it if it is broken or too old."""
+        reusable = not self._is_expired(created_at)
+        if reusable:
+            try:
+                if connection.unread_result:
+                    connection.consume_results()
+                if connection.in_transaction:
+                    connection.rollback()
+                reusable = connection.is_connected()
+            except mysql.connector.Error:
+                reusable = False
+
+        if not reusable:
+            self._discard(connection)
+            self._forget()
+            return
+
+        with self._condition:
+            self._idle.append((connection, created_at))
+            self._condition.notify()
+
+    def _forget(self):
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    def close(self):
+        """Close every idle connection. Borrowed connections are closed when released."""
+        with self._condition:
+            idle = self._drain()
+        for connection, _ in idle:
+            self._discard(connection)
+
+    def stats(self):
+        """Return a snapshot of the pool usage."""
+        with self._condition:
+            return super().stats()
+
+pool = ConnectionPool(
+    min_size=settings.DATABASE_POOL_MIN_SIZE,
+    max_size=settings.DATABASE_POOL_MAX_SIZE,
+    timeout=settings.DATABASE_POOL_TIMEOUT,
+    max_lifetime=settings.DATABASE_POOL_MAX_LIFETIME,
+    pre_ping=settings.DATABASE_POOL_PRE_PING,
+    host=settings.DATABASE_HOST,
+    user=settings.DATABASE_USER,
+    password=settings.DATABASE_PASSWORD,
+    database=settings.DATABASE_NAME,
+    charset='utf8mb4',
+    collation='utf8mb4_unicode_ci',
+)
+
 def get_database_connection():
-    """Create and return a MySQL database connection."""
+    """Borrow a MySQL database connection from the pool."""
     try:
-        connection = mysql.connector.connect(
-            host=settings.DATABASE_HOST,
-            user=settings.DATABASE_USER,
-            password=settings.DATABASE_PASSWORD,
-            database=settings.DATABASE_NAME,
-            charset='utf8mb4',
-            collation='utf8mb4_unicode_ci',
-        )
-        return connection
+        return pool.acquire()
     except mysql.connector.Error as err:
         print(f"Error on connecting to the database: {err}")
         raise
@@ -0,0 +1,232 @@
+"""
+    Get an asyncio MySQL database connection.
+    This module keeps a pool of mysql.connector.aio connections configured from the
+    application settings, so async endpoints can await the database without pinning
+    a threadpool worker per request.
+
+    Returns:
+        AsyncPooledConnection: A pooled async MySQL connection, returned to the pool when closed.
+
+    Raises:
+        mysql.connector.Error: If there is an error connecting to the database.
+        PoolTimeoutError: If no connection becomes available within the checkout timeout.
+"""
+
+import asyncio
+import time
+
+import mysql.connector
+from mysql.connector import aio
+
+from app.config import settings
+from app.database import BasePool
+from app.utils.query_stats import InstrumentedCursor
+
+class AsyncPooledConnection:
+    """
+    Proxy around an async MySQL connection borrowed from an AsyncConnectionPool.
+    Every attribute is delegated to the underlying connection, except close(),
+    which hands the connection back to the pool instead of closing the socket,
+    discard(), which throws it away, and cursor(), whose statements are recorded
+    for the metrics and query statistics.
+    """
+
+    def __init__(self, pool, connection, created_at):
+        self._pool = pool
+        self._connection = connection
+        self._created_at = created_at
+
+    def __getattr__(self, name):
+        if self._connection is None:
+            raise mysql.connector.errors.OperationalError("Connection already returned to pool")
+        return getattr(self._connection, name)
+
+    async def cursor(self, *args, **kwargs):
+        """Open a cursor on the borrowed connection, recording the statements it executes."""
+        if self._connection is None:
+            raise mysql.connector.errors.OperationalError("Connection already returned to pool")
+        return InstrumentedCursor(await self._connection.cursor(*args, **kwargs))
+
+    async def is_connected(self):
+        """Return whether the borrowed connection is still usable."""
+        return self._connection is not None and await self._connection.is_connected()
+
+    async def close(self):
+        """Return the connection to the pool. Calling it more than once is a no-op."""
+        if self._connection is None:
+            return
+        connection, self._connection = self._connection, None
+        await self._pool.release(connection, self._created_at)
+
+    async def discard(self):
+        """
+        Close the socket instead of returning the connection to the pool, for results
+        abandoned halfway whose pending rows are not worth reading. Calling it after
+        close() or discard() is a no-op.
+        """
+        if self._connection is None:
+            return
+        connection, self._connection = self._connection, None
+        await self._pool.discard(connection)
+
+class AsyncConnectionPool(BasePool):
+    """
+    asyncio pool of MySQL connections.
+
+    Args:
+        min_size (int): Connections opened eagerly on first use and kept idle.
+        max_size (int): Maximum number of connections open at the same time.
+        timeout (float): Seconds to wait for a connection when the pool is exhausted.
+        max_lifetime (int): Seconds after which a connection is closed and replaced.
+        pre_ping (bool): Whether to ping idle connections before handing them out.
+        **connect_kwargs: Arguments forwarded to mysql.connector.aio.connect().
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._condition = None
+
+    @property
+    def condition(self):
+        """Condition bound lazily so the pool can be created outside an event loop."""
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def _open(self):
+        connection = await aio.connect(**self._connect_kwargs)
+        return connection, time.monotonic()
+
+    async def _is_healthy(self, connection):
+        if not self.config.pre_ping:
+            return True
+        try:
+            await connection.ping(reconnect=False)
+            return True
+        except mysql.connector.Error:
+            return False
+
+    @staticmethod
+    async def _discard(connection):
+        try:
+            await connection.close()
+        except mysql.connector.Error:
+            pass
+
+    async def _fill(self):
+        """Open min_size connections the first time the pool is used."""
+        async with self.condition:
+            if self._filled:
+                return
+            missing = self._reserve_min_size()
+
+        opened = 0
+        try:
+            for _ in range(missing):
+                connection, created_at = await self._open()
+                opened += 1
+                async with self.condition:
+                    self._idle.append((connection, created_at))
+                    self.condition.notify()
+        finally:
+            async with self.condition:
+                self._size -= missing - opened
+
+    async def acquire(self):
+        """
+        Borrow a connection from the pool, opening a new one if the pool is not full.
+
+        Raises:
+            PoolTimeoutError: If the pool stays exhausted for longer than the timeout.
+        """
+        if not self._filled:
+            await self._fill()
+
+        deadline = time.monotonic() + self.config.timeout
+        while True:
+            async with self.condition:
+                while self._is_exhausted():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise self._timeout_error()
+                    try:
+                        await asyncio.wait_for(self.condition.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        pass
+                connection, created_at = self._take()
+
+            if connection is None:
+                try:
+                    connection, created_at = await self._open()
+                except BaseException:
+                    await self._forget()
+                    raise
+                return AsyncPooledConnection(self, connection, created_at)
+
+            if self._is_expired(created_at) or not await self._is_healthy(connection):
+                await self._discard(connection)
+                await self._forget()
+                continue
+
+            return AsyncPooledConnection(self, connection, created_at)
+
+    async def release(self, connection, created_at):
+        """Give a connection back to the pool, recycling it if it is broken or too old."""
+        reusable = not self._is_expired(created_at)
+        if reusable:
+            try:
+                if connection.unread_result:
+                    await connection.consume_results()
+                if connection.in_transaction:
+                    await connection.rollback()
+                reusable = await connection.is_connected()
+            except mysql.connector.Error:
+                reusable = False
+
+        if not reusable:
+            await self._discard(connection)
+            await self._forget()
+            return
+
+        async with self.condition:
+            self._idle.append((connection, created_at))
+            self.condition.notify()
+
+    async def discard(self, connection):
+        """Close a borrowed connection without reading its pending results and free its slot."""
+        await connection.shutdown()
+        await self._forget()
+
+    async def _forget(self):
+        async with self.condition:
+            self._size -= 1
+            self.condition.notify()
+
+    async def close(self):
+        """Close every idle connection. Borrowed connections are closed when released."""
+        async with self.condition:
+            idle = self._drain()
+        for connection, _ in idle:
+            await self._discard(connection)
+
+async_pool = AsyncConnectionPool(
+    min_size=settings.DATABASE_POOL_MIN_SIZE,
+    max_size=settings.DATABASE_POOL_MAX_SIZE,
+    timeout=settings.DATABASE_POOL_TIMEOUT,
+    max_lifetime=settings.DATABASE_POOL_MAX_LIFETIME,
+    pre_ping=settings.DATABASE_POOL_PRE_PING,
+    host=settings.DATABASE_HOST,
+    user=settings.DATABASE_USER,
+    password=settings.DATABASE_PASSWORD,
+    database=settings.DATABASE_NAME,
+    charset='utf8mb4',
+    collation='utf8mb4_unicode_ci',
+)
+
+async def get_async_database_connection():
+    """Borrow an async MySQL database connection from the pool."""
+    try:
+        return await async_pool.acquire()
+    except mysql.connector.Error as err:
+        print(f"Error on connecting to the database: {err}")
+        raise
@@ -6,26 +6,37 @@
         HTTPException: If there is a database connection error or if the user is not authenticated.
 
     Returns:
-        Generator: A generator that yields a database connection or the current user.
+        AsyncGenerator: An async generator that yields a database connection or the current user.
 
     Yields:
-        mysql.connector.connection.MySQLConnection: A MySQL database connection.
+        AsyncPooledConnection: An async MySQL database connection borrowed from the pool.
         dict: The current user information extracted from the JWT token.
 """
 
+import hashlib
+import time
+
 import mysql.connector
 from fastapi import HTTPException, Depends, status
 from fastapi.security import OAuth2PasswordBearer
 
-from app.database import get_database_connection
+from app.config import settings
+from app.database_async import get_async_database_connection
 from app.utils.auth import decode_access_token
+from app.utils.cache import get_cache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="v1/auth/login")
+token_cache = get_cache(
+    "tokens",
+    ttl=settings.TOKEN_CACHE_TTL,
+    max_entries=settings.TOKEN_CACHE_MAX_ENTRIES
+)
 
-def get_db():
-    """Dependency to get a database connection."""
+async def get_db():
+    """Dependency to borrow an async database connection from the pool and give it back."""
+    connection = None
     try:
-        connection = get_database_connection()
+        connection = await get_async_database_connection()
         yield connection
     except mysql.connector.Error as err:
         raise HTTPException(
@@ -33,16 +44,35 @@ def get_db():
             detail=f"Database connection error: {err}"
         ) from err
     finally:
-        if connection.is_connected():
-            connection.close()
+        if connection is not None:
+            await connection.close()
+
+def verify_token(token: str) -> dict:
+    """
+    Decode `token`, reusing the payload of a recently verified identical token.
+    Entries are keyed by the SHA-256 digest of the token and never outlive its exp claim.
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(key)
+    if payload is not None:
+        return payload
+
+    payload = decode_access_token(token)
+    if payload:
+        ttl = settings.TOKEN_CACHE_TTL
+        if "exp" in payload:
+            ttl = min(ttl, payload["exp"] - time.time())
+        if ttl > 0:
+            token_cache.set(key, payload, ttl)
+    return payload
 
-def get_current_user(token : str = Depends(oauth2_scheme)):
+async def get_current_user(token : str = Depends(oauth2_scheme)):
     """
     Dependency to get the current user from the JWT token.
     """
 
     try:
-        payload = decode_access_token(token)
+        payload = verify_token(token)
         if not payload:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -58,7 +88,7 @@ def get_current_user(token : str = Depends(oauth2_scheme)):
             headers={"WWW-Authenticate": "Bearer"},
         ) from e
 
-def get_current_admin_user(current_user: dict = Depends(get_current_user)):
+async def get_current_admin_user(current_user: dict = Depends(get_current_user)):
     """
     Dependency to ensure the current user is an admin.
     """
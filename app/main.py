@@ -1,11 +1,14 @@
 """
     Main entry point for the Marloy Café API.
-    This module initializes the FastAPI application, sets up CORS middleware,
+    This module initializes the FastAPI application, sets up CORS, compression, metrics
+    and tracing middleware,
 
     Returns:
         FastAPI: The FastAPI application instance.
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -15,18 +18,46 @@ from app.api.v1.endpoints import (
     insumos,
     clientes,
     maquinas,
+    metrics,
     registro_consumos,
     tecnicos,
     mantenimientos,
     users
 )
-from app.api.v1.endpoints.auth import login
+from app.api.v1.endpoints.auth import login, refresh
 from app.api.v1.endpoints.reportes import (
     facturacion_mensual,
     insumos_mas_consumidos,
     tecnicos_mas_mantenimientos,
     clientes_mas_maquinas
 )
+from app.config import settings
+from app.database import pool
+from app.database_async import async_pool
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.tracing import TracingMiddleware
+from app.utils.cache_backend import cache_backend
+from app.utils.metrics import register_route_templates
+from app.utils.passwords import shutdown_password_pool
+from app.utils.responses import default_response_class
+from app.utils.tracing import shutdown_tracing
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """
+    Application lifespan handler.
+    Starts the cache backend and closes it, together with the idle pooled database
+    connections, the password hashing processes and the trace exporter, when the
+    application shuts down.
+    """
+    await cache_backend.start()
+    yield
+    await cache_backend.close()
+    await async_pool.close()
+    pool.close()
+    shutdown_password_pool()
+    shutdown_tracing()
 
 app = FastAPI(
     title="Marloy API",
@@ -35,7 +66,9 @@ app = FastAPI(
     contact={
         "name": "Felipe Cabrera",
         "email": "me@felieppe.com"
-    }
+    },
+    lifespan=lifespan,
+    default_response_class=default_response_class()
 )
 
 origins = [
@@ -48,42 +81,60 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"]
 )
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MIN_SIZE,
+    encodings=settings.COMPRESSION_ENCODINGS,
+    content_types=settings.COMPRESSION_CONTENT_TYPES
+)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(TracingMiddleware)
+
+def include_router(router, prefix: str, **kwargs):
+    """
+    Include `router` under `prefix`, recording the full path template of its routes
+    for the request metrics and spans.
+    """
+    app.include_router(router, prefix=prefix, **kwargs)
+    register_route_templates(router, prefix)
 
-app.include_router(health.router, prefix="/v1/health", tags=["Health"])
-app.include_router(login.router, prefix="/v1/auth/login", tags=["Autenticación"])
-app.include_router(proveedores.router, prefix="/v1/proveedores", tags=["Proveedores"])
-app.include_router(insumos.router, prefix="/v1/insumos", tags=["Insumos"])
-app.include_router(clientes.router, prefix="/v1/clientes", tags=["Clientes"])
-app.include_router(maquinas.router, prefix="/v1/maquinas", tags=["Maquinas"])
-app.include_router(tecnicos.router, prefix="/v1/tecnicos", tags=["Tecnicos"])
-app.include_router(
+include_router(health.router, prefix="/v1/health", tags=["Health"])
+include_router(metrics.router, prefix="/metrics", tags=["Health"])
+include_router(login.router, prefix="/v1/auth/login", tags=["Autenticación"])
+include_router(refresh.router, prefix="/v1/auth/refresh", tags=["Autenticación"])
+include_router(proveedores.router, prefix="/v1/proveedores", tags=["Proveedores"])
+include_router(insumos.router, prefix="/v1/insumos", tags=["Insumos"])
+include_router(clientes.router, prefix="/v1/clientes", tags=["Clientes"])
+include_router(maquinas.router, prefix="/v1/maquinas", tags=["Maquinas"])
+include_router(tecnicos.router, prefix="/v1/tecnicos", tags=["Tecnicos"])
+include_router(
     mantenimientos.router,
     prefix="/v1/mantenimientos",
     tags=["Mantenimientos"]
 )
-app.include_router(
+include_router(
     registro_consumos.router,
     prefix="/v1/registro-consumos",
     tags=["Registros de Consumo"]
 )
-app.include_router(users.router, prefix="/v1/users", tags=["Users"])
+include_router(users.router, prefix="/v1/users", tags=["Users"])
 
-app.include_router(
+include_router(
     facturacion_mensual.router,
     prefix="/v1/reportes/facturacion-mensual",
     tags=["Reportes"]
 )
-app.include_router(
+include_router(
     insumos_mas_consumidos.router,
     prefix="/v1/reportes/insumos-mas-consumidos",
     tags=["Reportes"]
 )
-app.include_router(
+include_router(
     tecnicos_mas_mantenimientos.router,
     prefix="/v1/reportes/tecnicos-mas-mantenimientos",
     tags=["Reportes"]
 )
-app.include_router(
+include_router(
     clientes_mas_maquinas.router,
     prefix="/v1/reportes/clientes-mas-maquinas",
     tags=["Reportes"]
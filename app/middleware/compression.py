@@ -0,0 +1,290 @@
+"""
+    Response compression middleware.
+    Pure ASGI middleware compressing responses with the best encoding the client
+    accepts among gzip, br (brotli) and zstd. Brotli and zstd need the optional brotli
+    and zstandard packages and are skipped when they are not installed.
+
+    Only responses whose content type is in the allowlist are compressed. A complete
+    body is compressed in one pass when it reaches the size threshold; a streamed body
+    (the CSV and NDJSON exports) is compressed chunk by chunk and flushed after every
+    chunk, so rows keep reaching the client while the query is being read.
+
+    A compressed representation gets its own strong ETag, the original one with the
+    encoding appended ("abc" becomes "abc-gzip"). The suffix is removed from
+    If-None-Match before the request reaches the application, so conditional GETs
+    keep matching, and added back to the ETag of the 304 answer.
+"""
+
+import zlib
+from typing import Dict, Iterable, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+DEFAULT_CONTENT_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "text/csv",
+    "text/plain",
+    "text/html",
+)
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+ZSTD_LEVEL = 3
+
+class GzipEncoder:
+    """
+    Streaming gzip encoder.
+    """
+
+    def __init__(self):
+        self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress `data`, returning the output available so far."""
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        """Return everything compressed so far, keeping the stream open."""
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        """End the stream and return the remaining output."""
+        return self._compressor.flush(zlib.Z_FINISH)
+
+class BrotliEncoder:
+    """
+    Streaming brotli encoder (requires the brotli package).
+    """
+
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress `data`, returning the output available so far."""
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        """Return everything compressed so far, keeping the stream open."""
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        """End the stream and return the remaining output."""
+        return self._compressor.finish()
+
+class ZstdEncoder:
+    """
+    Streaming zstd encoder (requires the zstandard package).
+    """
+
+    def __init__(self):
+        self._compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress `data`, returning the output available so far."""
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        """Return everything compressed so far, keeping the stream open."""
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        """End the stream and return the remaining output."""
+        return self._compressor.flush()
+
+ENCODERS = {"gzip": GzipEncoder}
+if brotli is not None:
+    ENCODERS["br"] = BrotliEncoder
+if zstandard is not None:
+    ENCODERS["zstd"] = ZstdEncoder
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """
+    Return the codings of an Accept-Encoding header with their q-values.
+    """
+    accepted = {}
+    for item in header.split(","):
+        coding, *params = item.strip().split(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.strip().partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding] = quality
+    return accepted
+
+def select_encoding(header: str, preferred: Iterable[str]) -> Optional[str]:
+    """
+    Pick the first coding of `preferred` the client accepts, or None.
+    """
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get("*", 0.0)
+    for coding in preferred:
+        if coding in ENCODERS and accepted.get(coding, wildcard) > 0:
+            return coding
+    return None
+
+def encode_etag(etag: str, coding: str) -> str:
+    """
+    Return the ETag of the `coding` representation of a response tagged `etag`.
+    """
+    if not etag.endswith('"'):
+        return etag
+    return f'{etag[:-1]}-{coding}"'
+
+def strip_etag_codings(header: str) -> Tuple[str, Optional[str]]:
+    """
+    Remove the coding suffixes of the entity tags of an If-None-Match header.
+    Returns the rewritten header and the coding that was found, if any.
+    """
+    found = None
+    tags = []
+    for tag in header.split(","):
+        tag = tag.strip()
+        for coding in ENCODERS:
+            suffix = f'-{coding}"'
+            if tag.endswith(suffix):
+                tag = tag[:-len(suffix)] + '"'
+                found = coding
+                break
+        tags.append(tag)
+    return ", ".join(tags), found
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing eligible responses.
+
+    Args:
+        app: The ASGI application to wrap.
+        minimum_size (int): Bytes below which a complete body is sent uncompressed.
+        encodings (Iterable[str]): Codings offered, in order of preference.
+        content_types (Iterable[str]): Media types that are compressed.
+    """
+
+    def __init__(
+        self,
+        app,
+        minimum_size: int = 1024,
+        encodings: Iterable[str] = ("br", "zstd", "gzip"),
+        content_types: Iterable[str] = DEFAULT_CONTENT_TYPES
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = tuple(encodings)
+        self.content_types = frozenset(content_types)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        coding = select_encoding(request_headers.get("accept-encoding", ""), self.encodings)
+
+        matched_coding = None
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match is not None and coding is not None:
+            if_none_match, matched_coding = strip_etag_codings(if_none_match)
+            scope["headers"] = [
+                (name, value) for name, value in scope["headers"] if name != b"if-none-match"
+            ] + [(b"if-none-match", if_none_match.encode("latin-1"))]
+
+        responder = _CompressingResponder(self, coding, matched_coding, send)
+        await self.app(scope, receive, responder.send)
+
+    def is_compressible(self, headers: MutableHeaders) -> bool:
+        """
+        Return whether a response with `headers` may be compressed.
+        """
+        if "content-encoding" in headers:
+            return False
+        if "no-transform" in headers.get("cache-control", "").lower():
+            return False
+        media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        return media_type in self.content_types
+
+class _CompressingResponder:  # pylint: disable=too-few-public-methods
+    def __init__(self, middleware: CompressionMiddleware, coding, matched_coding, send):
+        self.middleware = middleware
+        self.coding = coding
+        self.matched_coding = matched_coding
+        self._send = send
+        self.start = None
+        self.encoder = None
+        self.passthrough = False
+
+    async def send(self, message):
+        """Forward `message`, compressing the body when the response is eligible."""
+        if message["type"] == "http.response.start":
+            self.start = message
+            self.passthrough = not self._prepare(MutableHeaders(scope=message))
+            if self.passthrough:
+                await self._send(message)
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.encoder is None:
+            if not more_body and len(body) < self.middleware.minimum_size:
+                self.passthrough = True
+                await self._send(self.start)
+                await self._send(message)
+                return
+            self.encoder = ENCODERS[self.coding]()
+            data = self._encode(body, more_body)
+            self._mark_encoded(MutableHeaders(scope=self.start), None if more_body else len(data))
+            await self._send(self.start)
+        else:
+            data = self._encode(body, more_body)
+
+        if data or not more_body:
+            await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+    def _prepare(self, headers: MutableHeaders) -> bool:
+        if self.start["status"] == 304:
+            if "etag" in headers and self.matched_coding is not None:
+                headers["etag"] = encode_etag(headers["etag"], self.matched_coding)
+            return False
+        if self.start["status"] < 200 or self.start["status"] == 204:
+            return False
+        if not self.middleware.is_compressible(headers):
+            return False
+
+        headers.add_vary_header("Accept-Encoding")
+        if self.coding is None:
+            return False
+        content_length = headers.get("content-length")
+        return content_length is None or int(content_length) >= self.middleware.minimum_size
+
+    def _encode(self, body: bytes, more_body: bool) -> bytes:
+        data = self.encoder.compress(body)
+        return data + (self.encoder.flush() if more_body else self.encoder.finish())
+
+    def _mark_encoded(self, headers: MutableHeaders, content_length: Optional[int]):
+        headers["content-encoding"] = self.coding
+        if "etag" in headers:
+            headers["etag"] = encode_etag(headers["etag"], self.coding)
+        if content_length is None:
+            del headers["content-length"]
+        else:
+            headers["content-length"] = str(content_length)
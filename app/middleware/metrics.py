@@ -0,0 +1,61 @@
+"""
+    Request metrics middleware.
+    Pure ASGI middleware counting requests by method, route template and status code,
+    timing them until the last byte of the response is sent and tracking how many are
+    in flight. It also opens the per-request record the database cursors add their
+    statement durations to, so the time spent in MySQL can be reported per route.
+
+    The route template is read from the scope once the application has routed the
+    request, so it must wrap the router without copying the scope on the way in.
+"""
+
+import time
+
+from app.utils.metrics import (
+    IN_FLIGHT,
+    REQUEST_DB_DURATION,
+    REQUEST_DURATION,
+    REQUESTS,
+    RequestMetrics,
+    current_request,
+)
+
+class MetricsMiddleware:  # pylint: disable=too-few-public-methods
+    """
+    ASGI middleware recording the metrics of every HTTP request.
+
+    Args:
+        app: The ASGI application to wrap.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        request = RequestMetrics(scope)
+        token = current_request.set(request)
+        IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            IN_FLIGHT.dec()
+            current_request.reset(token)
+            route = request.route
+            REQUESTS.inc((scope["method"], route, status_code))
+            REQUEST_DURATION.observe(elapsed, (scope["method"], route))
+            if request.db_queries:
+                REQUEST_DB_DURATION.observe(request.db_seconds, (route,))
@@ -0,0 +1,62 @@
+"""
+    Request tracing middleware.
+    Pure ASGI middleware opening a server span around every HTTP request. A valid
+    W3C traceparent header makes the span a child of the caller's span, so the
+    request shows up inside the caller's trace; tracestate is carried along as is.
+
+    The span is named after the method and the full route template ("GET /v1/insumos/")
+    once the application has routed the request, or after the method alone when no
+    route matched, and records the status code, marking 5xx answers as errors.
+    The spans opened while handling the request (token decoding, SQL statements,
+    serialization) become its children through the current span context variable.
+"""
+
+from starlette.datastructures import Headers
+
+from app.utils import tracing
+from app.utils.metrics import route_template
+
+class TracingMiddleware:  # pylint: disable=too-few-public-methods
+    """
+    ASGI middleware tracing every HTTP request.
+
+    Args:
+        app: The ASGI application to wrap.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not tracing.tracing_enabled():
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        parent = tracing.parse_traceparent(headers.get("traceparent"), headers.get("tracestate"))
+        method = scope["method"]
+        span = tracing.start_span(
+            method,
+            tracing.SpanKind.SERVER,
+            parent,
+            {"http.request.method": method, "url.path": scope["path"]}
+        )
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        with span:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                route = route_template(scope)
+                if route != "unmatched":
+                    span.update_name(f"{method} {route}")
+                    span.set_attribute("http.route", route)
+                span.set_attribute("http.response.status_code", status_code)
+                if status_code >= 500:
+                    span.set_error()
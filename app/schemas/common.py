@@ -1,11 +1,13 @@
 """
     Common response schemas for API responses.
     This module defines common response models used across the application.
+    The envelope timestamp is taken when each response is built, so it can back the
+    Last-Modified header; see app.utils.http_cache for the ETag derivation.
 """
 
 import time
-from typing import List, TypeVar, Generic
-from pydantic import BaseModel
+from typing import List, TypeVar, Generic, Optional
+from pydantic import BaseModel, Field
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -31,18 +33,21 @@ class APIResponse(BaseModel, Generic[T]):
     """
     success: bool
     data: T | List[T] | MessageResponse | None = None
-    timestamp: int = int(time.time())
+    timestamp: int = Field(default_factory=lambda: int(time.time()))
 
 class APIResponsePaginated(BaseModel, Generic[T]):
     """
     Base API response model for paginated data.
     This model is used to standardize the response structure for paginated endpoints.
+    `total_items` and `total_pages` are None when the client asked for `count=none`.
+    `next_cursor` can be sent back as `after` to fetch the next page through keyset pagination.
     """
 
     success: bool
     data: List[T] | MessageResponse | None = None
-    total_items: int = 0
+    total_items: Optional[int] = 0
     page: int = 1
     page_size: int = 10
-    total_pages: int = 0
-    timestamp: int = int(time.time())
+    total_pages: Optional[int] = 0
+    next_cursor: Optional[str] = None
+    timestamp: int = Field(default_factory=lambda: int(time.time()))
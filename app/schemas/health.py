@@ -0,0 +1,57 @@
+"""
+    Esquemas para las métricas internas expuestas por el endpoint de salud.
+"""
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+class CacheStats(BaseModel):
+    """
+    Modelo con las estadísticas de una caché en memoria.
+
+    Args:
+        BaseModel (pydantic.BaseModel): Clase base de Pydantic para la validación de datos.
+
+    Attributes:
+        namespace (str): Nombre de la caché (por ejemplo "tokens" o "insumos").
+        entries (int): Entradas almacenadas actualmente.
+        max_entries (int | None): Cantidad máxima de entradas, None si no tiene límite.
+        hits (int): Búsquedas resueltas desde la caché.
+        misses (int): Búsquedas que no encontraron una entrada vigente.
+        evictions (int): Entradas descartadas por superar el tamaño máximo.
+        hit_ratio (float): Proporción de búsquedas resueltas desde la caché.
+    """
+
+    namespace: str = Field(..., example="tokens")
+    entries: int = Field(..., ge=0, example=12)
+    max_entries: Optional[int] = Field(None, example=4096)
+    hits: int = Field(..., ge=0, example=980)
+    misses: int = Field(..., ge=0, example=20)
+    evictions: int = Field(..., ge=0, example=0)
+    hit_ratio: float = Field(..., ge=0, le=1, example=0.98)
+
+class QueryStats(BaseModel):
+    """
+    Modelo con las estadísticas acumuladas de una sentencia SQL.
+
+    Args:
+        BaseModel (pydantic.BaseModel): Clase base de Pydantic para la validación de datos.
+
+    Attributes:
+        fingerprint (str): Sentencia normalizada, con los literales reemplazados por "?".
+        calls (int): Cantidad de ejecuciones.
+        total_seconds (float): Tiempo total de ejecución, en segundos.
+        mean_seconds (float): Tiempo promedio de ejecución, en segundos.
+        max_seconds (float): Ejecución más lenta, en segundos.
+        rows (int): Filas devueltas o afectadas por todas las ejecuciones.
+        routes (list[str]): Rutas que ejecutaron la sentencia, de la más frecuente a la menos.
+    """
+
+    fingerprint: str = Field(..., example="SELECT * FROM insumos WHERE id = ?")
+    calls: int = Field(..., ge=0, example=120)
+    total_seconds: float = Field(..., ge=0, example=0.36)
+    mean_seconds: float = Field(..., ge=0, example=0.003)
+    max_seconds: float = Field(..., ge=0, example=0.02)
+    rows: int = Field(..., ge=0, example=120)
+    routes: List[str] = Field(..., example=["/v1/insumos/{insumo_id}"])
@@ -75,6 +75,21 @@ class LoginResponseData(Token):
         
     Attributes:
         is_admin (bool): Indica si el usuario logueado es administrador.
+        refresh_token (str): Token de un solo uso para renovar la sesión sin volver a loguearse.
     """
 
     is_admin: bool = Field(..., description="Indica si el usuario logueado es administrador.")
+    refresh_token: str = Field(..., example="eyJhbGciOiJIUzI1NiI...")
+
+class RefreshRequest(BaseModel):
+    """
+    Modelo para la solicitud de renovación o revocación de una sesión.
+
+    Args:
+        BaseModel (pydantic.BaseModel): Clase base de Pydantic para la validación de datos.
+
+    Attributes:
+        refresh_token (str): Token de renovación recibido en el login o en la última renovación.
+    """
+
+    refresh_token: str = Field(..., example="eyJhbGciOiJIUzI1NiI...")
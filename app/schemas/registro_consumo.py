@@ -3,6 +3,7 @@
 """
 
 from datetime import datetime
+from typing import List
 from pydantic import BaseModel, Field
 
 class RegistroConsumoBase(BaseModel):
@@ -62,3 +63,35 @@ class RegistroConsumoUpdate(BaseModel):
     """
 
     cantidad_usada: float | None = Field(None, gt=0, example=120.0)
+
+class RegistroConsumoBulkError(BaseModel):
+    """
+    Modelo para un error de validación en la carga masiva de registros de consumo.
+
+    Args:
+        BaseModel (pydantic.BaseModel): Clase base de Pydantic para la validación de datos.
+
+    Attributes:
+        index (int): Posición del registro dentro del lote enviado, comenzando en cero.
+        detail (str): Descripción del error encontrado en el registro.
+    """
+
+    index: int = Field(..., ge=0, example=3)
+    detail: str = Field(..., example="cantidad_usada: Input should be greater than 0")
+
+class RegistroConsumoBulkResult(BaseModel):
+    """
+    Modelo para el resultado de la carga masiva de registros de consumo.
+
+    Args:
+        BaseModel (pydantic.BaseModel): Clase base de Pydantic para la validación de datos.
+
+    Attributes:
+        received (int): Cantidad de registros recibidos en el lote.
+        inserted (int): Cantidad de registros insertados.
+        errors (list[RegistroConsumoBulkError]): Errores por registro que no fue insertado.
+    """
+
+    received: int = Field(..., ge=0, example=1000)
+    inserted: int = Field(..., ge=0, example=999)
+    errors: List[RegistroConsumoBulkError] = Field(default_factory=list)
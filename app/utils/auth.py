@@ -8,33 +8,60 @@
         str: The encoded JWT access token.
     """
 
-from datetime import datetime, timedelta
-from typing import Any
-from jose import jwt
+import secrets
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
 
 from app.config import settings
+from app.utils.jwt_backends import create_jwt_backend
+from app.utils.tracing import start_span
+
+jwt_backend = create_jwt_backend(
+    settings.JWT_BACKEND,
+    settings.JWT_SECRET_KEY,
+    settings.JWT_ALGORITHM
+)
+
+def _encode_token(data: dict, token_type: str, expires_delta: timedelta) -> str:
+    to_encode = data.copy()
+    expire = datetime.now(timezone.utc) + expires_delta
+    to_encode.update({"exp": int(expire.timestamp()), "type": token_type})
+    return jwt_backend.encode(to_encode)
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
     """
     Create a JWT access token with an expiration time.
     """
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+    if not expires_delta:
+        expires_delta = timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
+    encoded_jwt = _encode_token(data, "access", expires_delta)
     return encoded_jwt
 
+def create_refresh_token(data: dict, expires_delta: Optional[timedelta] = None):
+    """
+    Create a JWT refresh token carrying a unique jti, so it can be used only once.
+    """
+    if not expires_delta:
+        expires_delta = timedelta(minutes=settings.JWT_REFRESH_TOKEN_EXPIRE_MINUTES)
+    return _encode_token({**data, "jti": secrets.token_urlsafe(16)}, "refresh", expires_delta)
+
 def decode_access_token(token: str) -> Any:
     """
     Decode a JWT access token and return the payload.
+    The backend errors are ValueErrors ("Token has expired" or "Invalid token: ...").
+    Refresh tokens are rejected; tokens issued before the type claim are access tokens.
     """
-    try:
-        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+    with start_span("decode_access_token"):
+        payload = jwt_backend.decode(token)
+        if payload.get("type", "access") != "access":
+            raise ValueError("Invalid token: not an access token")
         return payload
-    except jwt.ExpiredSignatureError as exc:
-        raise ValueError("Token has expired") from exc
-    except jwt.JWTError as e:
-        raise ValueError(f"Invalid token: {e}") from e
+
+def decode_refresh_token(token: str) -> Any:
+    """
+    Decode a JWT refresh token, rejecting access tokens.
+    """
+    payload = jwt_backend.decode(token)
+    if payload.get("type") != "refresh" or "jti" not in payload:
+        raise ValueError("Invalid token: not a refresh token")
+    return payload
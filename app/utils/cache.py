@@ -0,0 +1,103 @@
+"""
+    In-process caching helpers.
+    This module provides a size-bounded LRU cache whose entries expire after a
+    time-to-live, and a registry of named caches so each router can keep its own
+    namespace and the hit/miss statistics of every cache can be inspected.
+
+    Returns:
+        Any: The cached value, or None when the key is missing or expired.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from app.config import settings
+
+class TTLCache:
+    """
+    LRU cache whose entries expire `ttl` seconds after being stored.
+    It is meant to be used from the event loop and does no locking.
+
+    Args:
+        ttl (float): Seconds an entry stays valid after it is set.
+        max_entries (int | None): Entries kept before the least recently used is evicted.
+    """
+
+    def __init__(self, ttl: float, max_entries: Optional[int] = None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Any:
+        """Return the value stored under `key`, or None if it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store `value` under `key` for `ttl` seconds (the cache default when omitted)."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        if self.max_entries is not None:
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        """Drop the entry stored under `key`, if any."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        """Return the hit/miss counters of the cache."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+_caches: Dict[str, TTLCache] = {}
+
+def get_cache(namespace: str, ttl: Optional[float] = None, max_entries: Optional[int] = None):
+    """
+    Return the cache registered under `namespace`, creating it on first use.
+    TTL and size default to CATALOG_CACHE_TTL and CATALOG_CACHE_MAX_ENTRIES.
+    """
+    cache = _caches.get(namespace)
+    if cache is None:
+        cache = TTLCache(
+            ttl=settings.CATALOG_CACHE_TTL if ttl is None else ttl,
+            max_entries=settings.CATALOG_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        )
+        _caches[namespace] = cache
+    return cache
+
+def cache_stats() -> Dict[str, dict]:
+    """
+    Return the statistics of every registered cache, keyed by namespace.
+    """
+    return {namespace: cache.stats() for namespace, cache in _caches.items()}
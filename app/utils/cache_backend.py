@@ -0,0 +1,335 @@
+"""
+    Cache backends shared by the endpoint modules.
+    The memory backend keeps entries in the process, which is enough for a single
+    worker. The Redis backend stores entries in Redis so every worker and host sees the
+    same data, keeps a short-lived local copy in front of it, and publishes
+    invalidations on a channel so the local copies of the other workers are dropped as
+    soon as a namespace is mutated.
+
+    Values must be JSON serializable. Each namespace also has a version that changes on
+    every invalidation, which the conditional GET support uses to build ETags.
+
+    Raises:
+        RuntimeError: If the Redis backend is selected and the redis package is missing.
+"""
+
+import asyncio
+import json
+import logging
+import secrets
+import time
+from typing import Any, Dict, Hashable, Optional
+
+from app.config import settings
+from app.utils.cache import TTLCache, get_cache
+
+try:
+    from redis import asyncio as redis
+    from redis.exceptions import RedisError
+except ImportError:
+    redis = None
+    RedisError = OSError
+
+logger = logging.getLogger(__name__)
+
+class CacheBackend:
+    """
+    Interface of the cache backends. Every entry belongs to a namespace, usually the
+    table a router reads from, and a namespace is invalidated as a whole.
+
+    Attributes:
+        shared (bool): Whether entries and versions are shared by every worker.
+    """
+
+    shared = False
+
+    async def get(self, namespace: str, key: Hashable) -> Any:
+        """Return the value stored under `key`, or None on a miss."""
+        raise NotImplementedError
+
+    async def set(self, namespace: str, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Store `value` under `key` for `ttl` seconds (CATALOG_CACHE_TTL when omitted)."""
+        raise NotImplementedError
+
+    async def add(self, namespace: str, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Store `value` only if `key` is absent; return whether it was stored."""
+        raise NotImplementedError
+
+    async def invalidate(self, namespace: str):
+        """Drop every entry of `namespace`, in this process and in the other workers."""
+        raise NotImplementedError
+
+    async def version(self, namespace: str) -> Optional[str]:
+        """Return the current version of `namespace`, or None if it cannot be read."""
+        raise NotImplementedError
+
+    async def start(self):
+        """Start the background work of the backend, if any."""
+
+    async def close(self):
+        """Stop the background work and release the connections of the backend."""
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Backend keeping the entries in the per-process caches of app.utils.cache.
+    Versions are per-process counters prefixed with a random epoch, so they never
+    repeat across restarts. A write handled by another worker does not change them,
+    so they are not used for conditional GETs.
+    """
+
+    def __init__(self):
+        self._epoch = secrets.token_hex(4)
+        self._versions: Dict[str, int] = {}
+
+    async def get(self, namespace: str, key: Hashable) -> Any:
+        return get_cache(namespace).get(key)
+
+    async def set(self, namespace: str, key: Hashable, value: Any, ttl: Optional[float] = None):
+        get_cache(namespace).set(key, value, ttl)
+
+    async def add(self, namespace: str, key: Hashable, value: Any, ttl: Optional[float] = None):
+        cache = get_cache(namespace)
+        if cache.get(key) is not None:
+            return False
+        cache.set(key, value, ttl)
+        return True
+
+    async def invalidate(self, namespace: str):
+        get_cache(namespace).clear()
+        self._versions[namespace] = self._versions.get(namespace, 0) + 1
+
+    async def version(self, namespace: str) -> Optional[str]:
+        return f"{self._epoch}.{self._versions.get(namespace, 0)}"
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Backend storing the entries in Redis, with a local copy kept for `local_ttl` seconds.
+    Keys start with PREFIX and the keys of a namespace are tracked in a set, so the
+    namespace can be dropped without scanning the keyspace; the namespace name is then
+    published on `channel`. Versions are Redis counters seeded with the current time
+    and expiring after TABLE_VERSION_TTL, so a bump lost while Redis was unreachable
+    cannot keep an outdated version alive.
+
+    Args:
+        url (str): Redis URL, used when no client is given.
+        client: An already built redis.asyncio client (or a compatible stand-in).
+        channel (str): Pub/sub channel carrying the invalidated namespaces.
+        local_ttl (float): Seconds an entry is served from the local copy.
+    """
+
+    shared = True
+
+    PREFIX = "marloy:cache"
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        client=None,
+        channel: str = "marloy:cache:invalidate",
+        local_ttl: float = 5.0
+    ):
+        if client is None:
+            if redis is None:
+                raise RuntimeError("The redis cache backend requires the redis package")
+            client = redis.from_url(url)
+        self.client = client
+        self.channel = channel
+        self.local_ttl = local_ttl
+        self._local: Dict[str, TTLCache] = {}
+        self._listener: Optional[asyncio.Task] = None
+
+    def _local_cache(self, namespace: str) -> TTLCache:
+        cache = self._local.get(namespace)
+        if cache is None:
+            cache = TTLCache(ttl=self.local_ttl, max_entries=settings.CATALOG_CACHE_MAX_ENTRIES)
+            self._local[namespace] = cache
+        return cache
+
+    def _key(self, namespace: str, key: Hashable) -> str:
+        return f"{self.PREFIX}:{namespace}:{json.dumps(key, default=str)}"
+
+    def _keys_set(self, namespace: str) -> str:
+        return f"{self.PREFIX}:{namespace}:__keys__"
+
+    def _version_key(self, namespace: str) -> str:
+        return f"{self.PREFIX}:{namespace}:__version__"
+
+    async def get(self, namespace: str, key: Hashable) -> Any:
+        local = self._local_cache(namespace)
+        value = local.get(key)
+        if value is not None:
+            return value
+
+        try:
+            raw = await self.client.get(self._key(namespace, key))
+        except RedisError as err:
+            logger.warning("Cache read failed for %s: %s", namespace, err)
+            return None
+        if raw is None:
+            return None
+        value = json.loads(raw)
+        local.set(key, value)
+        return value
+
+    async def set(self, namespace: str, key: Hashable, value: Any, ttl: Optional[float] = None):
+        ttl = settings.CATALOG_CACHE_TTL if ttl is None else ttl
+        redis_key = self._key(namespace, key)
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.set(redis_key, json.dumps(value), px=int(ttl * 1000))
+                pipe.sadd(self._keys_set(namespace), redis_key)
+                pipe.pexpire(self._keys_set(namespace), int(ttl * 1000))
+                await pipe.execute()
+        except RedisError as err:
+            logger.warning("Cache write failed for %s: %s", namespace, err)
+            return
+        self._local_cache(namespace).set(key, value, min(ttl, self.local_ttl))
+
+    async def add(self, namespace: str, key: Hashable, value: Any, ttl: Optional[float] = None):
+        ttl = settings.CATALOG_CACHE_TTL if ttl is None else ttl
+        redis_key = self._key(namespace, key)
+        try:
+            added = await self.client.set(
+                redis_key, json.dumps(value), px=int(ttl * 1000), nx=True
+            )
+            if added:
+                async with self.client.pipeline(transaction=False) as pipe:
+                    pipe.sadd(self._keys_set(namespace), redis_key)
+                    pipe.pexpire(self._keys_set(namespace), int(ttl * 1000))
+                    await pipe.execute()
+        except RedisError as err:
+            logger.warning("Cache add failed for %s: %s", namespace, err)
+            return False
+        if added:
+            self._local_cache(namespace).set(key, value, min(ttl, self.local_ttl))
+        return bool(added)
+
+    async def invalidate(self, namespace: str):
+        self._local_cache(namespace).clear()
+        keys_set = self._keys_set(namespace)
+        version_key = self._version_key(namespace)
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.set(version_key, time.time_ns(), nx=True)
+                pipe.incr(version_key)
+                pipe.pexpire(version_key, int(settings.TABLE_VERSION_TTL * 1000))
+                await pipe.execute()
+            keys = await self.client.smembers(keys_set)
+            await self.client.delete(keys_set, *keys)
+            await self.client.publish(self.channel, namespace)
+        except RedisError as err:
+            logger.warning("Cache invalidation failed for %s: %s", namespace, err)
+
+    async def version(self, namespace: str) -> Optional[str]:
+        version_key = self._version_key(namespace)
+        try:
+            value = await self.client.get(version_key)
+            if value is None:
+                await self.client.set(
+                    version_key,
+                    time.time_ns(),
+                    px=int(settings.TABLE_VERSION_TTL * 1000),
+                    nx=True
+                )
+                value = await self.client.get(version_key)
+        except RedisError as err:
+            logger.warning("Version read failed for %s: %s", namespace, err)
+            return None
+        if value is None:
+            return None
+        return value.decode() if isinstance(value, bytes) else str(value)
+
+    async def start(self):
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def close(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        await self.client.aclose()
+
+    async def _listen(self):
+        while True:
+            pubsub = self.client.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                # Invalidations published while we were not subscribed are lost.
+                for cache in self._local.values():
+                    cache.clear()
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    namespace = message["data"]
+                    if isinstance(namespace, bytes):
+                        namespace = namespace.decode()
+                    self._local_cache(namespace).clear()
+            except RedisError as err:
+                logger.warning("Cache invalidation channel lost: %s", err)
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+
+def create_cache_backend() -> CacheBackend:
+    """
+    Build the backend selected by the CACHE_BACKEND setting ("memory" or "redis").
+    """
+    if settings.CACHE_BACKEND == "redis":
+        return RedisCacheBackend(
+            url=settings.REDIS_URL,
+            channel=settings.CACHE_INVALIDATION_CHANNEL,
+            local_ttl=settings.CACHE_LOCAL_TTL
+        )
+    if settings.CACHE_BACKEND == "memory":
+        return MemoryCacheBackend()
+    raise RuntimeError(f"Unknown cache backend: {settings.CACHE_BACKEND}")
+
+cache_backend = create_cache_backend()
+
+class SharedCache:
+    """
+    View of the configured backend bound to one namespace, used by the routers.
+
+    Args:
+        namespace (str): Namespace of the entries, usually the table name.
+    """
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+
+    async def get(self, key: Hashable) -> Any:
+        """Return the value stored under `key`, or None on a miss."""
+        return await cache_backend.get(self.namespace, key)
+
+    async def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Store `value` under `key`."""
+        await cache_backend.set(self.namespace, key, value, ttl)
+
+    async def add(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> bool:
+        """Store `value` only if `key` is absent; return whether it was stored."""
+        return await cache_backend.add(self.namespace, key, value, ttl)
+
+    async def invalidate(self):
+        """Drop every entry of the namespace in all the workers and bump its version."""
+        await cache_backend.invalidate(self.namespace)
+
+    async def version(self) -> Optional[str]:
+        """Return the current version of the namespace."""
+        return await cache_backend.version(self.namespace)
+
+def shared_cache(namespace: str) -> SharedCache:
+    """
+    Return the cache of `namespace` on the configured backend.
+    """
+    return SharedCache(namespace)
+
+async def invalidate_namespaces(*namespaces: str):
+    """
+    Invalidate several namespaces, for writes that touch tables read elsewhere.
+    """
+    for namespace in namespaces:
+        await cache_backend.invalidate(namespace)
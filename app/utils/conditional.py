@@ -0,0 +1,49 @@
+"""
+    Conditional GET support for polled endpoints.
+    The ETag of a response is derived from the request path and query and from the
+    versions of the tables it reads, which change whenever one of those tables is
+    invalidated after a write. Comparing it with If-None-Match needs no query and no
+    serialization, so unchanged data is answered with an empty 304 Not Modified.
+
+    Only the Redis cache backend shares table versions between workers. With the
+    memory backend a write handled by one worker would not change the versions seen
+    by the others, which would keep answering 304 with stale data, so no version
+    ETag is produced and responses keep the ETag derived from their payload.
+
+    Raises:
+        HTTPException: 304 Not Modified when the client's copy is current.
+"""
+
+from typing import Optional
+
+from fastapi import HTTPException, Request, Response, status
+
+from app.utils.cache_backend import cache_backend
+from app.utils.http_cache import etag_for, etag_matches
+
+def conditional_get(*tables: str):
+    """
+    Build a dependency answering 304 when the client's ETag matches the current one.
+    The dependency sets the ETag header and also returns it, for handlers returning
+    their own Response (those do not get the headers set by dependencies).
+    If the cache backend is not shared between workers or a version cannot be read,
+    no ETag is produced and the request proceeds.
+    """
+
+    async def check_not_modified(request: Request, response: Response) -> Optional[str]:
+        if not cache_backend.shared:
+            return None
+        versions = [await cache_backend.version(table) for table in tables]
+        if None in versions:
+            return None
+
+        etag = etag_for("|".join([request.url.path, request.url.query, *versions]).encode())
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag}
+            )
+        response.headers["ETag"] = etag
+        return etag
+
+    return check_not_modified
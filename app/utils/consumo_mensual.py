@@ -0,0 +1,63 @@
+"""
+    Maintenance of the consumo_mensual rollup table.
+    consumo_mensual keeps, per maquina, insumo and month, the total quantity consumed
+    and the number of registros de consumo it aggregates. The client of each row is
+    the client the maquina is assigned to, so the billing report reads this table
+    instead of scanning registro_consumo.
+
+    Every write to registro_consumo must apply the matching delta in the same
+    transaction through apply_consumo_deltas().
+"""
+
+from collections import defaultdict
+from datetime import datetime
+from decimal import Decimal
+from typing import Iterable
+
+UPSERT_BATCH_SIZE = 1000
+
+def _as_decimal(value) -> Decimal:
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
+
+def consumo_delta(id_maquina: int, id_insumo: int, fecha: datetime, cantidad, sign: int = 1):
+    """
+    Build the delta of one registro de consumo: sign=1 when it is added, -1 when removed.
+    """
+    return (id_maquina, id_insumo, fecha, sign * _as_decimal(cantidad), sign)
+
+async def apply_consumo_deltas(cursor, deltas: Iterable[tuple]) -> None:
+    """
+    Apply the deltas built with consumo_delta() to consumo_mensual.
+    Deltas are first merged per (anio, mes, maquina, insumo), then upserted with
+    multi-row statements; rollup rows left without registros are removed.
+    """
+    totals = defaultdict(lambda: [Decimal(0), 0])
+    for id_maquina, id_insumo, fecha, cantidad, registros in deltas:
+        total = totals[(fecha.year, fecha.month, id_maquina, id_insumo)]
+        total[0] += cantidad
+        total[1] += registros
+
+    rows = [key + (cantidad, registros) for key, (cantidad, registros) in totals.items()]
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        batch = rows[start:start + UPSERT_BATCH_SIZE]
+        placeholders = ", ".join(["(%s, %s, %s, %s, %s, %s)"] * len(batch))
+        query = f"""
+            INSERT INTO consumo_mensual
+                (anio, mes, id_maquina, id_insumo, cantidad_total, registros)
+            VALUES {placeholders} AS nuevo
+            ON DUPLICATE KEY UPDATE
+                cantidad_total = consumo_mensual.cantidad_total + nuevo.cantidad_total,
+                registros = consumo_mensual.registros + nuevo.registros
+        """
+        await cursor.execute(query, tuple(value for row in batch for value in row))
+
+    emptied = [row[:4] for row in rows if row[5] < 0]
+    if emptied:
+        query = """
+            DELETE FROM consumo_mensual
+            WHERE anio = %s AND mes = %s AND id_maquina = %s AND id_insumo = %s
+            AND registros <= 0
+        """
+        await cursor.executemany(query, emptied)
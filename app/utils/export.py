@@ -0,0 +1,148 @@
+"""
+    Streaming export helpers.
+    Query results are read with an unbuffered cursor in small batches and written to a
+    StreamingResponse as CSV or NDJSON, so memory usage does not depend on the number of
+    rows. The connection is borrowed from the pool for the duration of the stream and
+    is discarded rather than returned when the stream stops before the last row.
+
+    Raises:
+        mysql.connector.Error: If the query cannot be executed.
+
+    Returns:
+        StreamingResponse: The encoded rows, streamed as they are read from MySQL.
+"""
+
+import csv
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import List, Optional, Tuple
+
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+
+from app.database_async import get_async_database_connection
+
+FETCH_SIZE = 1000
+
+class ExportFormat(str, Enum):
+    """
+    Output formats supported by the export endpoints.
+    """
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+def date_range_filter(
+    column: str,
+    desde: Optional[datetime],
+    hasta: Optional[datetime]
+) -> Tuple[str, tuple]:
+    """
+    Build a WHERE clause keeping the rows with `column` in [desde, hasta).
+    Either bound may be omitted; without bounds the clause is empty.
+    """
+    conditions, params = [], ()
+    if desde is not None:
+        conditions.append(f"{column} >= %s")
+        params += (desde,)
+    if hasta is not None:
+        conditions.append(f"{column} < %s")
+        params += (hasta,)
+    if not conditions:
+        return "", params
+    return "WHERE " + " AND ".join(conditions), params
+
+def _json_default(value):
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _csv_value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+def encode_ndjson(rows: List[dict]) -> bytes:
+    """
+    Encode a batch of rows as newline-delimited JSON.
+    """
+    return "".join(
+        json.dumps(row, default=_json_default, ensure_ascii=False) + "\n" for row in rows
+    ).encode()
+
+def encode_csv(rows: List[dict], header: bool = False) -> bytes:
+    """
+    Encode a batch of rows as CSV, preceded by the header line when `header` is set.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header and rows:
+        writer.writerow(rows[0].keys())
+    writer.writerows([_csv_value(value) for value in row.values()] for row in rows)
+    return buffer.getvalue().encode()
+
+async def _iter_rows(connection, cursor, export_format: ExportFormat):
+    exhausted = False
+    try:
+        first = True
+        while True:
+            rows = await cursor.fetchmany(FETCH_SIZE)
+            if not rows:
+                exhausted = True
+                break
+            if export_format == ExportFormat.CSV:
+                yield encode_csv(rows, header=first)
+            else:
+                yield encode_ndjson(rows)
+            first = False
+    finally:
+        if not exhausted:
+            # The client went away or a fetch failed with rows still pending: closing the
+            # cursor would raise and releasing the connection would read every remaining
+            # row, so the connection is thrown away instead.
+            await connection.discard()
+        else:
+            try:
+                await cursor.close()
+            finally:
+                await connection.close()
+
+async def stream_query(
+    query: str,
+    params: tuple,
+    export_format: ExportFormat,
+    filename: str
+) -> StreamingResponse:
+    """
+    Execute `query` and stream its rows in `export_format`.
+    The query runs before the response is returned, so database errors can still be
+    reported with a regular error status.
+    """
+    connection = await get_async_database_connection()
+    try:
+        cursor = await connection.cursor(dictionary=True)
+        await cursor.execute(query, params)
+    except BaseException:
+        await connection.close()
+        raise
+
+    extension = "csv" if export_format == ExportFormat.CSV else "ndjson"
+    # A client that disconnects before the first chunk cancels the response without
+    # ever starting _iter_rows, whose cleanup then never runs; the background task
+    # frees the connection in that case and is a no-op once the rows were streamed.
+    return StreamingResponse(
+        _iter_rows(connection, cursor, export_format),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{extension}"'},
+        background=BackgroundTask(connection.discard)
+    )
@@ -0,0 +1,47 @@
+"""
+    HTTP validator helpers for the response envelopes.
+    The ETag of a response is a digest of its JSON envelope without the timestamp
+    field, so two responses carrying the same data share it no matter when they were
+    built. Last-Modified is the time the data was read from the database. Envelopes
+    are encoded without the timestamp and stamped right before sending, which is a
+    byte splice instead of a second serialization.
+"""
+
+import hashlib
+from email.utils import formatdate
+from typing import Optional
+
+def etag_for(payload: bytes) -> str:
+    """
+    Return the strong ETag of an envelope encoded without its timestamp.
+    """
+    return f'"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"'
+
+def http_date(timestamp: float) -> str:
+    """
+    Format a Unix timestamp as an HTTP date (RFC 9110), as used by Last-Modified.
+    """
+    return formatdate(timestamp, usegmt=True)
+
+def stamp(payload: bytes, timestamp: int) -> bytes:
+    """
+    Append the timestamp field to a JSON envelope encoded without it.
+    """
+    return payload[:-1] + b',"timestamp":' + str(timestamp).encode() + b"}"
+
+def _opaque_tag(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Return whether an If-None-Match header matches `etag` (weak comparison, RFC 9110).
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = _opaque_tag(etag)
+    return any(
+        _opaque_tag(candidate.strip()) == opaque
+        for candidate in if_none_match.split(",")
+    )
@@ -0,0 +1,172 @@
+"""
+    JWT codecs used by app.utils.auth.
+    Every backend encodes a claims dict into a compact JWT and decodes it back, raising
+    ExpiredTokenError or InvalidTokenError (both ValueError) when the token cannot be
+    accepted. python-jose and PyJWT are imported only when their backend is built, so
+    only the selected library has to be installed.
+
+    Raises:
+        ExpiredTokenError: If the exp claim of the token is in the past.
+        InvalidTokenError: If the token is malformed or its signature does not match.
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import time
+from typing import Any, Dict
+
+class InvalidTokenError(ValueError):
+    """
+    Raised when a token is malformed, uses an unexpected algorithm or has a bad signature.
+    """
+
+class ExpiredTokenError(InvalidTokenError):
+    """
+    Raised when a token is well formed but its exp claim has passed.
+    """
+
+class JWTBackend:
+    """
+    Interface of the JWT codecs.
+
+    Args:
+        key (str): Secret key used to sign and verify tokens.
+        algorithm (str): JWS algorithm, for example "HS256".
+    """
+
+    def __init__(self, key: str, algorithm: str):
+        self.key = key
+        self.algorithm = algorithm
+
+    def encode(self, claims: dict) -> str:
+        """Sign `claims` and return the compact token."""
+        raise NotImplementedError
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        """Verify `token` and return its claims."""
+        raise NotImplementedError
+
+class JoseBackend(JWTBackend):
+    """
+    Backend using python-jose.
+    """
+
+    def __init__(self, key: str, algorithm: str):
+        super().__init__(key, algorithm)
+        from jose import jwt  # pylint: disable=import-outside-toplevel
+        self._jwt = jwt
+
+    def encode(self, claims: dict) -> str:
+        return self._jwt.encode(claims, self.key, algorithm=self.algorithm)
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        try:
+            return self._jwt.decode(token, self.key, algorithms=[self.algorithm])
+        except self._jwt.ExpiredSignatureError as exc:
+            raise ExpiredTokenError("Token has expired") from exc
+        except self._jwt.JWTError as exc:
+            raise InvalidTokenError(f"Invalid token: {exc}") from exc
+
+class PyJWTBackend(JWTBackend):
+    """
+    Backend using PyJWT.
+    """
+
+    def __init__(self, key: str, algorithm: str):
+        super().__init__(key, algorithm)
+        import jwt  # pylint: disable=import-outside-toplevel
+        self._jwt = jwt
+
+    def encode(self, claims: dict) -> str:
+        return self._jwt.encode(claims, self.key, algorithm=self.algorithm)
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        try:
+            return self._jwt.decode(token, self.key, algorithms=[self.algorithm])
+        except self._jwt.ExpiredSignatureError as exc:
+            raise ExpiredTokenError("Token has expired") from exc
+        except self._jwt.InvalidTokenError as exc:
+            raise InvalidTokenError(f"Invalid token: {exc}") from exc
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+def _b64decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+class HS256Backend(JWTBackend):
+    """
+    Minimal HS256 codec on the standard library.
+    The HMAC is keyed once and copied for every token, and tokens carrying the header
+    this backend emits skip the header parse. It checks the signature, exp and nbf,
+    which is all the application relies on.
+    """
+
+    HEADER = _b64encode(b'{"alg":"HS256","typ":"JWT"}')
+
+    def __init__(self, key: str, algorithm: str = "HS256"):
+        if algorithm != "HS256":
+            raise ValueError(f"The hs256 JWT backend cannot use {algorithm}")
+        super().__init__(key, algorithm)
+        self._mac = hmac.new(key.encode(), digestmod=hashlib.sha256)
+        self._header = self.HEADER.decode()
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return mac.digest()
+
+    def encode(self, claims: dict) -> str:
+        payload = _b64encode(json.dumps(claims, separators=(",", ":")).encode())
+        signing_input = self.HEADER + b"." + payload
+        return (signing_input + b"." + _b64encode(self._sign(signing_input))).decode()
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        try:
+            header, payload, signature = token.split(".")
+            if header == self._header:
+                algorithm = "HS256"
+            else:
+                algorithm = json.loads(_b64decode(header)).get("alg")
+            digest = _b64decode(signature)
+        except (ValueError, AttributeError) as exc:
+            raise InvalidTokenError(f"Invalid token: {exc}") from exc
+        if algorithm != "HS256":
+            raise InvalidTokenError(f"Invalid token: unexpected algorithm {algorithm}")
+        if not hmac.compare_digest(self._sign(f"{header}.{payload}".encode()), digest):
+            raise InvalidTokenError("Invalid token: Signature verification failed.")
+
+        try:
+            claims = json.loads(_b64decode(payload))
+        except ValueError as exc:
+            raise InvalidTokenError(f"Invalid token: {exc}") from exc
+        if not isinstance(claims, dict):
+            raise InvalidTokenError("Invalid token: claims are not a JSON object")
+
+        now = time.time()
+        for claim in ("exp", "nbf"):
+            if claim in claims and not isinstance(claims[claim], (int, float)):
+                raise InvalidTokenError(f"Invalid token: {claim} must be a number")
+        if "exp" in claims and claims["exp"] < now:
+            raise ExpiredTokenError("Token has expired")
+        if "nbf" in claims and claims["nbf"] > now:
+            raise InvalidTokenError("Invalid token: The token is not yet valid (nbf)")
+        return claims
+
+JWT_BACKENDS = {
+    "jose": JoseBackend,
+    "pyjwt": PyJWTBackend,
+    "hs256": HS256Backend,
+}
+
+def create_jwt_backend(name: str, key: str, algorithm: str) -> JWTBackend:
+    """
+    Build the backend registered under `name` ("jose", "pyjwt" or "hs256").
+    """
+    try:
+        backend = JWT_BACKENDS[name]
+    except KeyError as exc:
+        raise RuntimeError(f"Unknown JWT backend: {name}") from exc
+    return backend(key, algorithm)
@@ -0,0 +1,271 @@
+"""
+    In-process metrics in the Prometheus text exposition format.
+    Counters, gauges and histograms are plain Python numbers keyed by label values.
+    They are only updated from the event loop thread, so no lock is taken and
+    recording a sample costs a dictionary lookup and an addition (a bisect for
+    histograms). Values derived from other components (connection pools, caches) are
+    read when the registry is rendered instead of being tracked on every change.
+
+    The per-request state used to attribute database time to a route lives in a
+    context variable set by the metrics middleware and updated by the instrumented
+    database cursors (see app.utils.query_stats).
+"""
+
+import contextvars
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: tuple, values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+class Metric:
+    """
+    Base class of the metrics of a Registry.
+
+    Args:
+        name (str): Metric name, e.g. "http_requests_total".
+        documentation (str): Text of the HELP line.
+        labels (Iterable[str]): Label names, in the order values are passed.
+    """
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+
+    def samples(self) -> Iterable[Tuple[str, tuple, float, str]]:
+        """Yield (suffix, label values, value, extra label) tuples."""
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        """Return the exposition lines of the metric."""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        for suffix, values, value, extra in self.samples():
+            labels = _format_labels(self.labels, values, extra)
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return lines
+
+class Counter(Metric):
+    """
+    Monotonic counter.
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Iterable[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[tuple, float] = {}
+
+    def inc(self, labels: tuple = (), amount: float = 1):
+        """Add `amount` to the series identified by `labels`."""
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self):
+        for values, value in self._values.items():
+            yield "", values, value, ""
+
+class Gauge(Counter):
+    """
+    Value that may go up and down.
+    """
+
+    kind = "gauge"
+
+    def dec(self, labels: tuple = (), amount: float = 1):
+        """Subtract `amount` from the series identified by `labels`."""
+        self._values[labels] = self._values.get(labels, 0) - amount
+
+    def set(self, labels: tuple = (), value: float = 0):
+        """Set the series identified by `labels` to `value`."""
+        self._values[labels] = value
+
+class Histogram(Metric):
+    """
+    Histogram with fixed upper bounds.
+    Only the count of the bucket a sample falls into is incremented; the cumulative
+    counts Prometheus expects are computed when rendering.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str] = (),
+        buckets: Iterable[float] = LATENCY_BUCKETS
+    ):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[tuple, list] = {}
+
+    def observe(self, value: float, labels: tuple = ()):
+        """Record `value` in the series identified by `labels`."""
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def samples(self):
+        for values, (counts, total) in self._series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                yield "_bucket", values, cumulative, f'le="{_format_value(float(bound))}"'
+            yield "_sum", values, total, ""
+            yield "_count", values, cumulative, ""
+
+class CallbackMetric(Metric):
+    """
+    Metric whose values are read from `callback` at render time.
+    The callback returns a mapping of label values to the current value.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Iterable[str],
+        callback: Callable[[], Dict[tuple, float]],
+        kind: str = "gauge"
+    ):
+        super().__init__(name, documentation, labels)
+        self.callback = callback
+        self.kind = kind
+
+    def samples(self):
+        for values, value in self.callback().items():
+            yield "", values, value, ""
+
+class Registry:
+    """
+    Collection of metrics rendered together.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        """Add `metric` to the registry and return it."""
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+registry = Registry()
+
+REQUESTS = registry.register(Counter(
+    "marloy_http_requests_total",
+    "HTTP requests handled, by method, route template and status code.",
+    ("method", "route", "status")
+))
+REQUEST_DURATION = registry.register(Histogram(
+    "marloy_http_request_duration_seconds",
+    "Time from receiving a request to sending the last byte of its response.",
+    ("method", "route")
+))
+IN_FLIGHT = registry.register(Gauge(
+    "marloy_http_requests_in_flight",
+    "HTTP requests currently being handled."
+))
+DB_QUERY_DURATION = registry.register(Histogram(
+    "marloy_db_query_duration_seconds",
+    "Duration of the SQL statements executed while handling a route.",
+    ("route",)
+))
+REQUEST_DB_DURATION = registry.register(Histogram(
+    "marloy_http_request_db_seconds",
+    "Total time spent executing SQL statements per request, by route.",
+    ("route",)
+))
+
+class RequestMetrics:  # pylint: disable=too-few-public-methods
+    """
+    Database time accumulated while handling one request.
+    """
+
+    __slots__ = ("scope", "db_seconds", "db_queries")
+
+    def __init__(self, scope: dict):
+        self.scope = scope
+        self.db_seconds = 0.0
+        self.db_queries = 0
+
+    @property
+    def route(self) -> str:
+        """Template of the route that matched the request, or "unmatched"."""
+        return route_template(self.scope)
+
+_route_templates = {}
+
+def register_route_templates(router, prefix: str):
+    """
+    Record the full path template of every route of `router`, included under `prefix`.
+    The route FastAPI leaves in the scope may only know its path inside the router
+    ("/{id}"), which would merge the series of every router into one.
+    """
+    for route in router.routes:
+        path = getattr(route, "path", None)
+        if path is not None:
+            _route_templates[id(route)] = (route, prefix + path)
+
+def registered_routes() -> list:
+    """Return the (route, template) pairs recorded by register_route_templates()."""
+    return list(_route_templates.values())
+
+def route_template(scope: dict) -> str:
+    """
+    Return the path template of the route matched for `scope` ("/v1/insumos/{id}").
+    Templates keep the number of series bounded, unlike raw paths.
+    """
+    route = scope.get("route")
+    registered = _route_templates.get(id(route))
+    if registered is not None:
+        return registered[1]
+    return getattr(route, "path", None) or "unmatched"
+
+current_request: contextvars.ContextVar[Optional[RequestMetrics]] = contextvars.ContextVar(
+    "current_request", default=None
+)
+
+def record_query(duration: float):
+    """
+    Attribute a statement that took `duration` seconds to the current request.
+    Statements executed outside a request are ignored.
+    """
+    request = current_request.get()
+    if request is None:
+        return
+    request.db_seconds += duration
+    request.db_queries += 1
+    DB_QUERY_DURATION.observe(duration, (request.route,))
@@ -0,0 +1,173 @@
+"""
+    Pagination helpers shared by the list endpoints.
+    Endpoints page with LIMIT/OFFSET by default and switch to keyset pagination
+    on the primary key when the client sends the opaque `after` cursor.
+    Total counts are cached for a short time and invalidated by the write endpoints,
+    and clients may ask for an estimated count or no count at all.
+
+    Raises:
+        HTTPException: If the cursor sent by the client cannot be decoded.
+
+    Returns:
+        tuple: The SQL query and its parameters for the requested page.
+"""
+
+import base64
+import binascii
+import json
+import math
+from enum import Enum
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+from fastapi import Depends, HTTPException, Query, status
+
+from app.config import settings
+from app.utils.cache import TTLCache
+from app.utils.conditional import conditional_get
+
+class CountMode(str, Enum):
+    """
+    How the total number of rows of a paginated list is computed.
+
+    Attributes:
+        EXACT: SELECT COUNT(*), cached for COUNT_CACHE_TTL seconds.
+        ESTIMATE: Row estimate from the InnoDB table statistics.
+        NONE: The total is not computed.
+    """
+
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+    NONE = "none"
+
+count_cache = TTLCache(ttl=settings.COUNT_CACHE_TTL)
+
+class PageRequest(NamedTuple):
+    """
+    Query parameters of a list endpoint, with the ETag of its conditional GET.
+
+    Attributes:
+        page (int): Page number, for LIMIT/OFFSET pagination.
+        page_size (int): Items per page.
+        after (str | None): Cursor from next_cursor, for keyset pagination.
+        count (CountMode): How the total number of rows is computed.
+        etag (str | None): ETag derived from the table versions, None if unavailable.
+    """
+
+    page: int
+    page_size: int
+    after: Optional[str]
+    count: CountMode
+    etag: Optional[str]
+
+def page_request(*tables: str):
+    """
+    Build a dependency reading the pagination parameters of a list of `tables`.
+    It runs the conditional GET check of those tables first (see app.utils.conditional),
+    so an unchanged list is answered with 304 before a connection is borrowed.
+    """
+
+    async def read_page_request(
+        page: int = Query(1, ge=1, description="Page number"),
+        page_size: int = Query(10, ge=1, le=100, description="Items per page"),
+        after: Optional[str] = Query(
+            None, description="Cursor from next_cursor (keyset pagination)"
+        ),
+        count: CountMode = Query(CountMode.EXACT, description="exact, estimate or none"),
+        etag: Optional[str] = Depends(conditional_get(*tables))
+    ) -> PageRequest:
+        return PageRequest(page, page_size, after, count, etag)
+
+    return read_page_request
+
+def encode_cursor(key: Any) -> str:
+    """
+    Encode the primary key of the last row of a page into an opaque cursor.
+    """
+    raw = json.dumps([key], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+def decode_cursor(cursor: str) -> Any:
+    """
+    Decode a cursor produced by encode_cursor and return the primary key it holds.
+    Only integer and string keys are accepted, as those are the primary key types.
+    """
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        if not isinstance(key, list) or len(key) != 1:
+            raise ValueError("Malformed cursor")
+        if isinstance(key[0], bool) or not isinstance(key[0], (int, str)):
+            raise ValueError("Cursor key is not an integer or a string")
+        return key[0]
+    except (ValueError, binascii.Error) as err:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor"
+        ) from err
+
+def build_page_query(
+    base_query: str,
+    key: str,
+    page: int,
+    page_size: int,
+    after: Optional[str] = None
+) -> Tuple[str, tuple]:
+    """
+    Build the query for one page of `base_query`, ordered by the `key` column.
+    With a cursor the page is located through the primary key index (WHERE key > cursor),
+    so its cost does not grow with the position of the page.
+    """
+    if after is None:
+        query = f"{base_query} ORDER BY {key} LIMIT %s OFFSET %s"
+        return query, (page_size, (page - 1) * page_size)
+
+    query = f"{base_query} WHERE {key} > %s ORDER BY {key} LIMIT %s"
+    return query, (decode_cursor(after), page_size)
+
+def next_cursor(rows: List[dict], key: str, page_size: int) -> Optional[str]:
+    """
+    Return the cursor for the page following `rows`, or None when it was the last page.
+    """
+    if len(rows) < page_size:
+        return None
+    return encode_cursor(rows[-1][key])
+
+async def count_rows(cursor, table: str, mode: CountMode = CountMode.EXACT) -> Optional[int]:
+    """
+    Return the number of rows of `table` following the requested count mode.
+    `table` is interpolated in the query, so it must never come from user input.
+    """
+    if mode == CountMode.NONE:
+        return None
+
+    if mode == CountMode.ESTIMATE:
+        query = """
+            SELECT TABLE_ROWS AS total
+            FROM information_schema.TABLES
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+        """
+        await cursor.execute(query, (table,))
+        row = await cursor.fetchone()
+        return int(row['total'] or 0) if row else 0
+
+    total = count_cache.get(table)
+    if total is None:
+        await cursor.execute(f"SELECT COUNT(*) as total FROM {table}")
+        total = (await cursor.fetchone())['total']
+        count_cache.set(table, total)
+    return total
+
+def invalidate_count(*tables: str) -> None:
+    """
+    Forget the cached totals of `tables` after rows were inserted or deleted.
+    """
+    for table in tables:
+        count_cache.delete(table)
+
+def page_count(total_items: Optional[int], page_size: int) -> Optional[int]:
+    """
+    Return the number of pages for `total_items`, or None when the total is unknown.
+    """
+    if total_items is None:
+        return None
+    return math.ceil(total_items / page_size) if total_items > 0 else 1
@@ -0,0 +1,107 @@
+"""
+    Password hashing helpers.
+    Passwords are stored as argon2 hashes. Hashing and verification are CPU bound, so
+    they run in a small process pool instead of on the event loop or in the threadpool
+    used by FastAPI. Rows of the login table that still hold a plaintext password are
+    accepted and hashed on the next successful login.
+
+    Returns:
+        str: The argon2 hash of a password.
+        tuple[bool, str | None]: Whether a password matches and the hash to store
+        when the row has to be rehashed.
+"""
+
+import asyncio
+import hmac
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple
+
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
+from app.config import settings
+
+HASH_PREFIX = "$argon2"
+
+_hasher = PasswordHasher()
+
+def _hash(password: str) -> str:
+    return _hasher.hash(password)
+
+def _verify(stored: str, password: str) -> Tuple[bool, Optional[str]]:
+    try:
+        _hasher.verify(stored, password)
+    except (VerificationError, InvalidHashError):
+        return False, None
+    if _hasher.check_needs_rehash(stored):
+        return True, _hasher.hash(password)
+    return True, None
+
+class _PasswordPool:
+    """
+    Worker processes started on first use, and the dummy hash unknown emails are
+    checked against, computed on first use as well.
+    """
+
+    def __init__(self):
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.dummy_hash: Optional[str] = None
+
+    def executor(self) -> ProcessPoolExecutor:
+        """Return the process pool, starting it if needed."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def shutdown(self):
+        """Stop the worker processes, if they were started."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+_pool = _PasswordPool()
+
+async def _run(function, *args):
+    return await asyncio.get_running_loop().run_in_executor(_pool.executor(), function, *args)
+
+def is_hashed(stored: str) -> bool:
+    """
+    Return whether a stored password is an argon2 hash rather than legacy plaintext.
+    """
+    return stored.startswith(HASH_PREFIX)
+
+async def hash_password(password: str) -> str:
+    """
+    Hash `password` in the process pool.
+    """
+    return await _run(_hash, password)
+
+async def verify_password(stored: Optional[str], password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Check `password` against the stored value of a login row.
+    Returns whether it matches and, when it does and the row holds plaintext or a hash
+    with outdated parameters, the new hash to store. A missing row (`stored` None) is
+    checked against a dummy hash so unknown emails take as long as wrong passwords.
+    """
+    if stored is None:
+        if _pool.dummy_hash is None:
+            _pool.dummy_hash = await hash_password("dummy-password")
+        await _run(_verify, _pool.dummy_hash, password)
+        return False, None
+
+    if is_hashed(stored):
+        return await _run(_verify, stored, password)
+
+    if not hmac.compare_digest(stored.encode(), password.encode()):
+        return False, None
+    return True, await hash_password(password)
+
+def shutdown_password_pool():
+    """
+    Stop the worker processes of the pool, if it was started.
+    """
+    _pool.shutdown()
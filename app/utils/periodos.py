@@ -0,0 +1,26 @@
+"""
+    Date range helpers for reports.
+    Reports filter by half-open ranges (fecha >= start AND fecha < end) instead of
+    applying MONTH()/YEAR() to the column, so MySQL can use the indexes on fecha.
+"""
+
+from datetime import datetime
+from typing import Tuple
+
+def next_month(year: int, month: int) -> Tuple[int, int]:
+    """
+    Return the (year, month) following the given one.
+    """
+    return (year + 1, 1) if month == 12 else (year, month + 1)
+
+def month_range(year: int, month: int) -> Tuple[datetime, datetime]:
+    """
+    Return the [start, end) datetimes covering the given month.
+    """
+    return datetime(year, month, 1), datetime(*next_month(year, month), 1)
+
+def year_range(year: int) -> Tuple[datetime, datetime]:
+    """
+    Return the [start, end) datetimes covering the given year.
+    """
+    return datetime(year, 1, 1), datetime(year + 1, 1, 1)
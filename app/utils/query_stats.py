@@ -0,0 +1,233 @@
+"""
+    SQL statement instrumentation.
+    Cursors opened on pooled async connections are wrapped in an InstrumentedCursor,
+    which aggregates every statement under its fingerprint: the SQL text with literals
+    and placeholders replaced by "?" and IN lists and multi-row VALUES collapsed, so
+    all the calls of a query share one entry whatever their parameters.
+
+    For each fingerprint the number of calls, the total and maximum execution time,
+    the rows returned or affected and the routes that ran it are kept in memory, and
+    statements slower than SLOW_QUERY_THRESHOLD are logged. The execution time is
+    the time spent in execute(), which covers running the statement in MySQL up to
+    the first result packet; reading the rows of an unbuffered cursor is not timed.
+    Each execution is also a client span of the current trace (see app.utils.tracing),
+    carrying the fingerprint rather than the parameters.
+"""
+
+import logging
+import re
+import time
+from enum import Enum
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from app.config import settings
+from app.utils.metrics import current_request, record_query
+from app.utils.tracing import SpanKind, start_span
+
+logger = logging.getLogger(__name__)
+
+_STRING = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.|\"\")*\"")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?:e[+-]?\d+)?\b", re.IGNORECASE)
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_ROWS = re.compile(r"(\([^()]*\))(?:\s*,\s*\([^()]*\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+@lru_cache(maxsize=1024)
+def fingerprint(statement: str) -> str:
+    """
+    Return the normalized form of `statement` its statistics are grouped under.
+    """
+    statement = _STRING.sub("?", statement)
+    statement = _PLACEHOLDER.sub("?", statement)
+    statement = _NUMBER.sub("?", statement)
+    statement = _IN_LIST.sub("IN (...)", statement)
+    statement = _ROWS.sub(r"\1, ...", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+class QueryOrder(str, Enum):
+    """
+    Execution time the slowest fingerprints are ranked by.
+
+    Attributes:
+        MAX: Slowest single execution.
+        MEAN: Average execution time.
+        TOTAL: Time spent over all executions.
+    """
+
+    MAX = "max"
+    MEAN = "mean"
+    TOTAL = "total"
+
+class QueryStat:  # pylint: disable=too-few-public-methods
+    """
+    Aggregated statistics of one fingerprint.
+    """
+
+    __slots__ = ("calls", "total_seconds", "max_seconds", "rows", "routes")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.rows = 0
+        self.routes: Dict[str, int] = {}
+
+class QueryStats:
+    """
+    In-memory statistics of the statements executed by the process, by fingerprint.
+
+    Args:
+        max_fingerprints (int): Fingerprints tracked; statements with a new
+        fingerprint are only counted as dropped once the limit is reached.
+    """
+
+    def __init__(self, max_fingerprints: int):
+        self.max_fingerprints = max_fingerprints
+        self.dropped = 0
+        self._stats: Dict[str, QueryStat] = {}
+
+    def get(self, key: str) -> Optional[QueryStat]:
+        """Return the entry of fingerprint `key`, creating it while there is room."""
+        stat = self._stats.get(key)
+        if stat is None:
+            if len(self._stats) >= self.max_fingerprints:
+                self.dropped += 1
+                return None
+            stat = self._stats[key] = QueryStat()
+        return stat
+
+    def record(self, key: str, duration: float, route: str) -> Optional[QueryStat]:
+        """Count a call of fingerprint `key` that took `duration` seconds on `route`."""
+        stat = self.get(key)
+        if stat is not None:
+            stat.calls += 1
+            stat.total_seconds += duration
+            stat.max_seconds = max(stat.max_seconds, duration)
+            stat.routes[route] = stat.routes.get(route, 0) + 1
+        return stat
+
+    def top(self, limit: int, order_by: QueryOrder = QueryOrder.MAX) -> List[dict]:
+        """
+        Return the `limit` slowest fingerprints, ranked by `order_by`.
+        """
+        keys = {
+            QueryOrder.MAX: lambda item: item[1].max_seconds,
+            QueryOrder.MEAN: lambda item: item[1].total_seconds / item[1].calls,
+            QueryOrder.TOTAL: lambda item: item[1].total_seconds,
+        }
+        items = [item for item in self._stats.items() if item[1].calls]
+        items.sort(key=keys[QueryOrder(order_by)], reverse=True)
+        return [
+            {
+                "fingerprint": key,
+                "calls": stat.calls,
+                "total_seconds": stat.total_seconds,
+                "mean_seconds": stat.total_seconds / stat.calls,
+                "max_seconds": stat.max_seconds,
+                "rows": stat.rows,
+                "routes": sorted(stat.routes, key=stat.routes.get, reverse=True),
+            }
+            for key, stat in items[:limit]
+        ]
+
+    def reset(self):
+        """Forget every fingerprint."""
+        self._stats.clear()
+        self.dropped = 0
+
+query_stats = QueryStats(settings.QUERY_STATS_MAX_FINGERPRINTS)
+
+def _current_route() -> str:
+    request = current_request.get()
+    return request.route if request is not None else "background"
+
+def _fingerprint_of(operation) -> str:
+    if isinstance(operation, bytes):
+        operation = operation.decode("utf-8", "replace")
+    return fingerprint(operation)
+
+def _statement_span(key: str):
+    operation = key.split(" ", 1)[0].upper()
+    return start_span(
+        operation,
+        SpanKind.CLIENT,
+        attributes={"db.system": "mysql", "db.operation": operation, "db.statement": key}
+    )
+
+class InstrumentedCursor:
+    """
+    Proxy around an async cursor recording the statements it executes.
+    Every attribute not overridden here is delegated to the underlying cursor.
+    """
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self._stat = None
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    async def execute(self, operation, params=None, **kwargs):
+        """Execute `operation` and record it under its fingerprint."""
+        key = _fingerprint_of(operation)
+        with _statement_span(key):
+            start = time.perf_counter()
+            try:
+                return await self._cursor.execute(operation, params, **kwargs)
+            finally:
+                self._record(key, time.perf_counter() - start)
+
+    async def executemany(self, operation, seq_params, **kwargs):
+        """Execute `operation` for every item of `seq_params` and record it once."""
+        key = _fingerprint_of(operation)
+        with _statement_span(key):
+            start = time.perf_counter()
+            try:
+                return await self._cursor.executemany(operation, seq_params, **kwargs)
+            finally:
+                self._record(key, time.perf_counter() - start)
+
+    async def fetchone(self):
+        """Fetch the next row, counting it for the last statement."""
+        row = await self._cursor.fetchone()
+        if row is not None:
+            self._add_rows(1)
+        return row
+
+    async def fetchmany(self, *args, **kwargs):
+        """Fetch the next rows, counting them for the last statement."""
+        rows = await self._cursor.fetchmany(*args, **kwargs)
+        self._add_rows(len(rows))
+        return rows
+
+    async def fetchall(self):
+        """Fetch the remaining rows, counting them for the last statement."""
+        rows = await self._cursor.fetchall()
+        self._add_rows(len(rows))
+        return rows
+
+    def _record(self, key: str, duration: float):
+        record_query(duration)
+        route = _current_route()
+        self._stat = query_stats.record(key, duration, route)
+
+        affected = None
+        if self._cursor.description is None and self._cursor.rowcount >= 0:
+            affected = self._cursor.rowcount
+            self._add_rows(affected)
+
+        threshold = settings.SLOW_QUERY_THRESHOLD
+        if 0 < threshold <= duration:
+            if affected is None:
+                logger.warning("Slow query (%.3fs) on %s: %s", duration, route, key)
+            else:
+                logger.warning(
+                    "Slow query (%.3fs, %d rows affected) on %s: %s",
+                    duration, affected, route, key
+                )
+
+    def _add_rows(self, count: int):
+        if self._stat is not None:
+            self._stat.rows += count
@@ -0,0 +1,71 @@
+"""
+    Application-wide JSON response classes.
+    FastAPI's JSONResponse encodes with json.dumps. FastJSONResponse uses orjson,
+    which writes datetime, date, UUID and enums natively, and falls back to a small
+    hook for Decimal and Pydantic models, so a handler can also return it directly
+    with raw database rows and skip jsonable_encoder. The class used by default is
+    chosen with the JSON_RESPONSE_CLASS setting.
+
+    Raises:
+        RuntimeError: If the orjson class is selected and orjson is not installed.
+"""
+
+from decimal import Decimal
+from typing import Any, Type
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.config import settings
+from app.utils.tracing import start_span
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _orjson_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson.
+    """
+
+    def render(self, content: Any) -> bytes:
+        with start_span("serialize", attributes={"serialization.encoder": "orjson"}):
+            return orjson.dumps(
+                content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS
+            )
+
+class StandardJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with json.dumps.
+    """
+
+    def render(self, content: Any) -> bytes:
+        with start_span("serialize", attributes={"serialization.encoder": "json"}):
+            return super().render(content)
+
+RESPONSE_CLASSES = {
+    "orjson": FastJSONResponse,
+    "standard": StandardJSONResponse,
+}
+
+def default_response_class() -> Type[JSONResponse]:
+    """
+    Return the response class selected by JSON_RESPONSE_CLASS ("orjson" or "standard").
+    """
+    try:
+        response_class = RESPONSE_CLASSES[settings.JSON_RESPONSE_CLASS]
+    except KeyError as exc:
+        raise RuntimeError(
+            f"Unknown JSON response class: {settings.JSON_RESPONSE_CLASS}"
+        ) from exc
+    if response_class is FastJSONResponse and orjson is None:
+        raise RuntimeError("The orjson response class requires the orjson package")
+    return response_class
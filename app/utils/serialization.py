@@ -0,0 +1,94 @@
+"""
+    Fast rendering of the response envelopes.
+    Building one Pydantic model per row and letting FastAPI validate the result again
+    through `response_model` validates every row twice, in Python. These helpers
+    validate the raw database rows once against the envelope type with a cached
+    TypeAdapter and serialize them to JSON in pydantic-core, returning a Response that
+    FastAPI sends as is. The declared `response_model` still documents the endpoint.
+
+    A rendered envelope keeps the JSON without the timestamp, its ETag and the time it
+    was built, so it can be cached and stamped again for every response.
+
+    Returns:
+        Response: The JSON encoded envelope, with ETag and Last-Modified headers.
+"""
+
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Type
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+from app.schemas.common import APIResponse, APIResponsePaginated
+from app.utils.http_cache import etag_for, http_date, stamp
+from app.utils.tracing import start_span
+
+JSON_MEDIA_TYPE = "application/json"
+
+class RenderedEnvelope(NamedTuple):
+    """
+    Envelope encoded without its timestamp, ready to be cached and stamped.
+
+    Attributes:
+        payload (str): JSON of the envelope without the timestamp field.
+        etag (str): ETag derived from the payload.
+        generated_at (int): Unix time the data was read, sent as Last-Modified.
+    """
+
+    payload: str
+    etag: str
+    generated_at: int
+
+@lru_cache(maxsize=None)
+def envelope_adapter(envelope: type, model: Type[BaseModel]) -> TypeAdapter:
+    """
+    Return the TypeAdapter of `envelope[model]`, built once per pair.
+    """
+    return TypeAdapter(envelope[model])
+
+def render(envelope: type, model: Type[BaseModel], content: Dict[str, Any]) -> RenderedEnvelope:
+    """
+    Validate `content` as `envelope[model]` and encode it without the timestamp.
+    """
+    adapter = envelope_adapter(envelope, model)
+    with start_span("serialize", attributes={"serialization.model": model.__name__}):
+        payload = adapter.dump_json(adapter.validate_python(content), exclude={"timestamp"})
+    return RenderedEnvelope(payload.decode(), etag_for(payload), int(time.time()))
+
+def render_page(model: Type[BaseModel], rows: List[dict], **fields) -> RenderedEnvelope:
+    """
+    Render a page of database rows as APIResponsePaginated[model].
+    `fields` are the remaining envelope fields (total_items, page, next_cursor...).
+    """
+    return render(APIResponsePaginated, model, {"success": True, "data": rows, **fields})
+
+def render_item(model: Type[BaseModel], row: dict) -> RenderedEnvelope:
+    """
+    Render a single database row as APIResponse[model].
+    """
+    return render(APIResponse, model, {"success": True, "data": row})
+
+def envelope_response(rendered: Sequence, etag: Optional[str] = None) -> Response:
+    """
+    Build the response of a rendered envelope, stamped with the current time.
+    Accepts a RenderedEnvelope or the list it becomes after a JSON round trip.
+    `etag`, when given (see app.utils.conditional), replaces the payload ETag.
+    """
+    payload, payload_etag, generated_at = rendered
+    return Response(
+        content=stamp(payload.encode(), int(time.time())),
+        media_type=JSON_MEDIA_TYPE,
+        headers={"ETag": etag or payload_etag, "Last-Modified": http_date(generated_at)}
+    )
+
+def paginated_response(
+    model: Type[BaseModel],
+    rows: List[dict],
+    etag: Optional[str] = None,
+    **fields
+) -> Response:
+    """
+    Render a page of database rows and return it as a response.
+    """
+    return envelope_response(render_page(model, rows, **fields), etag)
@@ -0,0 +1,30 @@
+"""
+    Denylist of used and revoked refresh tokens.
+    Refresh tokens are single use: renewing a session records the jti of the token it
+    consumed until that token would have expired anyway, so a replayed token is
+    rejected. Only the jti is stored. Entries live on the shared cache backend, so
+    with the Redis backend a token consumed by one worker is rejected by all of them.
+
+    Returns:
+        bool: Whether the token was still usable when it was revoked.
+"""
+
+import time
+
+from app.config import settings
+from app.utils.cache import get_cache
+from app.utils.cache_backend import shared_cache
+
+NAMESPACE = "revoked_tokens"
+
+# Registered up front so the memory backend uses the denylist bound, not the catalog one.
+get_cache(NAMESPACE, max_entries=settings.TOKEN_DENYLIST_MAX_ENTRIES)
+denylist = shared_cache(NAMESPACE)
+
+async def revoke_token(payload: dict) -> bool:
+    """
+    Revoke the refresh token with the given claims.
+    Returns False if it had already been revoked, which makes check-and-revoke atomic.
+    """
+    ttl = max(payload["exp"] - time.time(), 1)
+    return await denylist.add(payload["jti"], 1, ttl)
@@ -0,0 +1,313 @@
+"""
+    Lightweight tracing compatible with OpenTelemetry.
+    Spans carry 128-bit trace ids and 64-bit span ids, are linked to their parent
+    through a context variable and are exported in the OTLP/JSON span format, so the
+    output can be loaded by any OpenTelemetry tooling. Incoming W3C trace context
+    (the traceparent and tracestate headers) is continued by the request span.
+
+    Exporters:
+        none: Tracing is disabled and start_span() returns a shared no-op span.
+        memory: Finished spans are kept in a bounded in-memory buffer (for tests).
+        file: Finished spans are appended to TRACING_FILE, one JSON object per line.
+
+    Root spans are sampled with TRACING_SAMPLE_RATIO; spans with a parent follow
+    the sampling decision of the parent, including a remote one.
+"""
+
+import json
+import random
+import re
+import time
+from collections import deque
+from contextvars import ContextVar
+from enum import Enum
+from typing import List, NamedTuple, Optional
+
+from app.config import settings
+
+_TRACEPARENT = re.compile(r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})(-.*)?$")
+_INVALID_TRACE_ID = "0" * 32
+_INVALID_SPAN_ID = "0" * 16
+
+class SpanKind(str, Enum):
+    """
+    Role of a span, named as in OpenTelemetry.
+    """
+
+    INTERNAL = "SPAN_KIND_INTERNAL"
+    SERVER = "SPAN_KIND_SERVER"
+    CLIENT = "SPAN_KIND_CLIENT"
+
+class SpanContext(NamedTuple):
+    """
+    Identity of a span as propagated between services.
+
+    Attributes:
+        trace_id (str): 32 hexadecimal digits.
+        span_id (str): 16 hexadecimal digits.
+        sampled (bool): Whether the spans of the trace are recorded.
+        trace_state (str | None): Vendor data of the tracestate header, passed along as is.
+    """
+
+    trace_id: str
+    span_id: str
+    sampled: bool
+    trace_state: Optional[str] = None
+
+def parse_traceparent(traceparent: Optional[str], tracestate: Optional[str] = None):
+    """
+    Return the SpanContext of a W3C traceparent header, or None if it is missing or invalid.
+    """
+    if not traceparent:
+        return None
+    match = _TRACEPARENT.match(traceparent.strip().lower())
+    if match is None:
+        return None
+    version, trace_id, span_id, flags, rest = match.groups()
+    if version == "ff" or (version == "00" and rest):
+        return None
+    if trace_id == _INVALID_TRACE_ID or span_id == _INVALID_SPAN_ID:
+        return None
+    return SpanContext(trace_id, span_id, bool(int(flags, 16) & 1), tracestate)
+
+def format_traceparent(context: SpanContext) -> str:
+    """
+    Return the W3C traceparent header of `context`.
+    """
+    return f"00-{context.trace_id}-{context.span_id}-{'01' if context.sampled else '00'}"
+
+def _otlp_value(value) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+class Span:  # pylint: disable=too-many-instance-attributes
+    """
+    Timed operation of a trace, used as a context manager.
+    Entering it makes it the parent of the spans started inside; leaving it ends it,
+    recording the exception that escaped, if any, and hands it to the exporter when
+    the trace is sampled.
+    """
+
+    __slots__ = (
+        "name", "kind", "context", "parent_id", "attributes",
+        "start_ns", "end_ns", "status", "status_message", "_token"
+    )
+
+    def __init__(self, name: str, kind: SpanKind, context: SpanContext, parent_id: Optional[str]):
+        self.name = name
+        self.kind = kind
+        self.context = context
+        self.parent_id = parent_id
+        self.attributes = {}
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.status = "STATUS_CODE_UNSET"
+        self.status_message = None
+        self._token = None
+
+    def update_name(self, name: str):
+        """Rename the span, e.g. once the route of a request is known."""
+        self.name = name
+
+    def set_attribute(self, key: str, value):
+        """Set the attribute `key` of the span."""
+        self.attributes[key] = value
+
+    def set_error(self, message: Optional[str] = None):
+        """Mark the span as failed."""
+        self.status = "STATUS_CODE_ERROR"
+        self.status_message = message
+
+    def record_exception(self, exc: BaseException):
+        """Mark the span as failed by `exc`, with the OpenTelemetry exception attributes."""
+        self.attributes["exception.type"] = type(exc).__qualname__
+        self.attributes["exception.message"] = str(exc)
+        self.set_error(str(exc))
+
+    def end(self):
+        """End the span and export it if its trace is sampled."""
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.time_ns()
+        if self.context.sampled and exporter is not None:
+            exporter.export(self)
+
+    def to_otlp(self) -> dict:
+        """Return the span in the OTLP/JSON format."""
+        span = {
+            "traceId": self.context.trace_id,
+            "spanId": self.context.span_id,
+            "name": self.name,
+            "kind": self.kind.value,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in self.attributes.items()
+            ],
+            "status": {"code": self.status},
+        }
+        if self.parent_id is not None:
+            span["parentSpanId"] = self.parent_id
+        if self.context.trace_state:
+            span["traceState"] = self.context.trace_state
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        return span
+
+    def __enter__(self):
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        _current_span.reset(self._token)
+        if exc is not None:
+            self.record_exception(exc)
+        self.end()
+        return False
+
+class _NoopSpan:
+    """
+    Span returned while tracing is disabled; every method does nothing.
+    """
+
+    def update_name(self, name: str):
+        """Ignore the name."""
+
+    def set_attribute(self, key: str, value):
+        """Ignore the attribute."""
+
+    def set_error(self, message: Optional[str] = None):
+        """Ignore the error."""
+
+    def record_exception(self, exc: BaseException):
+        """Ignore the exception."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+NOOP_SPAN = _NoopSpan()
+
+def tracing_enabled() -> bool:
+    """Return whether spans are being exported."""
+    return exporter is not None
+
+def current_span() -> Optional[Span]:
+    """Return the span the running code belongs to, if any."""
+    return _current_span.get()
+
+def start_span(
+    name: str,
+    kind: SpanKind = SpanKind.INTERNAL,
+    parent: Optional[SpanContext] = None,
+    attributes: Optional[dict] = None
+):
+    """
+    Start a span, child of `parent` or else of the current span.
+    Use it as a context manager: `with start_span("name") as span: ...`.
+    """
+    if exporter is None:
+        return NOOP_SPAN
+    if parent is None:
+        current = _current_span.get()
+        parent = current.context if current is not None else None
+
+    if parent is None:
+        trace_id = f"{random.getrandbits(128) or 1:032x}"
+        sampled = random.random() < settings.TRACING_SAMPLE_RATIO
+        context = SpanContext(trace_id, f"{random.getrandbits(64) or 1:016x}", sampled)
+        span = Span(name, kind, context, None)
+    else:
+        context = SpanContext(
+            parent.trace_id,
+            f"{random.getrandbits(64) or 1:016x}",
+            parent.sampled,
+            parent.trace_state
+        )
+        span = Span(name, kind, context, parent.span_id)
+    if attributes:
+        span.attributes.update(attributes)
+    return span
+
+class MemorySpanExporter:
+    """
+    Keep the last `max_spans` finished spans in memory.
+    """
+
+    def __init__(self, max_spans: int = 10_000):
+        self._spans = deque(maxlen=max_spans)
+
+    def export(self, span: Span):
+        """Store a finished span."""
+        self._spans.append(span)
+
+    def spans(self, trace_id: Optional[str] = None) -> List[Span]:
+        """Return the stored spans, optionally only those of trace `trace_id`."""
+        return [
+            span for span in self._spans
+            if trace_id is None or span.context.trace_id == trace_id
+        ]
+
+    def clear(self):
+        """Forget every stored span."""
+        self._spans.clear()
+
+    def close(self):
+        """Nothing to release."""
+
+class FileSpanExporter:
+    """
+    Append finished spans to `path` as JSON lines in the OTLP/JSON span format.
+    Spans are buffered and written when the local root span of a trace ends.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._buffer = []
+
+    def export(self, span: Span):
+        """Buffer a finished span, writing the buffer once a local root span ends."""
+        self._buffer.append(json.dumps(span.to_otlp(), separators=(",", ":")))
+        if span.kind == SpanKind.SERVER or span.parent_id is None:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered spans."""
+        if not self._buffer:
+            return
+        lines, self._buffer = self._buffer, []
+        with open(self.path, "a", encoding="utf-8") as output:
+            output.write("\n".join(lines) + "\n")
+
+    def close(self):
+        """Write the spans still buffered."""
+        self.flush()
+
+def create_exporter(name: str):
+    """
+    Build the exporter selected by TRACING_EXPORTER ("none", "memory" or "file").
+    """
+    if name == "none":
+        return None
+    if name == "memory":
+        return MemorySpanExporter(settings.TRACING_MEMORY_MAX_SPANS)
+    if name == "file":
+        return FileSpanExporter(settings.TRACING_FILE)
+    raise RuntimeError(f"Unknown tracing exporter: {name}")
+
+exporter = create_exporter(settings.TRACING_EXPORTER)
+
+def shutdown_tracing():
+    """Flush and release the exporter. Called when the application shuts down."""
+    if exporter is not None:
+        exporter.close()
@@ -0,0 +1,85 @@
+"""
+    Benchmark of the JSON response classes on the largest list responses.
+    Renders pages of registro_consumo and mantenimientos rows, which carry Decimal and
+    datetime columns, with FastAPI's JSONResponse and with FastJSONResponse. Two inputs
+    are measured: raw database rows (what a handler without response_model hands over,
+    which FastAPI first passes through jsonable_encoder) and rows already dumped in
+    JSON mode (what FastAPI passes after validating against response_model).
+
+    Usage:
+        python -m benchmarks.json_response
+        python -m benchmarks.json_response --rows 100 1000 5000
+"""
+
+import argparse
+import timeit
+from datetime import datetime, timedelta
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.utils.responses import FastJSONResponse
+from benchmarks.serialization import consumo_rows
+
+def mantenimiento_rows(count: int) -> List[dict]:
+    """Return `count` rows shaped like SELECT * FROM mantenimientos."""
+    start = datetime(2025, 5, 1, 9)
+    return [
+        {
+            "id": i,
+            "id_maquina": i % 40 + 1,
+            "ci_tecnico": f"{4000000 + i % 25}-{i % 10}",
+            "tipo": "Preventivo" if i % 3 else "Asistencia",
+            "fecha": start + timedelta(hours=5 * i),
+            "observaciones": "Cambio de filtro y limpieza general" if i % 2 else None,
+        }
+        for i in range(1, count + 1)
+    ]
+
+def envelope(rows: List[dict]) -> dict:
+    """Wrap rows in the paginated envelope."""
+    return {
+        "success": True,
+        "data": rows,
+        "total_items": 100_000,
+        "page": 1,
+        "page_size": len(rows),
+        "total_pages": 100_000 // max(len(rows), 1),
+        "next_cursor": None,
+        "timestamp": 1_750_000_000,
+    }
+
+def per_call(function, number: int, repeat: int) -> float:
+    """Return the best time per call of `function`, in microseconds."""
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number * 1e6
+
+def main():
+    """Parse the command line and time every response class and input."""
+    parser = argparse.ArgumentParser(description="Compare JSON response classes.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1000], help="Page sizes")
+    parser.add_argument("--number", type=int, default=200, help="Responses per run")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    args = parser.parse_args()
+
+    print(f"{'table':<18} {'rows':>6} {'input':<6} {'standard us':>12} {'orjson us':>10} "
+          f"{'speedup':>8}")
+    for name, generator in (("registro_consumo", consumo_rows),
+                            ("mantenimientos", mantenimiento_rows)):
+        for count in args.rows:
+            raw = envelope(generator(count))
+            dumped = jsonable_encoder(raw)
+            cases = (
+                ("raw", lambda c=raw: JSONResponse(jsonable_encoder(c)),
+                 lambda c=raw: FastJSONResponse(c)),
+                ("dumped", lambda c=dumped: JSONResponse(c),
+                 lambda c=dumped: FastJSONResponse(c)),
+            )
+            for label, standard, fast in cases:
+                before = per_call(standard, args.number, args.repeat)
+                after = per_call(fast, args.number, args.repeat)
+                print(f"{name:<18} {count:>6} {label:<6} {before:>12.1f} {after:>10.1f} "
+                      f"{before / after:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
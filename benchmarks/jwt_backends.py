@@ -0,0 +1,48 @@
+"""
+    Micro-benchmark of the JWT backends in app.utils.jwt_backends.
+    Encodes and decodes a login-shaped token with every backend whose library is
+    installed and prints the throughput of each operation. Backends that cannot be
+    built are reported and skipped.
+
+    Usage:
+        python -m benchmarks.jwt_backends
+        python -m benchmarks.jwt_backends --number 50000 --repeat 5
+"""
+
+import argparse
+import time
+import timeit
+
+from app.utils.jwt_backends import JWT_BACKENDS, create_jwt_backend
+
+KEY = "benchmark-secret-key"
+CLAIMS = {"id": "admin@marloy.com", "email": "admin@marloy.com", "is_admin": True}
+
+def throughput(function, number: int, repeat: int) -> float:
+    """Return the best operations per second of `function` over `repeat` runs."""
+    best = min(timeit.repeat(function, number=number, repeat=repeat))
+    return number / best
+
+def main():
+    """Parse the command line and benchmark every available backend."""
+    parser = argparse.ArgumentParser(description="Compare JWT backend throughput.")
+    parser.add_argument("--number", type=int, default=20_000, help="Operations per run")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    args = parser.parse_args()
+
+    claims = {**CLAIMS, "exp": int(time.time()) + 3600}
+    print(f"{'backend':<8} {'encode/s':>12} {'decode/s':>12}")
+    for name in JWT_BACKENDS:
+        try:
+            backend = create_jwt_backend(name, KEY, "HS256")
+        except ImportError as err:
+            print(f"{name:<8} skipped ({err})")
+            continue
+
+        token = backend.encode(claims)
+        encode = throughput(lambda b=backend: b.encode(claims), args.number, args.repeat)
+        decode = throughput(lambda b=backend, t=token: b.decode(t), args.number, args.repeat)
+        print(f"{name:<8} {encode:>12,.0f} {decode:>12,.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,429 @@
+"""
+    Load test of the API routes against a running server.
+    Every scenario is a scripted sequence of requests (login, reads and a
+    create/update/delete cycle on each router, the four reports) run by `--concurrency`
+    workers for `--duration` seconds. Requests are grouped by route, for example
+    "GET /v1/clientes/{id}", and the report lists p50/p95/p99 latency and requests per
+    second per route.
+
+    Results can be stored as a baseline and later runs compared with it: a route whose
+    p95 grows, or whose RPS drops, by more than `--threshold` is reported as a
+    regression and the run exits with status 1, so it can gate changes to get_db or to
+    a report query. Baselines only compare runs on the same machine, data and settings.
+
+    Seed the database with scripts.datagen first, or pass --seed-data. Requires httpx.
+
+    Usage:
+        python -m benchmarks.load_test
+        python -m benchmarks.load_test --scenario clientes --scenario reportes
+        python -m benchmarks.load_test --duration 30 --concurrency 32 --save-baseline
+        python -m benchmarks.load_test --seed-data --threshold 0.15
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import statistics
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+import httpx
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines" / "load_test.json"
+
+CATALOGS = {
+    "proveedores": "id",
+    "insumos": "id",
+    "clientes": "id",
+    "maquinas": "id",
+    "tecnicos": "ci",
+}
+
+class Recorder:
+    """
+    Latencies and failures of the requests, grouped by route.
+    """
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.failures: Dict[str, int] = defaultdict(int)
+        # Seconds spent in the scenarios that sent requests of each route.
+        self.elapsed: Dict[str, float] = {}
+
+    def add(self, route: str, seconds: float, ok: bool):
+        """Record one request of `route`."""
+        self.latencies[route].append(seconds * 1000)
+        if not ok:
+            self.failures[route] += 1
+
+    def summary(self) -> Dict[str, dict]:
+        """Return count, failures, p50/p95/p99 (ms) and RPS of every route."""
+        routes = {}
+        for route, samples in sorted(self.latencies.items()):
+            if len(samples) > 1:
+                cuts = statistics.quantiles(samples, n=100, method="inclusive")
+                p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+            else:
+                p50 = p95 = p99 = samples[0]
+            routes[route] = {
+                "requests": len(samples),
+                "failures": self.failures[route],
+                "p50": round(p50, 2),
+                "p95": round(p95, 2),
+                "p99": round(p99, 2),
+                "rps": round(len(samples) / self.elapsed[route], 1),
+            }
+        return routes
+
+class Session:
+    """
+    HTTP client of one scenario, timing every request.
+
+    Args:
+        client (httpx.AsyncClient): Client bound to the server under test.
+        recorder (Recorder): Where the requests are recorded.
+        ids (dict[str, list]): Ids of existing rows, by router, to read and reference.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, recorder: Recorder, ids: Dict[str, list]):
+        self.client = client
+        self.recorder = recorder
+        self.ids = ids
+        self.rng = random.Random()
+        self.counter = itertools.count(int(time.time() * 1000) % 10**9)
+
+    async def call(self, method: str, route: str, url: str, expected=(200,), **kwargs):
+        """
+        Send a request, recording it under `route`; return the response or None.
+        """
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.recorder.add(route, time.perf_counter() - started, False)
+            return None
+        self.recorder.add(route, time.perf_counter() - started, response.status_code in expected)
+        return response
+
+    def pick(self, router: str):
+        """Return a random existing id of `router`."""
+        return self.rng.choice(self.ids[router])
+
+    def unique(self) -> int:
+        """Return a number not used by any other request of this run."""
+        return next(self.counter)
+
+def created_id(response, key: str = "id"):
+    """Return the id of the row created by `response`, or None if it failed."""
+    if response is None or response.status_code != 200:
+        return None
+    return response.json()["data"][key]
+
+def catalog_body(session: Session, router: str) -> dict:
+    """Return a valid create/update body for a catalog router."""
+    n = session.unique()
+    if router == "proveedores":
+        return {"nombre": f"Proveedor carga {n}", "contacto": f"carga{n}@proveedor.com"}
+    if router == "insumos":
+        return {
+            "descripcion": f"Insumo carga {n}",
+            "tipo": "Café",
+            "precio_unitario": 0.25,
+            "id_proveedor": session.pick("proveedores"),
+        }
+    if router == "clientes":
+        return {
+            "nombre": f"Cliente carga {n}",
+            "direccion": f"Calle {n}",
+            "telefono": "099000000",
+            "correo": f"carga{n}@cliente.com",
+        }
+    if router == "maquinas":
+        return {
+            "modelo": "CM-Pro 5000",
+            "id_cliente": session.pick("clientes"),
+            "ubicacion_cliente": f"Ubicación carga {n}",
+            "costo_alquiler_mensual": 150.0,
+        }
+    return {"ci": str(20_000_000 + n % 10**7), "nombre": "Carga", "apellido": "Test"}
+
+async def read_scenario(session: Session, router: str):
+    """List a page and read one row of a router."""
+    page = session.rng.randint(1, 5)
+    await session.call(
+        "GET", f"GET /v1/{router}/", f"/v1/{router}/", params={"page": page, "page_size": 100}
+    )
+    await session.call(
+        "GET", f"GET /v1/{router}/{{id}}", f"/v1/{router}/{session.pick(router)}",
+        expected=(200, 404)
+    )
+
+async def catalog_crud_scenario(session: Session, router: str):
+    """Create, read, update and delete a row of a catalog router."""
+    key = CATALOGS[router]
+    body = catalog_body(session, router)
+    row_id = created_id(
+        await session.call("POST", f"POST /v1/{router}/", f"/v1/{router}/", json=body), key
+    )
+    if row_id is None:
+        return
+    url = f"/v1/{router}/{row_id}"
+    await session.call("GET", f"GET /v1/{router}/{{id}}", url)
+    await session.call("PUT", f"PUT /v1/{router}/{{id}}", url, json=body)
+    await session.call("DELETE", f"DELETE /v1/{router}/{{id}}", url)
+
+async def registro_crud_scenario(session: Session):
+    """Create, read, update and delete a registro de consumo."""
+    body = {
+        "id_maquina": session.pick("maquinas"),
+        "id_insumo": session.pick("insumos"),
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "cantidad_usada": 12.5,
+    }
+    row_id = created_id(await session.call(
+        "POST", "POST /v1/registro-consumos/", "/v1/registro-consumos/", json=body
+    ))
+    if row_id is None:
+        return
+    url = f"/v1/registro-consumos/{row_id}"
+    body["cantidad_usada"] = 20.0
+    await session.call("GET", "GET /v1/registro-consumos/{id}", url)
+    await session.call("PUT", "PUT /v1/registro-consumos/{id}", url, json=body)
+    await session.call("DELETE", "DELETE /v1/registro-consumos/{id}", url)
+
+async def mantenimiento_crud_scenario(session: Session):
+    """Create, update and delete a mantenimiento, and read the ones of its maquina."""
+    n = session.unique()
+    body = {
+        "id_maquina": session.pick("maquinas"),
+        "ci_tecnico": str(session.pick("tecnicos")),
+        "tipo": "Preventivo",
+        # A distinct minute per request keeps (ci_tecnico, fecha) unique.
+        "fecha": datetime.fromtimestamp(n * 60).isoformat(),
+        "observaciones": "Carga",
+    }
+    row_id = created_id(
+        await session.call("POST", "POST /v1/mantenimientos/", "/v1/mantenimientos/", json=body)
+    )
+    if row_id is None:
+        return
+    url = f"/v1/mantenimientos/{row_id}"
+    params = {"mantenimiento_id": row_id}
+    await session.call(
+        "GET", "GET /v1/mantenimientos/{id_maquina}", f"/v1/mantenimientos/{body['id_maquina']}"
+    )
+    await session.call("PUT", "PUT /v1/mantenimientos/{id}", url, params=params, json=body)
+    await session.call("DELETE", "DELETE /v1/mantenimientos/{id}", url, params=params)
+
+async def users_scenario(session: Session):
+    """List users, then create, read, update and delete one."""
+    await session.call("GET", "GET /v1/users/", "/v1/users/", params={"page_size": 100})
+    correo = f"carga{session.unique()}@marloy.com"
+    body = {"correo": correo, "contraseña": "cargapass", "es_administrador": False}
+    if created_id(
+        await session.call("POST", "POST /v1/users/", "/v1/users/", json=body), "correo"
+    ) is None:
+        return
+    url = f"/v1/users/{correo}"
+    await session.call("GET", "GET /v1/users/{correo}", url)
+    await session.call("PUT", "PUT /v1/users/{correo}", url, json={"es_administrador": True})
+    await session.call("DELETE", "DELETE /v1/users/{correo}", url)
+
+async def reportes_scenario(session: Session):
+    """Request each of the four reports."""
+    today = datetime.now()
+    period = {"month": today.month, "year": today.year}
+    await session.call(
+        "GET", "GET /v1/reportes/clientes-mas-maquinas/", "/v1/reportes/clientes-mas-maquinas/"
+    )
+    await session.call(
+        "GET",
+        "GET /v1/reportes/facturacion-mensual/{cliente_id}",
+        f"/v1/reportes/facturacion-mensual/{session.pick('clientes')}",
+        expected=(200, 404),
+        params=period
+    )
+    await session.call(
+        "GET",
+        "GET /v1/reportes/insumos-mas-consumidos/",
+        "/v1/reportes/insumos-mas-consumidos/",
+        params=period
+    )
+    await session.call(
+        "GET",
+        "GET /v1/reportes/tecnicos-mas-mantenimientos/",
+        "/v1/reportes/tecnicos-mas-mantenimientos/"
+    )
+
+def build_scenarios(email: str, password: str) -> dict:
+    """Return the scenarios by name, each a coroutine function taking a Session."""
+
+    async def login(session: Session):
+        await session.call(
+            "POST", "POST /v1/auth/login/", "/v1/auth/login/",
+            json={"correo": email, "contraseña": password}
+        )
+
+    async def listados(session: Session):
+        for router in ("mantenimientos", "registro-consumos"):
+            await session.call(
+                "GET", f"GET /v1/{router}/", f"/v1/{router}/",
+                params={"page": session.rng.randint(1, 5), "page_size": 100}
+            )
+
+    scenarios = {"login": login, "listados": listados}
+    for router in CATALOGS:
+        scenarios[router] = (
+            lambda session, router=router: read_scenario(session, router)
+        )
+        scenarios[f"{router}-crud"] = (
+            lambda session, router=router: catalog_crud_scenario(session, router)
+        )
+    scenarios["registro-consumos-crud"] = registro_crud_scenario
+    scenarios["mantenimientos-crud"] = mantenimiento_crud_scenario
+    scenarios["users"] = users_scenario
+    scenarios["reportes"] = reportes_scenario
+    return scenarios
+
+async def run_scenario(scenario, session: Session, duration: float, concurrency: int) -> float:
+    """Run `scenario` with `concurrency` workers for `duration` seconds."""
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            await scenario(session)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started
+
+async def collect_ids(client: httpx.AsyncClient) -> Dict[str, list]:
+    """Read the ids of up to 100 rows of every catalog through the API."""
+    ids = {}
+    for router, key in CATALOGS.items():
+        response = await client.get(f"/v1/{router}/", params={"page_size": 100})
+        response.raise_for_status()
+        ids[router] = [row[key] for row in response.json()["data"]]
+        if not ids[router]:
+            raise RuntimeError(f"No {router} found; seed the database with scripts.datagen")
+    return ids
+
+async def run(args, names: List[str]) -> Dict[str, dict]:
+    """Log in, run the selected scenarios and return the per-route summary."""
+    recorder = Recorder()
+    async with httpx.AsyncClient(
+        base_url=args.base_url,
+        timeout=args.timeout,
+        limits=httpx.Limits(max_connections=args.concurrency)
+    ) as client:
+        response = await client.post(
+            "/v1/auth/login/", json={"correo": args.email, "contraseña": args.password}
+        )
+        response.raise_for_status()
+        client.headers["Authorization"] = f"Bearer {response.json()['data']['access_token']}"
+
+        session = Session(client, recorder, await collect_ids(client))
+        scenarios = build_scenarios(args.email, args.password)
+        for name in names:
+            before = {route: len(samples) for route, samples in recorder.latencies.items()}
+            elapsed = await run_scenario(
+                scenarios[name], session, args.duration, args.concurrency
+            )
+            for route, samples in recorder.latencies.items():
+                if len(samples) != before.get(route, 0):
+                    recorder.elapsed[route] = recorder.elapsed.get(route, 0.0) + elapsed
+            print(f"{name}: done in {elapsed:.1f}s", file=sys.stderr)
+    return recorder.summary()
+
+def compare(routes: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    """Return the regressions of `routes` against `baseline`."""
+    regressions = []
+    for route, result in routes.items():
+        base = baseline.get(route)
+        if base is None:
+            continue
+        if result["p95"] > base["p95"] * (1 + threshold):
+            regressions.append(f"{route}: p95 {base['p95']} -> {result['p95']} ms")
+        if result["rps"] < base["rps"] * (1 - threshold):
+            regressions.append(f"{route}: rps {base['rps']} -> {result['rps']}")
+    return regressions
+
+def print_report(routes: Dict[str, dict]):
+    """Print the per-route results as a table."""
+    print(
+        f"{'route':58} {'reqs':>7} {'fail':>5} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'p99 ms':>8} {'rps':>8}"
+    )
+    for route, result in routes.items():
+        print(
+            f"{route:58} {result['requests']:>7} {result['failures']:>5} "
+            f"{result['p50']:>8.2f} {result['p95']:>8.2f} {result['p99']:>8.2f} "
+            f"{result['rps']:>8.1f}"
+        )
+
+def main():
+    """Parse the command line, run the load test and compare it with the baseline."""
+    scenario_names = list(build_scenarios("", ""))
+    parser = argparse.ArgumentParser(description="Load test the API routes.")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--email", default="admin@marloy.com", help="Admin user to log in")
+    parser.add_argument("--password", default="adminpass")
+    parser.add_argument(
+        "--scenario", action="append", choices=scenario_names,
+        help="Scenario to run, can be repeated (default: all)"
+    )
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per scenario")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent workers")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Request timeout")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2,
+        help="Allowed relative p95 growth or RPS drop before failing (default: 0.2)"
+    )
+    parser.add_argument(
+        "--seed-data", action="store_true",
+        help="Populate the database with scripts.datagen (default volumes) first"
+    )
+    args = parser.parse_args()
+
+    if args.seed_data:
+        from scripts import datagen  # pylint: disable=import-outside-toplevel
+        datagen.generate(datagen.DEFAULT_VOLUMES)
+
+    routes = asyncio.run(run(args, args.scenario or scenario_names))
+    print_report(routes)
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(
+            {
+                "concurrency": args.concurrency,
+                "duration": args.duration,
+                "routes": routes,
+            },
+            indent=2
+        ) + "\n")
+        print(f"Baseline written to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print("No baseline to compare with; run with --save-baseline to create one.")
+        return
+    baseline = json.loads(args.baseline.read_text())
+    regressions = compare(routes, baseline["routes"], args.threshold)
+    if regressions:
+        print(f"Regressions over {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    print(f"No regressions over {args.threshold:.0%} against {args.baseline}")
+
+if __name__ == "__main__":
+    main()
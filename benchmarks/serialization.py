@@ -0,0 +1,106 @@
+"""
+    Benchmark of the list endpoint serialization paths on 100-row pages.
+    "models" reproduces the previous path: one Pydantic model per row, the envelope
+    model, then what FastAPI does with `response_model` (validate the returned object
+    against APIResponsePaginated[Model], dump it in JSON mode and json.dumps it).
+    "adapter" is app.utils.serialization.paginated_response, which validates the raw
+    rows once and encodes them in pydantic-core. Rows mimic what mysql-connector
+    returns, including Decimal and datetime columns.
+
+    Usage:
+        python -m benchmarks.serialization
+        python -m benchmarks.serialization --rows 100 --number 2000
+"""
+
+import argparse
+import json
+import timeit
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import List
+
+from pydantic import TypeAdapter
+
+from app.schemas.common import APIResponsePaginated
+from app.schemas.maquina import MaquinaBase
+from app.schemas.registro_consumo import RegistroConsumoBase
+from app.utils.serialization import paginated_response
+
+def maquina_rows(count: int) -> List[dict]:
+    """Return `count` rows shaped like SELECT * FROM maquinas."""
+    return [
+        {
+            "id": i,
+            "modelo": f"CM-Pro {i % 7}000",
+            "id_cliente": i % 40 + 1,
+            "ubicacion_cliente": f"Piso {i % 12}, sector {i % 5}",
+            "costo_alquiler_mensual": Decimal("150.00") + i,
+        }
+        for i in range(1, count + 1)
+    ]
+
+def consumo_rows(count: int) -> List[dict]:
+    """Return `count` rows shaped like SELECT * FROM registro_consumo."""
+    start = datetime(2025, 5, 1, 8)
+    return [
+        {
+            "id": i,
+            "id_maquina": i % 40 + 1,
+            "id_insumo": i % 9 + 1,
+            "fecha": start + timedelta(minutes=17 * i),
+            "cantidad_usada": Decimal("12.50") + i % 30,
+        }
+        for i in range(1, count + 1)
+    ]
+
+def models_path(model, adapter: TypeAdapter, rows: List[dict]) -> bytes:
+    """Serialize a page the way the endpoints did before the fast path."""
+    response = APIResponsePaginated(
+        success=True,
+        data=[model(**row) for row in rows],
+        total_items=1000,
+        page=1,
+        page_size=len(rows),
+        total_pages=10
+    )
+    content = adapter.dump_python(adapter.validate_python(response), mode="json")
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+def adapter_path(model, rows: List[dict]) -> bytes:
+    """Serialize a page with paginated_response."""
+    return paginated_response(
+        model,
+        rows,
+        total_items=1000,
+        page=1,
+        page_size=len(rows),
+        total_pages=10
+    ).body
+
+def main():
+    """Parse the command line and time both paths for each table."""
+    parser = argparse.ArgumentParser(description="Compare list serialization paths.")
+    parser.add_argument("--rows", type=int, default=100, help="Rows per page")
+    parser.add_argument("--number", type=int, default=1000, help="Pages per run")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    args = parser.parse_args()
+
+    cases = [
+        ("maquinas", MaquinaBase, maquina_rows(args.rows)),
+        ("registro_consumo", RegistroConsumoBase, consumo_rows(args.rows)),
+    ]
+    print(f"{'table':<18} {'models us/page':>15} {'adapter us/page':>16} {'saving':>8}")
+    for name, model, rows in cases:
+        adapter = TypeAdapter(APIResponsePaginated[model])
+        before = min(timeit.repeat(
+            lambda m=model, a=adapter, r=rows: models_path(m, a, r),
+            number=args.number, repeat=args.repeat
+        )) / args.number * 1e6
+        after = min(timeit.repeat(
+            lambda m=model, r=rows: adapter_path(m, r),
+            number=args.number, repeat=args.repeat
+        )) / args.number * 1e6
+        print(f"{name:<18} {before:>15.1f} {after:>16.1f} {1 - after / before:>8.0%}")
+
+if __name__ == "__main__":
+    main()
@@ -66,6 +66,23 @@ CREATE TABLE IF NOT EXISTS registro_consumo (
     fecha DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP, -- Los consumos deben registrarse con fecha para facturación
     cantidad_usada DECIMAL(10, 2) NOT NULL,
     FOREIGN KEY (id_maquina) REFERENCES maquinas(id),
+    FOREIGN KEY (id_insumo) REFERENCES insumos(id),
+    INDEX idx_registro_consumo_maquina_fecha (id_maquina, fecha),
+    INDEX idx_registro_consumo_insumo_fecha (id_insumo, fecha),
+    INDEX idx_registro_consumo_fecha (fecha)
+);
+
+-- Resumen mensual de consumos por máquina e insumo, usado por el reporte de facturación
+-- Se mantiene incrementalmente desde la API; scripts/rebuild_consumo_mensual.py lo recalcula
+CREATE TABLE IF NOT EXISTS consumo_mensual (
+    anio SMALLINT NOT NULL,
+    mes TINYINT NOT NULL,
+    id_maquina INT NOT NULL,
+    id_insumo INT NOT NULL,
+    cantidad_total DECIMAL(16, 2) NOT NULL DEFAULT 0,
+    registros INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (anio, mes, id_maquina, id_insumo),
+    FOREIGN KEY (id_maquina) REFERENCES maquinas(id),
     FOREIGN KEY (id_insumo) REFERENCES insumos(id)
 );
 
@@ -88,9 +105,21 @@ CREATE TABLE IF NOT EXISTS mantenimientos (
     observaciones TEXT,
     FOREIGN KEY (id_maquina) REFERENCES maquinas(id),
     FOREIGN KEY (ci_tecnico) REFERENCES tecnicos(ci),
-    UNIQUE (ci_tecnico, fecha)
+    UNIQUE (ci_tecnico, fecha),
+    INDEX idx_mantenimientos_fecha (fecha)
 );
 
+-- Migraciones aplicadas sobre el esquema (ver scripts/migrate.py)
+-- Este script ya incluye los cambios de las migraciones listadas
+CREATE TABLE IF NOT EXISTS schema_migrations (
+    version VARCHAR(255) PRIMARY KEY,
+    aplicada DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO schema_migrations (version) VALUES
+('0001_consumo_mensual'),
+('0002_indices_consumo');
+
 -- 3. Datos Maestros (Datos de ejemplo para poblar las tablas)
 -- -----------------------------------------------------------
 
@@ -145,6 +174,12 @@ INSERT INTO registro_consumo (id_maquina, id_insumo, fecha, cantidad_usada) VALU
 (3, 2, '2025-05-01 14:00:00', 100),
 (3, 5, '2025-05-03 08:15:00', 80);
 
+-- Resumen mensual de los consumos de ejemplo
+INSERT INTO consumo_mensual (anio, mes, id_maquina, id_insumo, cantidad_total, registros)
+SELECT YEAR(fecha), MONTH(fecha), id_maquina, id_insumo, SUM(cantidad_usada), COUNT(*)
+FROM registro_consumo
+GROUP BY YEAR(fecha), MONTH(fecha), id_maquina, id_insumo;
+
 -- Mantenimientos (ejemplos)
 INSERT INTO mantenimientos (id_maquina, ci_tecnico, tipo, fecha, observaciones) VALUES
 (1, '1234567-8', 'Preventivo', '2025-05-10 10:00:00', 'Limpieza general y revisión de filtros.'),
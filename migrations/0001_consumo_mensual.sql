@@ -0,0 +1,29 @@
+-- Resumen mensual de consumos por máquina e insumo (reporte de facturación)
+CREATE TABLE IF NOT EXISTS consumo_mensual (
+    anio SMALLINT NOT NULL,
+    mes TINYINT NOT NULL,
+    id_maquina INT NOT NULL,
+    id_insumo INT NOT NULL,
+    cantidad_total DECIMAL(16, 2) NOT NULL DEFAULT 0,
+    registros INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (anio, mes, id_maquina, id_insumo),
+    FOREIGN KEY (id_maquina) REFERENCES maquinas(id),
+    FOREIGN KEY (id_insumo) REFERENCES insumos(id)
+);
+
+-- Carga inicial a partir de los consumos existentes
+INSERT INTO consumo_mensual (anio, mes, id_maquina, id_insumo, cantidad_total, registros)
+SELECT * FROM (
+    SELECT
+        YEAR(fecha) AS anio,
+        MONTH(fecha) AS mes,
+        id_maquina,
+        id_insumo,
+        SUM(cantidad_usada) AS cantidad_total,
+        COUNT(*) AS registros
+    FROM registro_consumo
+    GROUP BY YEAR(fecha), MONTH(fecha), id_maquina, id_insumo
+) AS nuevo
+ON DUPLICATE KEY UPDATE
+    cantidad_total = nuevo.cantidad_total,
+    registros = nuevo.registros;
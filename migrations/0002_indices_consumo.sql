@@ -0,0 +1,5 @@
+-- Índices para filtrar consumos y mantenimientos por rangos de fecha
+CREATE INDEX idx_registro_consumo_maquina_fecha ON registro_consumo (id_maquina, fecha);
+CREATE INDEX idx_registro_consumo_insumo_fecha ON registro_consumo (id_insumo, fecha);
+CREATE INDEX idx_registro_consumo_fecha ON registro_consumo (fecha);
+CREATE INDEX idx_mantenimientos_fecha ON mantenimientos (fecha);
@@ -0,0 +1,104 @@
+"""
+    Check with EXPLAIN that the consumption queries use their indexes.
+    Each check runs EXPLAIN on a query shaped like the ones issued by the reports and
+    fails when MySQL would not use one of the expected indexes. On tables with only a
+    few rows the optimizer may prefer a full scan, so there it is enough for the index
+    to be listed in possible_keys; run it on data from scripts.datagen for a meaningful result.
+
+    Usage:
+        python -m scripts.check_indexes
+"""
+
+import sys
+from datetime import datetime
+
+from app.database import get_database_connection
+from app.utils.periodos import month_range
+
+SMALL_TABLE_ROWS = 1000
+
+CHECKS = [
+    (
+        "registro_consumo by fecha range",
+        """
+            SELECT id_maquina, id_insumo, SUM(cantidad_usada)
+            FROM registro_consumo
+            WHERE fecha >= %(start)s AND fecha < %(end)s
+            GROUP BY id_maquina, id_insumo
+        """,
+        "registro_consumo",
+        {"idx_registro_consumo_fecha"},
+    ),
+    (
+        "registro_consumo by maquina and fecha range",
+        """
+            SELECT * FROM registro_consumo
+            WHERE id_maquina = %(id)s AND fecha >= %(start)s AND fecha < %(end)s
+        """,
+        "registro_consumo",
+        {"idx_registro_consumo_maquina_fecha"},
+    ),
+    (
+        "registro_consumo by insumo and fecha range",
+        """
+            SELECT * FROM registro_consumo
+            WHERE id_insumo = %(id)s AND fecha >= %(start)s AND fecha < %(end)s
+        """,
+        "registro_consumo",
+        {"idx_registro_consumo_insumo_fecha"},
+    ),
+    (
+        "consumo_mensual by month",
+        """
+            SELECT id_maquina, SUM(cantidad_total)
+            FROM consumo_mensual
+            WHERE anio = %(year)s AND mes = %(month)s
+            GROUP BY id_maquina
+        """,
+        "consumo_mensual",
+        {"PRIMARY"},
+    ),
+]
+
+def check(cursor, spec, params) -> bool:
+    """Run EXPLAIN for one query and report whether it uses an expected index."""
+    name, query, table, expected = spec
+    cursor.execute(f"EXPLAIN {query}", params)
+    plan = [row for row in cursor.fetchall() if row['table'] == table]
+    if not plan:
+        print(f"FAIL {name}: {table} not found in the plan")
+        return False
+
+    row = plan[0]
+    possible = set((row['possible_keys'] or "").split(","))
+    if row['key'] in expected:
+        print(f"ok   {name}: {row['key']} ({row['type']})")
+        return True
+    if (row['rows'] or 0) < SMALL_TABLE_ROWS and expected & possible:
+        print(f"ok   {name}: {row['key'] or 'full scan'} on a small table, "
+              f"possible keys {sorted(possible)}")
+        return True
+
+    print(f"FAIL {name}: uses {row['key'] or 'no index'} ({row['type']}), "
+          f"expected one of {sorted(expected)}")
+    return False
+
+def main():
+    """Run every check and exit with status 1 if any of them fails."""
+    connection = get_database_connection()
+    cursor = connection.cursor(dictionary=True)
+    try:
+        cursor.execute("SELECT MAX(fecha) AS fecha FROM registro_consumo")
+        latest = cursor.fetchone()['fecha'] or datetime.now()
+        start, end = month_range(latest.year, latest.month)
+        params = {"start": start, "end": end, "year": latest.year, "month": latest.month, "id": 1}
+
+        results = [check(cursor, spec, params) for spec in CHECKS]
+    finally:
+        cursor.close()
+        connection.close()
+
+    sys.exit(0 if all(results) else 1)
+
+if __name__ == "__main__":
+    main()
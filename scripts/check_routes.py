@@ -0,0 +1,37 @@
+"""
+    Check that every API route gets its own route label.
+    The request metrics and the server spans are keyed by method and route template.
+    Each route of the application is resolved the way the middleware resolves the
+    matched route of a request, and the check fails when routes of two endpoints would
+    share a label, which would merge their latency and database time series.
+
+    Usage:
+        python -m scripts.check_routes
+"""
+
+import sys
+
+from app.main import app
+from app.utils.metrics import registered_routes, route_template
+
+def main():
+    """Report the labels shared by several endpoints and exit with status 1 if any is."""
+    routes = [route for route, _ in registered_routes()]
+    routes += [route for route in app.routes if hasattr(route, "endpoint")]
+
+    labels = {}
+    for route in routes:
+        template = route_template({"route": route})
+        for method in getattr(route, "methods", None) or ():
+            endpoint = f"{route.endpoint.__module__}.{route.endpoint.__qualname__}"
+            labels.setdefault((method, template), set()).add(endpoint)
+
+    shared = {label: endpoints for label, endpoints in labels.items() if len(endpoints) > 1}
+    for (method, template), endpoints in sorted(shared.items()):
+        print(f"FAIL {method} {template}: shared by {', '.join(sorted(endpoints))}")
+    print(f"{len(labels)} route labels, {len(shared)} shared")
+
+    sys.exit(1 if shared else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,409 @@
+"""
+    Populate the database with synthetic data for benchmarks and EXPLAIN checks.
+    Rows are added on top of the existing ones. Values come from a seeded random
+    generator and dates cover the last `--days` days, so two runs with the same
+    arguments produce the same data relative to the current date. The consumo_mensual
+    rollup is rebuilt afterwards.
+
+    Data follows the shape of production: a few maquinas and insumos account for most
+    of the consumption, which rises in winter and drops in January, on weekends and
+    outside office hours. Every maquina gets a preventive mantenimiento about once a
+    month plus occasional correctives, assigned so that no tecnico has two
+    mantenimientos at the same time (UNIQUE (ci_tecnico, fecha)).
+
+    Rows are generated in batches and each batch is committed, so memory stays flat
+    at any volume. The "insert" method sends multi-row INSERT statements; the much
+    faster "load-data" method streams every batch through LOAD DATA LOCAL INFILE with
+    foreign key and unique checks disabled for the session, and needs local_infile
+    enabled on the server.
+
+    Usage:
+        python -m scripts.datagen
+        python -m scripts.datagen --clientes 500 --maquinas 2000 --registros 200000
+        python -m scripts.datagen --profile production --method load-data
+"""
+
+import argparse
+import csv
+import itertools
+import os
+import random
+import tempfile
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Dict, List, Tuple
+
+import mysql.connector
+
+from app.config import settings
+from app.database import get_database_connection
+from scripts.rebuild_consumo_mensual import months_with_data, rebuild_month
+
+PROFILES = {
+    "small": {
+        "proveedores": 20,
+        "insumos": 60,
+        "clientes": 200,
+        "maquinas": 1_000,
+        "tecnicos": 50,
+        "registros": 100_000,
+    },
+    "production": {
+        "proveedores": 200,
+        "insumos": 1_000,
+        "clientes": 10_000,
+        "maquinas": 100_000,
+        "tecnicos": 500,
+        "registros": 100_000_000,
+    },
+}
+DEFAULT_VOLUMES = PROFILES["small"]
+
+DEPENDENCIES = [
+    ("insumos", "proveedores"),
+    ("maquinas", "clientes"),
+    ("registros", "maquinas"),
+    ("registros", "insumos"),
+]
+
+MODELOS = ["CM-Pro 3000", "CM-Pro 5000", "CM-Pro 6000", "Barista X2", "Barista X4"]
+TIPOS_INSUMO = ["Café", "Lácteo", "Saborizante", "Endulzante", "Descartable"]
+NOMBRES = ["Ana", "Bruno", "Carla", "Diego", "Elena", "Facundo", "Gabriela", "Hugo"]
+APELLIDOS = ["Pérez", "González", "Rodríguez", "Fernández", "López", "Martínez", "Silva"]
+
+# Relative consumption by month (January is summer holidays), weekday and hour.
+MONTH_FACTORS = [0.7, 0.8, 1.0, 1.0, 1.1, 1.25, 1.3, 1.25, 1.1, 1.0, 0.95, 0.85]
+WEEKDAY_FACTORS = [1.0, 1.05, 1.05, 1.0, 0.95, 0.35, 0.2]
+HOUR_WEIGHTS = [0, 0, 0, 0, 0, 0, 1, 4, 10, 9, 7, 6, 5, 6, 7, 8, 6, 4, 2, 1, 1, 0, 0, 0]
+
+PREVENTIVE_EVERY_DAYS = 30
+CORRECTIVE_PROBABILITY = 0.004
+WORK_HOURS = range(8, 18)
+
+def calendar(days: int) -> Tuple[List[date], List[float]]:
+    """Return the last `days` days and their cumulative seasonal weights."""
+    first = date.today() - timedelta(days=days)
+    dates = [first + timedelta(days=offset) for offset in range(days)]
+    weights = (MONTH_FACTORS[day.month - 1] * WEEKDAY_FACTORS[day.weekday()] for day in dates)
+    return dates, list(itertools.accumulate(weights))
+
+def skewed_weights(rng: random.Random, count: int) -> List[float]:
+    """Return cumulative Pareto weights, so a few items are picked most of the time."""
+    return list(itertools.accumulate(rng.paretovariate(1.2) for _ in range(count)))
+
+def batched(rows, batch_size: int):
+    """Group an iterable of rows into lists of at most `batch_size` rows."""
+    iterator = iter(rows)
+    while batch := list(itertools.islice(iterator, batch_size)):
+        yield batch
+
+def insert_rows(connection, table: str, columns: Tuple[str, ...], batches) -> int:
+    """Insert every batch with a multi-row INSERT, committing each one."""
+    query = (
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join(['%s'] * len(columns))})"
+    )
+    cursor = connection.cursor()
+    written = 0
+    try:
+        for batch in batches:
+            cursor.executemany(query, batch)
+            connection.commit()
+            written += len(batch)
+        return written
+    finally:
+        cursor.close()
+
+def _csv_value(value):
+    return "\\N" if value is None else value
+
+def load_rows(connection, table: str, columns: Tuple[str, ...], batches) -> int:
+    """Load every batch with LOAD DATA LOCAL INFILE, committing each one."""
+    query = f"""
+        LOAD DATA LOCAL INFILE %s INTO TABLE {table}
+        CHARACTER SET utf8mb4
+        FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '"'
+        LINES TERMINATED BY '\\n'
+        ({', '.join(columns)})
+    """
+    cursor = connection.cursor()
+    written = 0
+    handle, path = tempfile.mkstemp(suffix=".csv")
+    os.close(handle)
+    try:
+        for batch in batches:
+            with open(path, "w", newline="", encoding="utf-8") as file:
+                writer = csv.writer(file, lineterminator="\n")
+                writer.writerows([_csv_value(value) for value in row] for row in batch)
+            cursor.execute(query, (path,))
+            connection.commit()
+            written += len(batch)
+        return written
+    finally:
+        cursor.close()
+        os.remove(path)
+
+LOADERS = {"insert": insert_rows, "load-data": load_rows}
+
+def connect(method: str):
+    """Return a connection suited to `method`."""
+    if method == "insert":
+        return get_database_connection()
+    connection = mysql.connector.connect(
+        host=settings.DATABASE_HOST,
+        user=settings.DATABASE_USER,
+        password=settings.DATABASE_PASSWORD,
+        database=settings.DATABASE_NAME,
+        charset="utf8mb4",
+        collation="utf8mb4_unicode_ci",
+        allow_local_infile=True
+    )
+    cursor = connection.cursor()
+    cursor.execute("SET SESSION foreign_key_checks = 0, unique_checks = 0")
+    cursor.close()
+    return connection
+
+def scalar(connection, query: str, params: tuple = ()):
+    """Return the first column of the first row of `query`."""
+    cursor = connection.cursor()
+    try:
+        cursor.execute(query, params)
+        return cursor.fetchone()[0]
+    finally:
+        cursor.close()
+
+def column(connection, query: str, params: tuple = ()) -> list:
+    """Return the first column of every row of `query`."""
+    cursor = connection.cursor()
+    try:
+        cursor.execute(query, params)
+        return [row[0] for row in cursor.fetchall()]
+    finally:
+        cursor.close()
+
+def max_id(connection, table: str) -> int:
+    """Return the highest id of `table`, 0 when it is empty."""
+    return scalar(connection, f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+
+class Generator:
+    """
+    Synthetic rows of every table, written with one of the LOADERS.
+
+    Args:
+        connection: Connection the rows are written to.
+        method (str): Key of LOADERS, "insert" or "load-data".
+        seed (int): Seed of the random generator.
+        batch_size (int): Rows per statement and per transaction.
+    """
+
+    def __init__(self, connection, method: str, seed: int, batch_size: int):
+        self.connection = connection
+        self.load = LOADERS[method]
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+
+    def write(self, table: str, columns: Tuple[str, ...], rows) -> int:
+        """Write the rows of an iterable in batches and return how many were written."""
+        return self.load(self.connection, table, columns, batched(rows, self.batch_size))
+
+    def proveedores(self, count: int) -> List[int]:
+        """Add `count` proveedores and return their ids."""
+        offset = max_id(self.connection, "proveedores")
+        self.write("proveedores", ("nombre", "contacto"), (
+            (f"Proveedor {offset + i}", f"ventas{offset + i}@proveedor.com")
+            for i in range(1, count + 1)
+        ))
+        return column(self.connection, "SELECT id FROM proveedores WHERE id > %s", (offset,))
+
+    def insumos(self, count: int, proveedores: List[int]) -> List[int]:
+        """Add `count` insumos and return their ids."""
+        rng = self.rng
+        offset = max_id(self.connection, "insumos")
+        self.write("insumos", ("descripcion", "tipo", "precio_unitario", "id_proveedor"), (
+            (
+                f"Insumo {offset + i}",
+                rng.choice(TIPOS_INSUMO),
+                Decimal(rng.randint(1, 60)) / 100,
+                rng.choice(proveedores)
+            )
+            for i in range(1, count + 1)
+        ))
+        return column(self.connection, "SELECT id FROM insumos WHERE id > %s", (offset,))
+
+    def clientes(self, count: int) -> List[int]:
+        """Add `count` clientes and return their ids."""
+        rng = self.rng
+        offset = max_id(self.connection, "clientes")
+        self.write("clientes", ("nombre", "direccion", "telefono", "correo"), (
+            (
+                f"Cliente {offset + i}",
+                f"Calle {rng.randint(1, 3000)} {rng.randint(100, 9999)}, Montevideo",
+                f"09{rng.randint(1000000, 9999999)}",
+                f"cliente{offset + i}@example.com"
+            )
+            for i in range(1, count + 1)
+        ))
+        return column(self.connection, "SELECT id FROM clientes WHERE id > %s", (offset,))
+
+    def maquinas(self, count: int, clientes: List[int]) -> List[int]:
+        """Add `count` maquinas, more of them at the larger clientes, and return their ids."""
+        rng = self.rng
+        offset = max_id(self.connection, "maquinas")
+        weights = skewed_weights(rng, len(clientes))
+        columns = ("modelo", "id_cliente", "ubicacion_cliente", "costo_alquiler_mensual")
+        self.write("maquinas", columns, (
+            (
+                rng.choice(MODELOS),
+                rng.choices(clientes, cum_weights=weights)[0],
+                f"Ubicación {offset + i}",
+                Decimal(rng.randint(100, 400))
+            )
+            for i in range(1, count + 1)
+        ))
+        return column(self.connection, "SELECT id FROM maquinas WHERE id > %s", (offset,))
+
+    def tecnicos(self, count: int) -> List[str]:
+        """Add `count` tecnicos and return their CIs."""
+        rng = self.rng
+        last_ci = scalar(
+            self.connection, "SELECT COALESCE(MAX(CAST(ci AS UNSIGNED)), 0) FROM tecnicos"
+        )
+        tecnicos = [str(max(10_000_000, last_ci + 1) + i) for i in range(count)]
+        self.write("tecnicos", ("ci", "nombre", "apellido", "telefono"), (
+            (ci, rng.choice(NOMBRES), rng.choice(APELLIDOS), f"09{rng.randint(1000000, 9999999)}")
+            for ci in tecnicos
+        ))
+        return tecnicos
+
+    def mantenimientos(self, maquinas: List[int], tecnicos: List[str], days: int) -> int:
+        """
+        Add the mantenimiento history of every maquina and return how many were written.
+        Each tecnico takes one mantenimiento per working hour; when the hour drawn for
+        a mantenimiento is taken, the next free (tecnico, hour) slot of the day is used.
+        """
+        rng = self.rng
+        first = datetime.combine(date.today() - timedelta(days=days), time())
+        slots_per_day = len(tecnicos) * len(WORK_HOURS)
+        taken = bytearray(days * slots_per_day)
+
+        def slot(day: int) -> Tuple[str, datetime]:
+            start = rng.randrange(slots_per_day)
+            for offset in range(slots_per_day):
+                index = (start + offset) % slots_per_day
+                if not taken[day * slots_per_day + index]:
+                    taken[day * slots_per_day + index] = 1
+                    tecnico, hour = divmod(index, len(WORK_HOURS))
+                    return tecnicos[tecnico], first + timedelta(days=day, hours=WORK_HOURS[hour])
+            raise RuntimeError("Not enough tecnicos for the mantenimientos of a single day")
+
+        def rows():
+            for maquina in maquinas:
+                day = rng.randrange(PREVENTIVE_EVERY_DAYS)
+                while day < days:
+                    yield (maquina, *slot(day), "Preventivo", None)
+                    day += rng.randint(PREVENTIVE_EVERY_DAYS - 5, PREVENTIVE_EVERY_DAYS + 5)
+                for day in range(days):
+                    if rng.random() < CORRECTIVE_PROBABILITY:
+                        yield (maquina, *slot(day), "Correctivo", "Falla reportada por el cliente")
+
+        columns = ("id_maquina", "ci_tecnico", "fecha", "tipo", "observaciones")
+        return self.write("mantenimientos", columns, rows())
+
+    def registros(self, count: int, maquinas: List[int], insumos: List[int], days: int) -> int:
+        """Add `count` registros de consumo with seasonal dates and skewed usage."""
+        rng = self.rng
+        dates, day_weights = calendar(days)
+        maquina_weights = skewed_weights(rng, len(maquinas))
+        insumo_weights = skewed_weights(rng, len(insumos))
+
+        def rows():
+            for start in range(0, count, self.batch_size):
+                size = min(self.batch_size, count - start)
+                chosen_days = rng.choices(dates, cum_weights=day_weights, k=size)
+                hours = rng.choices(range(24), weights=HOUR_WEIGHTS, k=size)
+                chosen_maquinas = rng.choices(maquinas, cum_weights=maquina_weights, k=size)
+                chosen_insumos = rng.choices(insumos, cum_weights=insumo_weights, k=size)
+                for i in range(size):
+                    yield (
+                        chosen_maquinas[i],
+                        chosen_insumos[i],
+                        datetime.combine(chosen_days[i], time(hours[i], rng.randrange(60))),
+                        Decimal(rng.randint(100, 20000)) / 100
+                    )
+
+        columns = ("id_maquina", "id_insumo", "fecha", "cantidad_usada")
+        return self.write("registro_consumo", columns, rows())
+
+def populate(generator: Generator, volumes: Dict[str, int], days: int) -> Dict[str, int]:
+    """
+    Add the rows described by `volumes` (see PROFILES) and return the counts.
+    """
+    proveedores = generator.proveedores(volumes["proveedores"])
+    insumos = generator.insumos(volumes["insumos"], proveedores) if proveedores else []
+    clientes = generator.clientes(volumes["clientes"])
+    maquinas = generator.maquinas(volumes["maquinas"], clientes) if clientes else []
+    tecnicos = generator.tecnicos(volumes["tecnicos"])
+    written = {
+        "proveedores": len(proveedores),
+        "insumos": len(insumos),
+        "clientes": len(clientes),
+        "maquinas": len(maquinas),
+        "tecnicos": len(tecnicos),
+    }
+    written["mantenimientos"] = (
+        generator.mantenimientos(maquinas, tecnicos, days) if maquinas and tecnicos else 0
+    )
+    written["registros"] = (
+        generator.registros(volumes["registros"], maquinas, insumos, days)
+        if maquinas and insumos else 0
+    )
+    return written
+
+def generate(volumes: Dict[str, int], method: str = "insert", seed: int = 42, **options):
+    """
+    Populate the configured database and rebuild the consumo_mensual rollup.
+    `options` are batch_size (default 5000) and days (default 365).
+    """
+    connection = connect(method)
+    try:
+        generator = Generator(connection, method, seed, options.get("batch_size", 5_000))
+        written = populate(generator, volumes, options.get("days", 365))
+        for table, count in written.items():
+            print(f"{table}: {count} rows")
+
+        cursor = connection.cursor(dictionary=True)
+        months = months_with_data(cursor, None)
+        cursor.close()
+        for year, month in months:
+            rebuild_month(connection, year, month)
+        print(f"consumo_mensual: {len(months)} months rebuilt")
+    finally:
+        connection.close()
+
+def main():
+    """Parse the command line, populate the database and rebuild the rollup."""
+    parser = argparse.ArgumentParser(description="Populate the database with synthetic data.")
+    parser.add_argument(
+        "--profile", choices=PROFILES, default="small",
+        help="Default volumes: small, or production (10k clientes, 100M registros)"
+    )
+    for table in DEFAULT_VOLUMES:
+        parser.add_argument(f"--{table}", type=int, help=f"Rows of {table}")
+    parser.add_argument("--method", choices=LOADERS, default="insert", help="Bulk load method")
+    parser.add_argument("--days", type=int, default=365, help="Days of history")
+    parser.add_argument("--seed", type=int, default=42, help="Seed of the random generator")
+    parser.add_argument("--batch-size", type=int, default=5_000, help="Rows per statement")
+    args = parser.parse_args()
+
+    volumes = {
+        table: count if getattr(args, table) is None else getattr(args, table)
+        for table, count in PROFILES[args.profile].items()
+    }
+    for child, parent in DEPENDENCIES:
+        if volumes[child] and volumes[parent] < 1:
+            parser.error(f"--{child} requires at least one row of {parent}")
+
+    generate(volumes, args.method, args.seed, batch_size=args.batch_size, days=args.days)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+    Apply the pending schema migrations in migrations/ to the configured database.
+    Applied versions are recorded in the schema_migrations table; databases created
+    from init.sql already list the migrations it includes.
+
+    Usage:
+        python -m scripts.migrate            # apply pending migrations
+        python -m scripts.migrate --list     # show applied and pending migrations
+"""
+
+import argparse
+from pathlib import Path
+from typing import List, Set
+
+from app.database import get_database_connection
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "migrations"
+
+def split_statements(sql: str) -> List[str]:
+    """Split a migration file into statements, dropping `--` comment lines."""
+    lines = [line for line in sql.splitlines() if not line.strip().startswith("--")]
+    statements = "\n".join(lines).split(";")
+    return [statement.strip() for statement in statements if statement.strip()]
+
+def applied_versions(cursor) -> Set[str]:
+    """Return the versions already recorded in schema_migrations."""
+    cursor.execute(
+        """
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version VARCHAR(255) PRIMARY KEY,
+                aplicada DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+        """
+    )
+    cursor.execute("SELECT version FROM schema_migrations")
+    return {row[0] for row in cursor.fetchall()}
+
+def main():
+    """Parse the command line and apply or list the migrations."""
+    parser = argparse.ArgumentParser(description="Apply pending schema migrations.")
+    parser.add_argument("--list", action="store_true", help="Only list migrations")
+    args = parser.parse_args()
+
+    migrations = sorted(MIGRATIONS_DIR.glob("*.sql"))
+    connection = get_database_connection()
+    cursor = connection.cursor()
+    try:
+        applied = applied_versions(cursor)
+        for path in migrations:
+            version = path.stem
+            if version in applied:
+                print(f"applied  {version}")
+                continue
+            if args.list:
+                print(f"pending  {version}")
+                continue
+
+            print(f"applying {version}")
+            for statement in split_statements(path.read_text(encoding="utf-8")):
+                cursor.execute(statement)
+            cursor.execute("INSERT INTO schema_migrations (version) VALUES (%s)", (version,))
+            connection.commit()
+    finally:
+        cursor.close()
+        connection.close()
+
+if __name__ == "__main__":
+    main()
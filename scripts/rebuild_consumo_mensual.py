@@ -0,0 +1,90 @@
+"""
+    Rebuild the consumo_mensual rollup table from registro_consumo.
+    Use it to backfill the rollup after loading registros de consumo outside the API,
+    or to repair it. Each month is rebuilt in its own transaction.
+
+    Usage:
+        python -m scripts.rebuild_consumo_mensual                 # every month with data
+        python -m scripts.rebuild_consumo_mensual --year 2025     # every month of 2025
+        python -m scripts.rebuild_consumo_mensual --year 2025 --month 5
+"""
+
+import argparse
+from typing import List, Optional, Tuple
+
+from app.database import get_database_connection
+from app.utils.periodos import month_range, next_month
+
+def months_with_data(cursor, year: Optional[int]) -> List[Tuple[int, int]]:
+    """Return every (year, month) between the first and last registro de consumo."""
+    cursor.execute("SELECT MIN(fecha) AS desde, MAX(fecha) AS hasta FROM registro_consumo")
+    row = cursor.fetchone()
+    if not row or row['desde'] is None:
+        return []
+
+    current = (row['desde'].year, row['desde'].month)
+    last = (row['hasta'].year, row['hasta'].month)
+    months = []
+    while current <= last:
+        if year is None or current[0] == year:
+            months.append(current)
+        current = next_month(*current)
+    return months
+
+def rebuild_month(connection, year: int, month: int) -> int:
+    """Replace the rollup rows of one month and return how many were written."""
+    start, end = month_range(year, month)
+
+    cursor = connection.cursor()
+    try:
+        cursor.execute(
+            "DELETE FROM consumo_mensual WHERE anio = %s AND mes = %s",
+            (year, month)
+        )
+        cursor.execute(
+            """
+                INSERT INTO consumo_mensual
+                    (anio, mes, id_maquina, id_insumo, cantidad_total, registros)
+                SELECT %s, %s, id_maquina, id_insumo, SUM(cantidad_usada), COUNT(*)
+                FROM registro_consumo
+                WHERE fecha >= %s AND fecha < %s
+                GROUP BY id_maquina, id_insumo
+            """,
+            (year, month, start, end)
+        )
+        written = cursor.rowcount
+        connection.commit()
+        return written
+    except Exception:
+        connection.rollback()
+        raise
+    finally:
+        cursor.close()
+
+def main():
+    """Parse the command line and rebuild the requested months."""
+    parser = argparse.ArgumentParser(description="Rebuild the consumo_mensual rollup table.")
+    parser.add_argument("--year", type=int, help="Only rebuild this year")
+    parser.add_argument("--month", type=int, choices=range(1, 13), help="Only rebuild this month")
+    args = parser.parse_args()
+
+    if args.month and not args.year:
+        parser.error("--month requires --year")
+
+    connection = get_database_connection()
+    try:
+        if args.month:
+            months = [(args.year, args.month)]
+        else:
+            cursor = connection.cursor(dictionary=True)
+            months = months_with_data(cursor, args.year)
+            cursor.close()
+
+        for year, month in months:
+            written = rebuild_month(connection, year, month)
+            print(f"{year}-{month:02d}: {written} rollup rows")
+    finally:
+        connection.close()
+
+if __name__ == "__main__":
+    main()